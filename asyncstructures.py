@@ -0,0 +1,447 @@
+"""
+Asyncio Adapters for the Queue and Stack
+
+This module provides awaitable versions of the Queue and Stack for code that
+runs on an asyncio event loop. Each adapter wraps an ordinary Queue or Stack
+and uses it as its storage engine, so elements live in the same ring buffer
+or list as in the synchronous classes. What the adapters add is waiting:
+consumers await an element instead of polling, and producers await free
+space when a capacity is set (backpressure).
+
+    queue = AsyncQueue(maxsize=100)
+    await queue.put("task")
+    task = await queue.get()
+    async for task in queue:      # ends once the queue is closed and drained
+        ...
+
+Waiting is cancellation-safe: a cancelled put() or get() leaves the
+structure unchanged and hands any wake-up it received to the next waiter.
+As with asyncio.Queue, consumers can call task_done() for each element
+they finish and producers can await join() until all of them are done.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import asyncio
+from collections import deque
+
+from queue import Empty, Full, Queue
+from stack import Stack
+
+
+class QueueClosed(Exception):
+    """
+    Raised when putting into a closed adapter, or getting from one that is closed and empty.
+    """
+    pass
+
+
+class _AsyncAdapter:
+    """
+    Shared waiting logic for the asyncio adapters.
+
+    Waiting coroutines park on futures kept in FIFO order, so they are woken
+    in the order they started waiting. Subclasses provide _count() and the
+    element-moving methods.
+
+    Attributes:
+        maxsize (int): Capacity enforced by put/push (0 or less means unbounded)
+        _getters (deque): Futures of coroutines waiting for an element
+        _putters (deque): Futures of coroutines waiting for free space
+        _closed (bool): Whether close() has been called
+        _unfinished_tasks (int): Elements stored but not yet marked with task_done()
+        _finished (asyncio.Event): Set while no element is unfinished
+    """
+
+    __slots__ = ("maxsize", "_getters", "_putters", "_closed", "_unfinished_tasks", "_finished")
+
+    def __init__(self, maxsize):
+        """
+        Initialize the waiter bookkeeping.
+
+        Args:
+            maxsize (int): Capacity (0 or less means unbounded)
+        """
+        self.maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+        self._closed = False
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def _count(self):
+        """
+        Return the number of stored elements (implemented by subclasses).
+        """
+        raise NotImplementedError
+
+    def qsize(self):
+        """
+        Get the number of stored elements.
+
+        Returns:
+            int: Number of elements
+        """
+        return self._count()
+
+    def empty(self):
+        """
+        Check whether no elements are stored.
+
+        Returns:
+            bool: True if empty
+        """
+        return self._count() == 0
+
+    def full(self):
+        """
+        Check whether the adapter is bounded and at capacity.
+
+        Returns:
+            bool: True if a put/push would have to wait
+        """
+        return 0 < self.maxsize <= self._count()
+
+    def close(self):
+        """
+        Close the adapter.
+
+        Further puts raise QueueClosed. Elements already stored can still be
+        taken; once they run out, gets raise QueueClosed and async iteration
+        stops. Every waiting coroutine is woken so it can observe the close.
+
+        Returns:
+            None
+        """
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def task_done(self):
+        """
+        Mark one element previously taken as fully processed.
+
+        Raises:
+            ValueError: If called more times than elements were stored
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if not self._unfinished_tasks:
+            self._finished.set()
+
+    async def join(self):
+        """
+        Wait until every stored element has been marked with task_done().
+
+        Returns:
+            None
+        """
+        if self._unfinished_tasks:
+            await self._finished.wait()
+
+    def _stored(self, waiters):
+        """
+        Count a newly stored element as unfinished and wake one waiter.
+
+        Args:
+            waiters (deque): The getters waiting for an element
+        """
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(waiters)
+
+    @property
+    def closed(self):
+        """
+        Whether close() has been called.
+
+        Returns:
+            bool: True if closed
+        """
+        return self._closed
+
+    def _wakeup_next(self, waiters):
+        """
+        Wake the longest-waiting coroutine that is still waiting.
+
+        Args:
+            waiters (deque): The futures to pick from
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait_while(self, waiters, blocked):
+        """
+        Wait until blocked() turns false.
+
+        If the waiting coroutine is cancelled after it was woken, the
+        wake-up is passed on so no other waiter misses it.
+
+        Args:
+            waiters (deque): Queue of futures to park on
+            blocked: Callable returning True while the caller must keep waiting
+
+        Raises:
+            QueueClosed: If the adapter is closed while the caller is still blocked
+        """
+        while blocked():
+            if self._closed:
+                raise QueueClosed("Adapter is closed")
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    # Already removed when it was woken
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def __len__(self):
+        """
+        Return the number of stored elements, enabling len(adapter).
+
+        Returns:
+            int: Number of elements
+        """
+        return self._count()
+
+    def __aiter__(self):
+        """
+        Return the adapter itself as an async iterator.
+
+        Returns:
+            The adapter
+        """
+        return self
+
+    async def __anext__(self):
+        """
+        Await and return the next element; stop once closed and drained.
+
+        Returns:
+            The next element
+
+        Raises:
+            StopAsyncIteration: If the adapter is closed and empty
+        """
+        try:
+            return await self._take()
+        except QueueClosed:
+            raise StopAsyncIteration from None
+
+    async def _take(self):
+        """
+        Await and remove the next element (implemented by subclasses).
+        """
+        raise NotImplementedError
+
+
+class AsyncQueue(_AsyncAdapter):
+    """
+    An awaitable FIFO queue backed by a Queue.
+
+    put() waits while the queue is at maxsize and get() waits while it is
+    empty. Elements are stored with the wrapped Queue's enqueue/dequeue, so
+    its event sink sees every element that goes through.
+
+    Attributes:
+        _queue (Queue): The synchronous queue used as storage
+    """
+
+    __slots__ = ("_queue",)
+
+    def __init__(self, maxsize=0, queue=None, sink=None):
+        """
+        Initialize an async queue.
+
+        Args:
+            maxsize (int): Capacity; put() waits when it is reached (default: unbounded)
+            queue (Queue): Existing queue to use as storage (default: a new Queue)
+            sink: Event sink for a newly created storage queue
+        """
+        super().__init__(maxsize)
+        self._queue = queue if queue is not None else Queue(sink=sink)
+
+    def _count(self):
+        """Return the number of elements in the storage queue."""
+        return len(self._queue)
+
+    async def put(self, item):
+        """
+        Add an element to the rear, waiting for free space if the queue is full.
+
+        Args:
+            item: The element to be added
+
+        Raises:
+            QueueClosed: If the queue is closed
+        """
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        await self._wait_while(self._putters, self.full)
+        self.put_nowait(item)
+
+    def put_nowait(self, item):
+        """
+        Add an element to the rear without waiting.
+
+        Args:
+            item: The element to be added
+
+        Raises:
+            Full: If the queue is at maxsize
+            QueueClosed: If the queue is closed
+        """
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        if self.full():
+            raise Full
+        self._queue.enqueue(item)
+        self._stored(self._getters)
+
+    async def get(self):
+        """
+        Remove and return the front element, waiting for one if the queue is empty.
+
+        Returns:
+            The front element
+
+        Raises:
+            QueueClosed: If the queue is closed and empty
+        """
+        await self._wait_while(self._getters, self.empty)
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """
+        Remove and return the front element without waiting.
+
+        Returns:
+            The front element
+
+        Raises:
+            Empty: If the queue is empty
+            QueueClosed: If the queue is closed and empty
+        """
+        if not len(self._queue):
+            if self._closed:
+                raise QueueClosed("Queue is closed and empty")
+            raise Empty
+        item = self._queue.dequeue()
+        self._wakeup_next(self._putters)
+        return item
+
+    _take = get
+
+
+class AsyncStack(_AsyncAdapter):
+    """
+    An awaitable LIFO stack backed by a Stack.
+
+    push() waits while the stack is at maxsize and pop() waits while it is
+    empty. Async iteration pops elements in LIFO order until the stack is
+    closed and empty.
+
+    Attributes:
+        _stack (Stack): The synchronous stack used as storage
+    """
+
+    __slots__ = ("_stack",)
+
+    def __init__(self, maxsize=0, stack=None, sink=None):
+        """
+        Initialize an async stack.
+
+        Args:
+            maxsize (int): Capacity; push() waits when it is reached (default: unbounded)
+            stack (Stack): Existing stack to use as storage (default: a new Stack)
+            sink: Event sink for a newly created storage stack
+        """
+        super().__init__(maxsize)
+        self._stack = stack if stack is not None else Stack(sink=sink)
+
+    def _count(self):
+        """Return the number of elements in the storage stack."""
+        return len(self._stack)
+
+    async def push(self, item):
+        """
+        Add an element to the top, waiting for free space if the stack is full.
+
+        Args:
+            item: The element to be added
+
+        Raises:
+            QueueClosed: If the stack is closed
+        """
+        if self._closed:
+            raise QueueClosed("Cannot push onto a closed stack")
+        await self._wait_while(self._putters, self.full)
+        self.push_nowait(item)
+
+    def push_nowait(self, item):
+        """
+        Add an element to the top without waiting.
+
+        Args:
+            item: The element to be added
+
+        Raises:
+            Full: If the stack is at maxsize
+            QueueClosed: If the stack is closed
+        """
+        if self._closed:
+            raise QueueClosed("Cannot push onto a closed stack")
+        if self.full():
+            raise Full
+        self._stack.push(item)
+        self._stored(self._getters)
+
+    async def pop(self):
+        """
+        Remove and return the top element, waiting for one if the stack is empty.
+
+        Returns:
+            The top element
+
+        Raises:
+            QueueClosed: If the stack is closed and empty
+        """
+        await self._wait_while(self._getters, self.empty)
+        return self.pop_nowait()
+
+    def pop_nowait(self):
+        """
+        Remove and return the top element without waiting.
+
+        Returns:
+            The top element
+
+        Raises:
+            Empty: If the stack is empty
+            QueueClosed: If the stack is closed and empty
+        """
+        if not len(self._stack):
+            if self._closed:
+                raise QueueClosed("Stack is closed and empty")
+            raise Empty
+        item = self._stack.pop()
+        self._wakeup_next(self._putters)
+        return item
+
+    _take = pop
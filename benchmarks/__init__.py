@@ -0,0 +1,15 @@
+"""
+Performance Benchmarks for the Data Structures
+
+Each module in this package measures one aspect of the data structures and
+can be run on its own from the project root, for example:
+
+    python -m benchmarks.queue_drain
+
+Running the package itself (python -m benchmarks) times every public
+operation at several sizes and compares the results with a baseline; see
+benchmarks/__main__.py.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
@@ -0,0 +1,313 @@
+"""
+Benchmark Suite for the Public Operations
+
+Times every public method of Stack, Queue and LinkedList on structures of
+several sizes, plus the end-to-end DataStructureManager scenarios with
+their printing sent to a throwaway buffer. Results are written as JSON
+and can be compared with a saved baseline; operations that got slower
+than the threshold are flagged and make the run exit with status 1.
+
+Run from the project root:
+
+    python -m benchmarks                                  # sizes 10^3 to 10^5
+    python -m benchmarks --sizes 1000 10000 100000 1000000 10000000
+    python -m benchmarks --output baseline.json           # save a baseline
+    python -m benchmarks --baseline baseline.json         # compare with it
+
+Constant-time operations are timed over --ops calls on a structure of the
+given size; operations that walk the structure (marked linear) are timed
+over --linear-ops calls. Each measurement is the best of --rounds rounds.
+display() is left out because it only prints. Queue.join() is timed on a
+queue with no unfinished tasks, i.e. the cost of the check when it does
+not have to wait.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+from linkedlist import LinkedList
+from main import DataStructureManager
+from queue import Queue
+from stack import Stack
+
+
+# setup(n) builds a structure; operation(structure, n, i) is the timed call for repetition i.
+# linear: the call walks the structure, so fewer repetitions are run.
+# fresh: the call consumes the structure, so setup runs again before every repetition.
+Case = namedtuple("Case", ["name", "setup", "operation", "linear", "fresh"])
+
+
+def _stack(n):
+    stack = Stack()
+    stack.push_many(range(n))
+    return stack
+
+
+def _queue(n):
+    queue = Queue()
+    queue.enqueue_many(range(n))
+    return queue
+
+
+def _joinable_queue(n):
+    # put() counts unfinished tasks, so task_done() has one to mark per element
+    queue = Queue()
+    for i in range(n):
+        queue.put_nowait(i)
+    return queue
+
+
+def _linked_list(n):
+    linked_list = LinkedList()
+    linked_list.extend(range(n))
+    return linked_list
+
+
+def _snapshot(build):
+    """
+    Return a setup function that saves a structure and returns the file path.
+    """
+    def setup(n):
+        path = os.path.join(tempfile.gettempdir(), f"benchmark-{os.getpid()}.bin")
+        build(n).save(path)
+        return path
+    return setup
+
+
+# Scratch file for save() cases
+_SAVE_PATH = os.path.join(tempfile.gettempdir(), f"benchmark-save-{os.getpid()}.bin")
+
+BATCH = 100
+
+CASES = [
+    Case("Stack.push", _stack, lambda s, n, i: s.push(i), False, False),
+    Case("Stack.pop", _stack, lambda s, n, i: s.pop(), False, False),
+    Case("Stack.push_many", _stack, lambda s, n, i: s.push_many(range(BATCH)), False, False),
+    Case("Stack.pop_many", _stack, lambda s, n, i: s.pop_many(BATCH), False, False),
+    Case("Stack.peek", _stack, lambda s, n, i: s.peek(), False, False),
+    Case("Stack.is_empty", _stack, lambda s, n, i: s.is_empty(), False, False),
+    Case("Stack.size", _stack, lambda s, n, i: s.size(), False, False),
+    Case("Stack.__len__", _stack, lambda s, n, i: len(s), False, False),
+    Case("Stack.__contains__", _stack, lambda s, n, i: -1 in s, True, False),
+    Case("Stack.__iter__", _stack, lambda s, n, i: sum(1 for _ in s), True, False),
+    Case("Stack.__reversed__", _stack, lambda s, n, i: sum(1 for _ in reversed(s)), True, False),
+    Case("Stack.clear", _stack, lambda s, n, i: s.clear(), True, True),
+    Case("Stack.save", _stack, lambda s, n, i: s.save(_SAVE_PATH), True, False),
+    Case("Stack.load", _snapshot(_stack), lambda path, n, i: Stack.load(path), True, False),
+
+    Case("Queue.enqueue", _queue, lambda q, n, i: q.enqueue(i), False, False),
+    Case("Queue.dequeue", _queue, lambda q, n, i: q.dequeue(), False, False),
+    Case("Queue.enqueue_many", _queue, lambda q, n, i: q.enqueue_many(range(BATCH)), False, False),
+    Case("Queue.dequeue_many", _queue, lambda q, n, i: q.dequeue_many(BATCH), False, False),
+    Case("Queue.requeue_front", _queue, lambda q, n, i: q.requeue_front(i), False, False),
+    Case("Queue.front", _queue, lambda q, n, i: q.front(), False, False),
+    Case("Queue.rear", _queue, lambda q, n, i: q.rear(), False, False),
+    Case("Queue.is_empty", _queue, lambda q, n, i: q.is_empty(), False, False),
+    Case("Queue.size", _queue, lambda q, n, i: q.size(), False, False),
+    Case("Queue.__len__", _queue, lambda q, n, i: len(q), False, False),
+    Case("Queue.put", _queue, lambda q, n, i: q.put(i), False, False),
+    Case("Queue.get", _queue, lambda q, n, i: q.get(), False, False),
+    Case("Queue.put_nowait", _queue, lambda q, n, i: q.put_nowait(i), False, False),
+    Case("Queue.get_nowait", _queue, lambda q, n, i: q.get_nowait(), False, False),
+    Case("Queue.task_done", _joinable_queue, lambda q, n, i: q.task_done(), False, False),
+    Case("Queue.join", _queue, lambda q, n, i: q.join(), False, False),
+    Case("Queue.qsize", _queue, lambda q, n, i: q.qsize(), False, False),
+    Case("Queue.empty", _queue, lambda q, n, i: q.empty(), False, False),
+    Case("Queue.full", _queue, lambda q, n, i: q.full(), False, False),
+    Case("Queue.__contains__", _queue, lambda q, n, i: -1 in q, True, False),
+    Case("Queue.__iter__", _queue, lambda q, n, i: sum(1 for _ in q), True, False),
+    Case("Queue.__reversed__", _queue, lambda q, n, i: sum(1 for _ in reversed(q)), True, False),
+    Case("Queue.clear", _queue, lambda q, n, i: q.clear(), True, True),
+    Case("Queue.save", _queue, lambda q, n, i: q.save(_SAVE_PATH), True, False),
+    Case("Queue.load", _snapshot(_queue), lambda path, n, i: Queue.load(path), True, False),
+
+    Case("LinkedList.insert_at_beginning", _linked_list,
+         lambda l, n, i: l.insert_at_beginning(i), False, False),
+    Case("LinkedList.insert_at_end", _linked_list, lambda l, n, i: l.insert_at_end(i), False, False),
+    Case("LinkedList.insert_at_position", _linked_list,
+         lambda l, n, i: l.insert_at_position(i, n // 2), True, False),
+    Case("LinkedList.extend", _linked_list, lambda l, n, i: l.extend(range(BATCH)), False, False),
+    Case("LinkedList.extend_left", _linked_list, lambda l, n, i: l.extend_left(range(BATCH)), False, False),
+    Case("LinkedList.delete_by_value", _linked_list,
+         lambda l, n, i: l.delete_by_value(n - 1 - i), True, False),
+    Case("LinkedList.delete_at_position", _linked_list,
+         lambda l, n, i: l.delete_at_position(n // 2 - i), True, False),
+    Case("LinkedList.search", _linked_list, lambda l, n, i: l.search(-1), True, False),
+    Case("LinkedList.get_at_position", _linked_list,
+         lambda l, n, i: l.get_at_position(n // 2), True, False),
+    Case("LinkedList.size", _linked_list, lambda l, n, i: l.size(), False, False),
+    Case("LinkedList.is_empty", _linked_list, lambda l, n, i: l.is_empty(), False, False),
+    Case("LinkedList.__len__", _linked_list, lambda l, n, i: len(l), False, False),
+    Case("LinkedList.__contains__", _linked_list, lambda l, n, i: -1 in l, True, False),
+    Case("LinkedList.__iter__", _linked_list, lambda l, n, i: sum(1 for _ in l), True, False),
+    Case("LinkedList.__reversed__", _linked_list,
+         lambda l, n, i: sum(1 for _ in reversed(l)), True, False),
+    Case("LinkedList.clear", _linked_list, lambda l, n, i: l.clear(), True, True),
+    Case("LinkedList.save", _linked_list, lambda l, n, i: l.save(_SAVE_PATH), True, False),
+    Case("LinkedList.load", _snapshot(_linked_list), lambda path, n, i: LinkedList.load(path), True, False),
+]
+
+SCENARIOS = DataStructureManager.SCENARIOS
+
+
+def time_case(case, n, repetitions, rounds):
+    """
+    Time one operation on a structure of size n.
+
+    Args:
+        case (Case): The operation to time
+        n (int): Structure size
+        repetitions (int): Calls per round
+        rounds (int): Number of rounds; the fastest is kept
+
+    Returns:
+        float: Nanoseconds per call
+    """
+    # Removal cases need enough elements for every repetition
+    size = max(n, repetitions * BATCH) if case.name.endswith(("pop_many", "dequeue_many")) else n
+    size = max(size, 2 * repetitions)
+    best = float("inf")
+    for _ in range(rounds):
+        if case.fresh:
+            elapsed = 0
+            for i in range(repetitions):
+                structure = case.setup(size)
+                start = time.perf_counter_ns()
+                case.operation(structure, size, i)
+                elapsed += time.perf_counter_ns() - start
+        else:
+            structure = case.setup(size)
+            operation = case.operation
+            start = time.perf_counter_ns()
+            for i in range(repetitions):
+                operation(structure, size, i)
+            elapsed = time.perf_counter_ns() - start
+        best = min(best, elapsed / repetitions)
+    return best
+
+
+def time_scenario(name, repetitions, rounds):
+    """
+    Time one DataStructureManager scenario on a fresh silent manager.
+
+    Args:
+        name (str): Name of the manager method
+        repetitions (int): Runs per round
+        rounds (int): Number of rounds; the fastest is kept
+
+    Returns:
+        float: Nanoseconds per run
+    """
+    best = float("inf")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(rounds):
+            elapsed = 0
+            for _ in range(repetitions):
+                manager = DataStructureManager()
+                scenario = getattr(manager, name)
+                start = time.perf_counter_ns()
+                scenario()
+                elapsed += time.perf_counter_ns() - start
+            best = min(best, elapsed / repetitions)
+    return best
+
+
+def compare(results, baseline, threshold):
+    """
+    Find measurements that got slower than the baseline by more than the threshold.
+
+    Args:
+        results (dict): Current measurements (name -> ns)
+        baseline (dict): Baseline measurements (name -> ns)
+        threshold (float): Allowed slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        list: (name, baseline ns, current ns, ratio) for each regression
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous and current / previous > 1 + threshold:
+            regressions.append((name, previous, current, current / previous))
+    return regressions
+
+
+def main():
+    """
+    Run the suite, print a table, write JSON and compare with a baseline.
+
+    Returns:
+        int: Exit status (1 if regressions were found)
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark every public operation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="structure sizes (the full range is 1000 ... 10000000)")
+    parser.add_argument("--ops", type=int, default=1_000, help="calls per round for constant-time operations")
+    parser.add_argument("--linear-ops", type=int, default=5, help="calls per round for linear operations")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds per measurement (best is kept)")
+    parser.add_argument("--filter", default="", help="only run operations whose name contains this text")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with results saved by an earlier --output")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown that counts as a regression (default: 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'operation':<34} {'N':>9} {'ns/call':>12}")
+    for case in CASES:
+        if args.filter not in case.name:
+            continue
+        repetitions = args.linear_ops if case.linear else args.ops
+        for n in args.sizes:
+            nanoseconds = time_case(case, n, repetitions, args.rounds)
+            results[f"{case.name}/{n}"] = nanoseconds
+            print(f"{case.name:<34} {n:>9} {nanoseconds:>12,.0f}")
+    for path in (_SAVE_PATH, os.path.join(tempfile.gettempdir(), f"benchmark-{os.getpid()}.bin")):
+        if os.path.exists(path):
+            os.remove(path)
+
+    for name in SCENARIOS:
+        if args.filter not in name:
+            continue
+        nanoseconds = time_scenario(name, repetitions=20, rounds=args.rounds)
+        results[f"DataStructureManager.{name}"] = nanoseconds
+        print(f"{'Manager.' + name:<44} {nanoseconds:>12,.0f}")
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "results": results,
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for name, previous, current, ratio in regressions:
+                print(f"  {name:<44} {previous:>12,.0f} -> {current:>12,.0f} ns ({ratio:.2f}x)")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Asyncio Adapter Throughput Benchmark
+
+Measures items per second moved through an AsyncQueue and an AsyncStack by
+thousands of producer and consumer coroutines on one event loop, with a
+bounded capacity so producers regularly wait on backpressure.
+
+Run from the project root:
+
+    python -m benchmarks.async_throughput [--items 200000] [--coroutines 1000 5000]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import asyncio
+import time
+
+from asyncstructures import AsyncQueue, AsyncStack
+
+
+async def run(adapter, put, producers, consumers, items):
+    """
+    Move items through an adapter with the given numbers of coroutines.
+
+    Args:
+        adapter: AsyncQueue or AsyncStack to exercise
+        put: The adapter's awaitable insert method (put or push)
+        producers (int): Number of producer coroutines
+        consumers (int): Number of consumer coroutines
+        items (int): Total number of items to move
+
+    Returns:
+        float: Elapsed seconds
+    """
+    per_producer = items // producers
+
+    async def produce():
+        for i in range(per_producer):
+            await put(i)
+
+    async def consume():
+        async for _ in adapter:
+            pass
+
+    start = time.perf_counter()
+    consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    adapter.close()
+    await asyncio.gather(*consumer_tasks)
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Run the benchmark for each coroutine count and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Asyncio adapter throughput benchmark")
+    parser.add_argument("--items", type=int, default=200_000, help="items moved per run")
+    parser.add_argument("--coroutines", type=int, nargs="+", default=[10, 1_000, 5_000],
+                        help="total coroutines per run (split evenly between producers and consumers)")
+    parser.add_argument("--maxsize", type=int, default=256, help="adapter capacity")
+    args = parser.parse_args()
+
+    print(f"{'coroutines':>10} {'AsyncQueue items/s':>19} {'AsyncStack items/s':>19}")
+    for coroutines in args.coroutines:
+        side = max(1, coroutines // 2)
+        items = args.items // side * side
+        queue = AsyncQueue(maxsize=args.maxsize)
+        queue_time = asyncio.run(run(queue, queue.put, side, side, items))
+        stack = AsyncStack(maxsize=args.maxsize)
+        stack_time = asyncio.run(run(stack, stack.push, side, side, items))
+        print(f"{coroutines:>10} {items / queue_time:>19,.0f} {items / stack_time:>19,.0f}")
+
+
+if __name__ == "__main__":
+    main()
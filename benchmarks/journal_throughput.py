@@ -0,0 +1,82 @@
+"""
+Journal Throughput Benchmark
+
+Measures how many journaled enqueue() calls per second a JournaledStructure
+sustains under each fsync policy, next to an unjournaled Queue. With
+several writer threads, the "always" policy shows the effect of group
+commit: threads waiting at the same time share one fsync.
+
+Run from the project root:
+
+    python -m benchmarks.journal_throughput [--ops 20000] [--threads 1 4] [--directory /tmp]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import shutil
+import tempfile
+import threading
+import time
+
+from journal import FSYNC_POLICIES, JournaledStructure
+from queue import Queue
+
+
+def run_writers(queue, ops, threads):
+    """
+    Enqueue ops elements in total from a number of threads.
+
+    Args:
+        queue: A Queue or JournaledStructure wrapping one
+        ops (int): Total number of enqueue() calls
+        threads (int): Number of writer threads
+
+    Returns:
+        float: Calls per second
+    """
+    per_thread = ops // threads
+
+    def writer(worker):
+        for number in range(per_thread):
+            queue.enqueue((worker, number, "payload"))
+
+    workers = [threading.Thread(target=writer, args=(worker,)) for worker in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Run every policy at every thread count and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Journal throughput by fsync policy")
+    parser.add_argument("--ops", type=int, default=20_000, help="enqueue calls per run")
+    parser.add_argument("--always-ops", type=int, default=2_000,
+                        help="enqueue calls per run for the slow 'always' policy")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4], help="writer thread counts")
+    parser.add_argument("--directory", default=None,
+                        help="where to put the journals (default: system temporary directory)")
+    args = parser.parse_args()
+
+    print(f"{'policy':<10} {'threads':>7} {'calls/s':>12}")
+    for threads in args.threads:
+        print(f"{'none':<10} {threads:>7} {run_writers(Queue(), args.ops, threads):>12,.0f}")
+        for policy in FSYNC_POLICIES:
+            ops = args.always_ops if policy == "always" else args.ops
+            directory = tempfile.mkdtemp(prefix="journal-bench-", dir=args.directory)
+            try:
+                with JournaledStructure(Queue, directory, fsync=policy) as queue:
+                    rate = run_writers(queue, ops, threads)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            print(f"{policy:<10} {threads:>7} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Linked List Append Benchmark
+
+Measures the time to build a linked list of N nodes with insert_at_end.
+With the tail pointer each append is O(1), so building the list is O(N);
+the head-walking baseline (the previous implementation) is O(N^2).
+
+Run from the project root:
+
+    python -m benchmarks.linkedlist_append [--sizes 1000 10000 100000]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import time
+
+from linkedlist import LinkedList, Node
+
+
+def build_by_walking(n):
+    """
+    Time building an n-node chain by walking from the head on every append.
+
+    Args:
+        n (int): Number of nodes to append
+
+    Returns:
+        float: Elapsed seconds
+    """
+    start = time.perf_counter()
+    head = None
+    for i in range(n):
+        new_node = Node(i)
+        if head is None:
+            head = new_node
+        else:
+            current = head
+            while current.next is not None:
+                current = current.next
+            current.next = new_node
+    return time.perf_counter() - start
+
+
+def build_with_tail(n):
+    """
+    Time building an n-node LinkedList with insert_at_end.
+
+    Args:
+        n (int): Number of nodes to append
+
+    Returns:
+        float: Elapsed seconds
+    """
+    linked_list = LinkedList()
+    start = time.perf_counter()
+    for i in range(n):
+        linked_list.insert_at_end(i)
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Run the append benchmark for each requested size and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Linked list append benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000],
+                        help="numbers of nodes to append")
+    parser.add_argument("--walk-limit", type=int, default=20_000,
+                        help="largest size to run the quadratic head-walking baseline at")
+    args = parser.parse_args()
+
+    print(f"{'N':>10} {'head walk s':>12} {'ns/node':>9} {'tail s':>10} {'ns/node':>9}")
+    for n in args.sizes:
+        if n <= args.walk_limit:
+            walk_time = build_by_walking(n)
+            walk_cols = f"{walk_time:>12.4f} {walk_time / n * 1e9:>9.0f}"
+        else:
+            walk_cols = f"{'skipped':>12} {'-':>9}"
+        tail_time = build_with_tail(n)
+        print(f"{n:>10} {walk_cols} {tail_time:>10.4f} {tail_time / n * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
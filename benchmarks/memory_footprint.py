@@ -0,0 +1,163 @@
+"""
+Memory Footprint Benchmark
+
+Uses tracemalloc to report the bytes allocated per element when building
+large structures. The "before" rows use classes with the same attributes
+as the project classes but without __slots__, matching the layout the
+structures had before they declared __slots__.
+
+Run from the project root:
+
+    python -m benchmarks.memory_footprint [--size 1000000]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from linkedlist import LinkedList, Node
+from queue import Queue
+from stack import Stack, TypedStack
+
+
+class DictNode:
+    """A linked list node with a per-instance __dict__ (the pre-__slots__ layout)."""
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class DictStack:
+    """A minimal stack holder with a per-instance __dict__."""
+
+    def __init__(self):
+        self._items = []
+        self.sink = None
+
+
+def measure(build, size):
+    """
+    Measure the bytes allocated by build(size) that are still alive afterwards.
+
+    Args:
+        build: Callable creating and returning a structure of the given size
+        size (int): Number of elements to build
+
+    Returns:
+        float: Bytes per element
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    structure = build(size)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return (after - before) / size
+
+
+def build_node_chain(node_class):
+    """
+    Return a builder for a chain of node_class instances holding shared payloads.
+
+    Args:
+        node_class: Node class to instantiate
+
+    Returns:
+        callable: Builder taking a size and returning the head node
+    """
+    def build(size):
+        head = node_class(None)
+        current = head
+        for _ in range(size):
+            current.next = node_class(None)
+            current = current.next
+        return head
+    return build
+
+
+def build_linked_list(size):
+    """Build a LinkedList of the given size with one bulk call."""
+    linked_list = LinkedList()
+    linked_list.extend(None for _ in range(size))
+    return linked_list
+
+
+def build_stack(size):
+    """Build a Stack of the given size with one bulk call."""
+    stack = Stack()
+    stack.push_many(None for _ in range(size))
+    return stack
+
+
+def build_queue(size):
+    """Build a Queue of the given size with one bulk call."""
+    queue = Queue()
+    queue.enqueue_many(None for _ in range(size))
+    return queue
+
+
+def build_int_stack(size):
+    """Build a Stack of distinct integers (each one a boxed int object)."""
+    stack = Stack()
+    stack.push_many(range(size))
+    return stack
+
+
+def build_typed_stack(size):
+    """Build a TypedStack('q') of distinct integers stored unboxed."""
+    stack = TypedStack("q")
+    stack.push_many(range(size))
+    return stack
+
+
+def build_holders(holder_class):
+    """
+    Return a builder for many small structure instances (per-instance overhead).
+
+    Args:
+        holder_class: Structure class to instantiate
+
+    Returns:
+        callable: Builder taking a count and returning the list of instances
+    """
+    def build(count):
+        return [holder_class() for _ in range(count)]
+    return build
+
+
+def main():
+    """
+    Build each structure with tracemalloc running and print bytes per element.
+    """
+    parser = argparse.ArgumentParser(description="Memory footprint benchmark")
+    parser.add_argument("--size", type=int, default=1_000_000,
+                        help="number of elements per structure")
+    args = parser.parse_args()
+    size = args.size
+
+    # Payloads are the shared None object so only structure overhead is counted,
+    # except in the int rows, which compare boxed and unboxed numeric storage
+    rows = [
+        ("Node chain (before: __dict__)", build_node_chain(DictNode), size),
+        ("Node chain (after: __slots__)", build_node_chain(Node), size),
+        ("LinkedList", build_linked_list, size),
+        ("Stack", build_stack, size),
+        ("Queue", build_queue, size),
+        ("Stack of ints", build_int_stack, size),
+        ("TypedStack('q') of ints", build_typed_stack, size),
+        ("Stack instance (before: __dict__)", build_holders(DictStack), size // 10),
+        ("Stack instance (after: __slots__)", build_holders(Stack), size // 10),
+    ]
+
+    print(f"{'structure':<36} {'elements':>10} {'bytes/element':>14}")
+    for name, build, count in rows:
+        print(f"{name:<36} {count:>10} {measure(build, count):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Task Pipeline Scaling Benchmark
+
+Processes the same batch of CPU-bound tasks (hashing a payload many times)
+in-process and through TaskPipeline with an increasing number of worker
+processes, and reports the speedup and parallel efficiency of each run.
+On CPU-bound tasks the speedup should grow almost linearly until the
+worker count reaches the number of cores; beyond that it levels off.
+
+Run from the project root:
+
+    python -m benchmarks.pipeline_scaling [--tasks 2000] [--rounds 2000] [--workers 1 2 4 8] [--chunk-size 16]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+from pipeline import TaskPipeline
+
+
+def hash_rounds(task):
+    """
+    A CPU-bound task: hash the task's payload repeatedly.
+
+    Args:
+        task (tuple): (payload bytes, number of rounds)
+
+    Returns:
+        str: The final digest in hex
+    """
+    digest, rounds = task
+    for _ in range(rounds):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+def main():
+    """
+    Time the serial baseline and each worker count, and print a table.
+    """
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="TaskPipeline scaling with worker count")
+    parser.add_argument("--tasks", type=int, default=2_000, help="tasks per run")
+    parser.add_argument("--rounds", type=int, default=2_000, help="hash rounds per task (the CPU cost)")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cores}),
+                        help="worker process counts (default: 1, 2, 4 and the core count)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="tasks per submission")
+    args = parser.parse_args()
+
+    tasks = [(number.to_bytes(8, "little"), args.rounds) for number in range(args.tasks)]
+
+    start = time.perf_counter()
+    expected = [hash_rounds(task) for task in tasks]
+    serial = time.perf_counter() - start
+
+    print(f"{args.tasks} tasks x {args.rounds} hash rounds, {cores} core(s)")
+    print(f"{'workers':>8} {'seconds':>9} {'tasks/s':>10} {'speedup':>8} {'efficiency':>10}")
+    print(f"{'serial':>8} {serial:>9.3f} {args.tasks / serial:>10,.0f} {1:>8.2f} {'':>10}")
+    for workers in args.workers:
+        with TaskPipeline(hash_rounds, workers=workers, chunk_size=args.chunk_size) as pipeline:
+            # Start the worker processes before timing
+            pipeline.submit(tasks[0])
+            pipeline.run()
+            pipeline.history.clear()
+            pipeline.stack.clear()
+
+            pipeline.submit_many(tasks)
+            start = time.perf_counter()
+            pipeline.run()
+            elapsed = time.perf_counter() - start
+            if [result for _, result in pipeline.history] != expected:
+                raise RuntimeError("pipeline results differ from the serial results")
+        speedup = serial / elapsed
+        print(f"{workers:>8} {elapsed:>9.3f} {args.tasks / elapsed:>10,.0f} "
+              f"{speedup:>8.2f} {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Positional Access Benchmark
+
+Compares random-position workloads on LinkedList (O(position) per
+operation) and IndexableSkipList (O(log n) expected per operation):
+get_at_position, insert_at_position and delete_at_position at uniformly
+random positions.
+
+Run from the project root:
+
+    python -m benchmarks.positional_access [--sizes 1000 10000 100000] [--ops 2000]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import random
+import time
+
+from linkedlist import LinkedList
+from skiplist import IndexableSkipList
+
+
+def run_workload(structure, operation, positions):
+    """
+    Time one positional operation at each of the given positions.
+
+    Args:
+        structure: A LinkedList or IndexableSkipList
+        operation (str): "get", "insert" or "delete"
+        positions (list): Positions to use, valid for the structure as it changes
+
+    Returns:
+        float: Microseconds per operation
+    """
+    start = time.perf_counter()
+    if operation == "get":
+        for position in positions:
+            structure.get_at_position(position)
+    elif operation == "insert":
+        for position in positions:
+            structure.insert_at_position(position, position)
+    else:
+        for position in positions:
+            structure.delete_at_position(position)
+    return (time.perf_counter() - start) / len(positions) * 1e6
+
+
+def main():
+    """
+    Run each workload on both structures for every size and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Random positional access benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="numbers of elements in the list")
+    parser.add_argument("--ops", type=int, default=2_000, help="operations per workload")
+    args = parser.parse_args()
+
+    print(f"{'N':>8} {'operation':>9} {'LinkedList us/op':>17} {'SkipList us/op':>15}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        # Positions stay valid because inserts grow and deletes shrink the list by one
+        workloads = {
+            "get": [rng.randrange(size) for _ in range(args.ops)],
+            "insert": [rng.randrange(size + i) for i in range(args.ops)],
+            "delete": [rng.randrange(size + args.ops - i) for i in range(args.ops)],
+        }
+        linked_list = LinkedList()
+        linked_list.extend(range(size))
+        skip_list = IndexableSkipList()
+        skip_list.extend(range(size))
+        for operation in ("get", "insert", "delete"):
+            linked_time = run_workload(linked_list, operation, workloads[operation])
+            skip_time = run_workload(skip_list, operation, workloads[operation])
+            print(f"{size:>8} {operation:>9} {linked_time:>17.1f} {skip_time:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
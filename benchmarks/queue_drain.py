@@ -0,0 +1,82 @@
+"""
+Queue Drain Benchmark
+
+Measures how the time to drain N items from a queue scales with N.
+The ring-buffer Queue should grow linearly (constant time per item), while
+the old list-based approach (list.pop(0)) grows quadratically.
+
+Run from the project root:
+
+    python -m benchmarks.queue_drain [--sizes 1000 10000 100000 1000000]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import time
+
+from queue import Queue
+
+
+def drain_list(n):
+    """
+    Time draining n items from a plain list with pop(0) (the old Queue engine).
+
+    Args:
+        n (int): Number of items to drain
+
+    Returns:
+        float: Elapsed seconds
+    """
+    items = list(range(n))
+    start = time.perf_counter()
+    while items:
+        items.pop(0)
+    return time.perf_counter() - start
+
+
+def drain_queue(n):
+    """
+    Time draining n items from a ring-buffer backed Queue.
+
+    Args:
+        n (int): Number of items to drain
+
+    Returns:
+        float: Elapsed seconds
+    """
+    queue = Queue()
+    for i in range(n):
+        queue.enqueue(i)
+    start = time.perf_counter()
+    while not queue.is_empty():
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Run the drain benchmark for each requested size and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Queue drain scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="numbers of items to drain")
+    parser.add_argument("--list-limit", type=int, default=300_000,
+                        help="largest size to run the quadratic list.pop(0) baseline at")
+    args = parser.parse_args()
+
+    print(f"{'N':>10} {'list.pop(0) s':>14} {'ns/item':>9} {'Queue s':>10} {'ns/item':>9}")
+    for n in args.sizes:
+        if n <= args.list_limit:
+            list_time = drain_list(n)
+            list_cols = f"{list_time:>14.4f} {list_time / n * 1e9:>9.0f}"
+        else:
+            list_cols = f"{'skipped':>14} {'-':>9}"
+        queue_time = drain_queue(n)
+        print(f"{n:>10} {list_cols} {queue_time:>10.4f} {queue_time / n * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
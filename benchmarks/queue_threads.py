@@ -0,0 +1,148 @@
+"""
+Multi-Producer / Multi-Consumer Queue Benchmark
+
+Measures items per second moved through a shared Queue by several producer
+and consumer threads. Two strategies are compared:
+
+- blocking: put()/get() on the thread-safe Queue API (condition variables)
+- polling:  enqueue()/dequeue() wrapped in an external lock, with consumers
+            busy-polling is_empty() (the previous workaround)
+
+Run from the project root:
+
+    python -m benchmarks.queue_threads [--items 200000] [--maxsize 1024]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import threading
+import time
+
+from queue import Queue
+
+
+# Marker telling a consumer thread to stop
+STOP = object()
+
+
+def run_blocking(producers, consumers, items, maxsize):
+    """
+    Move items through the queue with the blocking put()/get() API.
+
+    Args:
+        producers (int): Number of producer threads
+        consumers (int): Number of consumer threads
+        items (int): Total number of items to move
+        maxsize (int): Queue capacity (0 = unbounded)
+
+    Returns:
+        float: Elapsed seconds
+    """
+    queue = Queue(maxsize=maxsize)
+    per_producer = items // producers
+
+    def produce():
+        for i in range(per_producer):
+            queue.put(i)
+
+    def consume():
+        while queue.get() is not STOP:
+            pass
+
+    return _run_threads(produce, consume, producers, consumers,
+                        lambda: queue.put(STOP))
+
+
+def run_polling(producers, consumers, items, maxsize):
+    """
+    Move items through the queue with an external lock and busy polling.
+
+    Args:
+        producers (int): Number of producer threads
+        consumers (int): Number of consumer threads
+        items (int): Total number of items to move
+        maxsize (int): Unused; the polling strategy has no backpressure
+
+    Returns:
+        float: Elapsed seconds
+    """
+    queue = Queue()
+    lock = threading.Lock()
+    per_producer = items // producers
+
+    def produce():
+        for i in range(per_producer):
+            with lock:
+                queue.enqueue(i)
+
+    producers_done = threading.Event()
+
+    def consume():
+        while True:
+            # Read the flag before polling so no item put afterwards is missed
+            done = producers_done.is_set()
+            with lock:
+                if not queue.is_empty():
+                    queue.dequeue()
+                    continue
+            if done:
+                return
+            time.sleep(0)
+
+    return _run_threads(produce, consume, producers, consumers, producers_done.set,
+                        stop_once=True)
+
+
+def _run_threads(produce, consume, producers, consumers, stop, stop_once=False):
+    """
+    Start the threads, wait for producers, signal consumers and time the run.
+
+    Args:
+        produce: Producer thread body
+        consume: Consumer thread body
+        producers (int): Number of producer threads
+        consumers (int): Number of consumer threads
+        stop: Callable signalling consumers to stop
+        stop_once (bool): Call stop once instead of once per consumer
+
+    Returns:
+        float: Elapsed seconds
+    """
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+
+    start = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for _ in range(1 if stop_once else consumers):
+        stop()
+    for thread in consumer_threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Run both strategies over several producer/consumer mixes and print a table.
+    """
+    parser = argparse.ArgumentParser(description="MPMC queue throughput benchmark")
+    parser.add_argument("--items", type=int, default=200_000, help="items moved per run")
+    parser.add_argument("--maxsize", type=int, default=1024,
+                        help="capacity for the blocking queue (0 = unbounded)")
+    args = parser.parse_args()
+
+    mixes = [(1, 1), (2, 2), (4, 4), (8, 2), (2, 8)]
+    print(f"{'producers':>9} {'consumers':>9} {'blocking items/s':>17} {'polling items/s':>16}")
+    for producers, consumers in mixes:
+        items = args.items // producers * producers
+        blocking = run_blocking(producers, consumers, items, args.maxsize)
+        polling = run_polling(producers, consumers, items, args.maxsize)
+        print(f"{producers:>9} {consumers:>9} {items / blocking:>17,.0f} {items / polling:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Shared-Memory Queue Benchmark
+
+Sends the same payloads from a producer process to the parent through a
+multiprocessing Pipe (each payload pickled, written and unpickled) and
+through a SharedMemoryQueue (copied into and read from shared memory),
+and compares items per second. The consumer reads the shared queue
+either as copies (get) or in place (consume).
+
+Run from the project root:
+
+    python -m benchmarks.shared_queue [--items 200000] [--payload 256 4096] [--capacity 4194304]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from sharedqueue import SharedMemoryQueue
+
+
+def pipe_producer(connection, items, payload):
+    """
+    Send items payloads through a pipe, then a None terminator.
+    """
+    data = bytes(payload)
+    for _ in range(items):
+        connection.send(data)
+    connection.send(None)
+    connection.close()
+
+
+def queue_producer(queue, items, payload):
+    """
+    Put items payloads into a shared-memory queue.
+    """
+    data = bytes(payload)
+    for _ in range(items):
+        queue.put(data)
+    queue.close()
+
+
+def run_pipe(items, payload):
+    """
+    Time a pipe handoff.
+
+    Returns:
+        float: Items per second
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    producer = multiprocessing.Process(target=pipe_producer, args=(sender, items, payload))
+    start = time.perf_counter()
+    producer.start()
+    received = 0
+    while receiver.recv() is not None:
+        received += 1
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return received / elapsed
+
+
+def run_shared(items, payload, capacity, zero_copy):
+    """
+    Time a shared-memory queue handoff.
+
+    Args:
+        zero_copy (bool): Read payloads in place with consume() instead of get()
+
+    Returns:
+        float: Items per second
+    """
+    with SharedMemoryQueue(capacity=capacity) as queue:
+        producer = multiprocessing.Process(target=queue_producer, args=(queue, items, payload))
+        start = time.perf_counter()
+        producer.start()
+        received = 0
+        while received < items:
+            if queue.is_empty():
+                time.sleep(0)
+                continue
+            if zero_copy:
+                with queue.consume() as view:
+                    view[0]
+            else:
+                queue.get()
+            received += 1
+        elapsed = time.perf_counter() - start
+        producer.join()
+    return received / elapsed
+
+
+def main():
+    """
+    Run every transport at every payload size and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Pipe vs shared-memory queue handoff")
+    parser.add_argument("--items", type=int, default=200_000, help="payloads per run")
+    parser.add_argument("--payload", type=int, nargs="+", default=[256, 4096], help="payload sizes in bytes")
+    parser.add_argument("--capacity", type=int, default=4 << 20, help="shared ring size in bytes")
+    args = parser.parse_args()
+
+    print(f"{'transport':<22} {'payload':>8} {'items/s':>12}")
+    for payload in args.payload:
+        print(f"{'Pipe (pickle)':<22} {payload:>8} {run_pipe(args.items, payload):>12,.0f}")
+        print(f"{'SharedMemoryQueue get':<22} {payload:>8} "
+              f"{run_shared(args.items, payload, args.capacity, False):>12,.0f}")
+        print(f"{'SharedMemoryQueue view':<22} {payload:>8} "
+              f"{run_shared(args.items, payload, args.capacity, True):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Spilling Queue Benchmark
+
+Fills a queue with a backlog several times larger than its memory cap
+(10x by default), then drains it, and compares throughput and peak traced
+memory with the in-memory Queue holding the same backlog.
+
+Run from the project root:
+
+    python -m benchmarks.spill_queue [--memory-items 50000] [--factor 10] [--payload 100]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from queue import Queue
+from spillqueue import SpillingQueue
+
+
+def fill_and_drain(queue, backlog, payload):
+    """
+    Enqueue a backlog of payloads one by one, then dequeue all of them.
+
+    Args:
+        queue: An empty Queue or SpillingQueue
+        backlog (int): Number of elements to enqueue
+        payload (int): Size in bytes of each element
+
+    Returns:
+        tuple: (enqueue seconds, dequeue seconds, peak traced MiB)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    for number in range(backlog):
+        # Each element gets its own bytes object, like separately received tasks
+        queue.enqueue(number.to_bytes(8, "little") * (payload // 8))
+    enqueue_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while not queue.is_empty():
+        queue.dequeue()
+    dequeue_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return enqueue_time, dequeue_time, peak / 2**20
+
+
+def main():
+    """
+    Run the workload on both queues and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Disk-spilling queue benchmark")
+    parser.add_argument("--memory-items", type=int, default=50_000,
+                        help="in-memory cap of the spilling queue")
+    parser.add_argument("--factor", type=int, default=10, help="backlog size as a multiple of the cap")
+    parser.add_argument("--payload", type=int, default=100, help="bytes per element")
+    args = parser.parse_args()
+
+    backlog = args.memory_items * args.factor
+    print(f"backlog = {backlog:,} elements of {args.payload} bytes, "
+          f"memory cap = {args.memory_items:,} elements")
+    print(f"{'queue':<14} {'enqueue/s':>11} {'dequeue/s':>11} {'peak MiB':>9}")
+
+    enqueue_time, dequeue_time, peak = fill_and_drain(Queue(), backlog, args.payload)
+    print(f"{'Queue':<14} {backlog / enqueue_time:>11,.0f} {backlog / dequeue_time:>11,.0f} {peak:>9.1f}")
+
+    with SpillingQueue(memory_items=args.memory_items) as queue:
+        enqueue_time, dequeue_time, peak = fill_and_drain(queue, backlog, args.payload)
+    print(f"{'SpillingQueue':<14} {backlog / enqueue_time:>11,.0f} {backlog / dequeue_time:>11,.0f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Unrolled Linked List Benchmark
+
+Compares LinkedList with UnrolledLinkedList at several block sizes (K):
+bytes per element (measured with tracemalloc), a full iteration, and a
+search for a value that is not in the list, which scans every element.
+
+Run from the project root:
+
+    python -m benchmarks.unrolled_scan [--size 1000000] [--block-sizes 16 64 256]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from linkedlist import LinkedList
+from unrolledlist import UnrolledLinkedList
+
+
+def build_measured(factory, size):
+    """
+    Build a structure holding range(size) and measure the memory it keeps.
+
+    The integers are allocated before tracing starts, so only the
+    structure's own nodes and blocks are counted.
+
+    Args:
+        factory: Callable returning an empty structure
+        size (int): Number of elements
+
+    Returns:
+        tuple: (structure, bytes per element)
+    """
+    values = list(range(size))
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    structure = factory()
+    structure.extend(values)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, (after - before) / size
+
+
+def time_scans(structure, repeat):
+    """
+    Time a full iteration and a missing-value search.
+
+    Args:
+        structure: A populated LinkedList or UnrolledLinkedList
+        repeat (int): Number of runs; the best is kept
+
+    Returns:
+        tuple: (iteration ms, search ms)
+    """
+    iterate_times = []
+    search_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in structure:
+            pass
+        iterate_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        structure.search(-1)
+        search_times.append(time.perf_counter() - start)
+    return min(iterate_times) * 1e3, min(search_times) * 1e3
+
+
+def main():
+    """
+    Measure every configuration and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Unrolled linked list memory and scan benchmark")
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of elements")
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[16, 64, 256],
+                        help="block sizes (K) to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per scan (best is kept)")
+    args = parser.parse_args()
+
+    configurations = [("LinkedList", LinkedList)]
+    for block_size in args.block_sizes:
+        configurations.append((f"Unrolled K={block_size}",
+                               lambda block_size=block_size: UnrolledLinkedList(block_size=block_size)))
+
+    print(f"N = {args.size:,}")
+    print(f"{'structure':<18} {'bytes/elem':>10} {'iterate ms':>11} {'search ms':>10}")
+    for name, factory in configurations:
+        structure, per_element = build_measured(factory, args.size)
+        iterate_ms, search_ms = time_scans(structure, args.repeat)
+        print(f"{name:<18} {per_element:>10.1f} {iterate_ms:>11.1f} {search_ms:>10.1f}")
+        del structure
+
+
+if __name__ == "__main__":
+    main()
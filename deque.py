@@ -0,0 +1,429 @@
+"""
+Deque Data Structure Implementation
+
+This module implements a double-ended queue (Deque) on top of the growable
+ring buffer (see ringbuffer.py). Elements can be added and removed at both
+ends in O(1), the contents can be rotated, and an optional maxlen turns the
+deque into a sliding window that evicts from the far end when full.
+
+Besides its own reported API (push_front, pop_back, ...), a Deque offers
+the unreported collections.deque-style methods (append, appendleft, pop,
+popleft, extend) so it can be used as the storage engine of a Stack or a
+Queue:
+
+    history = Stack(storage=Deque(maxlen=100))
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+from events import Event, PrintSink, get_default_sink
+from ringbuffer import RingBuffer
+
+
+class Deque:
+    """
+    A double-ended queue using a circular buffer as the underlying data structure.
+
+    The Deque class provides these operations, all O(1) unless noted:
+    - push_front / push_back: Add an element at either end
+    - pop_front / pop_back: Remove and return the element at either end
+    - peek_front / peek_back: View the element at either end
+    - rotate: Rotate the elements k steps (O(min(k, n - k)))
+    - is_empty / size / display / clear
+
+    When maxlen is set and the deque is full, pushing at one end evicts
+    the element at the other end, as collections.deque does.
+
+    Attributes:
+        _items (RingBuffer): Internal circular buffer to store deque elements
+        _maxlen (int): Maximum number of elements (None means unbounded)
+        sink: Callable receiving an Event per operation (None = silent)
+    """
+
+    __slots__ = ("_items", "_maxlen", "sink")
+
+    def __init__(self, iterable=(), maxlen=None, sink=None):
+        """
+        Initialize a deque, optionally filled from an iterable.
+
+        Args:
+            iterable: Elements to add at the back in order (default: empty)
+            maxlen (int): Maximum number of elements (default: unbounded)
+            sink: Event sink for operation reports (default: the module default from events.py)
+
+        Raises:
+            ValueError: If maxlen is negative
+        """
+        if maxlen is not None and maxlen < 0:
+            raise ValueError(f"maxlen must be non-negative, got {maxlen}")
+        self._items = RingBuffer()
+        self._maxlen = maxlen
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
+        self.extend(iterable)
+
+    @property
+    def maxlen(self):
+        """
+        The maximum number of elements, or None if the deque is unbounded.
+
+        Returns:
+            int: The maxlen given to the constructor
+        """
+        return self._maxlen
+
+    def _report_eviction(self, evicted):
+        """
+        Report an element dropped because the deque was full.
+
+        Args:
+            evicted: The element that was dropped
+        """
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "evict", f"Evicted '{evicted}' from the full deque", evicted))
+
+    def push_front(self, item):
+        """
+        Add an element at the front of the deque.
+
+        If the deque is at maxlen, the back element is evicted first.
+
+        Args:
+            item: The element to be added
+
+        Returns:
+            None
+        """
+        if self._maxlen == 0:
+            self._report_eviction(item)
+            return
+        if self._maxlen is not None and len(self._items) >= self._maxlen:
+            self._report_eviction(self._items.pop())
+        self._items.appendleft(item)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "push_front", f"Pushed '{item}' to the front of the deque", item))
+
+    def push_back(self, item):
+        """
+        Add an element at the back of the deque.
+
+        If the deque is at maxlen, the front element is evicted first.
+
+        Args:
+            item: The element to be added
+
+        Returns:
+            None
+        """
+        if self._maxlen == 0:
+            self._report_eviction(item)
+            return
+        if self._maxlen is not None and len(self._items) >= self._maxlen:
+            self._report_eviction(self._items.popleft())
+        self._items.append(item)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "push_back", f"Pushed '{item}' to the back of the deque", item))
+
+    def pop_front(self):
+        """
+        Remove and return the front element.
+
+        Returns:
+            The front element
+
+        Raises:
+            IndexError: If the deque is empty (underflow condition)
+        """
+        if self.is_empty():
+            raise IndexError("Cannot pop from an empty deque (Deque Underflow)")
+
+        popped_item = self._items.popleft()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "pop_front", f"Popped '{popped_item}' from the front of the deque", popped_item))
+        return popped_item
+
+    def pop_back(self):
+        """
+        Remove and return the back element.
+
+        Returns:
+            The back element
+
+        Raises:
+            IndexError: If the deque is empty (underflow condition)
+        """
+        if self.is_empty():
+            raise IndexError("Cannot pop from an empty deque (Deque Underflow)")
+
+        popped_item = self._items.pop()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "pop_back", f"Popped '{popped_item}' from the back of the deque", popped_item))
+        return popped_item
+
+    def peek_front(self):
+        """
+        Return the front element without removing it.
+
+        Returns:
+            The front element
+
+        Raises:
+            IndexError: If the deque is empty
+        """
+        if self.is_empty():
+            raise IndexError("Cannot peek at an empty deque")
+
+        front_item = self._items[0]
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "peek_front", f"Front element is '{front_item}'", front_item))
+        return front_item
+
+    def peek_back(self):
+        """
+        Return the back element without removing it.
+
+        Returns:
+            The back element
+
+        Raises:
+            IndexError: If the deque is empty
+        """
+        if self.is_empty():
+            raise IndexError("Cannot peek at an empty deque")
+
+        back_item = self._items[-1]
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "peek_back", f"Back element is '{back_item}'", back_item))
+        return back_item
+
+    def rotate(self, k=1):
+        """
+        Rotate the deque k steps to the right (to the left if k is negative).
+
+        Rotating one step to the right moves the back element to the front.
+
+        Args:
+            k (int): Number of steps to rotate (default: 1)
+
+        Returns:
+            None
+        """
+        self._items.rotate(k)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "rotate", f"Rotated the deque by {k}", k))
+
+    def is_empty(self):
+        """
+        Check if the deque is empty.
+
+        Returns:
+            bool: True if deque is empty, False otherwise
+        """
+        return len(self._items) == 0
+
+    def size(self):
+        """
+        Get the number of elements in the deque.
+
+        Returns:
+            int: Number of elements in the deque
+        """
+        deque_size = len(self._items)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Deque size: {deque_size}", deque_size))
+        return deque_size
+
+    def display(self):
+        """
+        Display the current contents of the deque from front to back.
+
+        Returns:
+            None
+        """
+        if self.is_empty():
+            print("Deque is empty: []")
+        else:
+            print(f"Deque contents (front to back): {list(self._items)}")
+            print(f"Front -> {self._items[0]}, Back -> {self._items[-1]}")
+
+    def clear(self):
+        """
+        Remove all elements from the deque.
+
+        Returns:
+            None
+        """
+        self._items.clear()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Deque has been cleared", None))
+
+    # Storage engine interface: collections.deque-style methods without events
+
+    def append(self, item):
+        """
+        Add an element at the back without reporting it (evicts at the front when full).
+
+        Args:
+            item: The element to be added
+        """
+        if self._maxlen is not None and len(self._items) >= self._maxlen:
+            if self._maxlen == 0:
+                return
+            self._items.popleft()
+        self._items.append(item)
+
+    def appendleft(self, item):
+        """
+        Add an element at the front without reporting it (evicts at the back when full).
+
+        Args:
+            item: The element to be added
+        """
+        if self._maxlen is not None and len(self._items) >= self._maxlen:
+            if self._maxlen == 0:
+                return
+            self._items.pop()
+        self._items.appendleft(item)
+
+    def pop(self):
+        """
+        Remove and return the back element without reporting it.
+
+        Returns:
+            The back element
+
+        Raises:
+            IndexError: If the deque is empty
+        """
+        return self._items.pop()
+
+    def popleft(self):
+        """
+        Remove and return the front element without reporting it.
+
+        Returns:
+            The front element
+
+        Raises:
+            IndexError: If the deque is empty
+        """
+        return self._items.popleft()
+
+    def extend(self, iterable):
+        """
+        Add every element of an iterable at the back without reporting them.
+
+        Without a maxlen the elements are copied in bulk by the ring buffer;
+        with one, elements that do not fit evict from the front.
+
+        Args:
+            iterable: Elements to add in order
+
+        Returns:
+            int: Number of elements added
+        """
+        if self._maxlen is None:
+            return self._items.extend(iterable)
+        added = 0
+        for item in iterable:
+            self.append(item)
+            added += 1
+        return added
+
+    def popleft_many(self, n):
+        """
+        Remove and return up to n elements from the front without reporting them.
+
+        Args:
+            n (int): Maximum number of elements to remove
+
+        Returns:
+            list: The removed elements in front-to-back order
+        """
+        return self._items.popleft_many(n)
+
+    def __len__(self):
+        """
+        Return the number of elements, enabling len(deque).
+
+        Returns:
+            int: Number of elements in the deque
+        """
+        return len(self._items)
+
+    def __getitem__(self, index):
+        """
+        Return the element at an index (0 is the front, -1 the back).
+
+        Args:
+            index (int): Position relative to the front (negative counts from the back)
+
+        Returns:
+            The element at the given position
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        return self._items[index]
+
+    def __iter__(self):
+        """
+        Iterate over the elements from front to back without removing them.
+
+        Returns:
+            iterator: Iterator over the deque elements
+        """
+        return iter(self._items)
+
+    def __reversed__(self):
+        """
+        Iterate over the elements from back to front without removing them.
+
+        Returns:
+            iterator: Reverse iterator over the deque elements
+        """
+        return reversed(self._items)
+
+    def __contains__(self, item):
+        """
+        Check whether an element is in the deque, enabling `item in deque`.
+
+        Args:
+            item: The element to look for
+
+        Returns:
+            bool: True if an equal element is in the deque
+        """
+        return item in self._items
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    print("=== Deque Data Structure Demo ===")
+
+    deque = Deque(maxlen=4, sink=PrintSink())
+
+    print("\n1. Testing push operations at both ends:")
+    deque.push_back("B")
+    deque.push_back("C")
+    deque.push_front("A")
+    deque.display()
+
+    print("\n2. Testing maxlen eviction:")
+    deque.push_back("D")
+    deque.push_back("E")
+    deque.display()
+
+    print("\n3. Testing rotate and peek operations:")
+    deque.rotate(1)
+    deque.peek_front()
+    deque.peek_back()
+    deque.display()
+
+    print("\n4. Testing pop operations at both ends:")
+    deque.pop_front()
+    deque.pop_back()
+    deque.display()
+
+    print("\n=== Deque Demo Complete ===")
@@ -0,0 +1,542 @@
+"""
+Doubly Linked List Data Structure Implementation
+
+This module implements a Doubly Linked List on top of the singly linked
+LinkedList. Every node also keeps a reference to its previous node, so a
+node can be unlinked without searching for its predecessor. The insert
+methods return the new node as a stable handle: it stays valid while the
+element is in the list, and remove/insert_after/insert_before/move_to_front
+with a handle all run in O(1). This is the bookkeeping needed for LRU
+caches and for cancelling queued work mid-flight.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+from events import Event, PrintSink
+from linkedlist import LinkedList, Node
+
+
+class DoublyNode(Node):
+    """
+    A linked list node that also references its previous node.
+
+    Attributes:
+        data: The value stored in the node (can be any data type)
+        next: Reference to the next node in the list (None if last node)
+        prev: Reference to the previous node in the list (None if first node)
+        owner (DoublyLinkedList): The list the node is linked into (None once removed)
+    """
+
+    __slots__ = ("prev", "owner")
+
+    def __init__(self, data):
+        """
+        Initialize a new, unlinked node with given data.
+
+        Args:
+            data: The value to be stored in the node
+        """
+        super().__init__(data)
+        # Initialize prev and owner as None (will be set when node is linked)
+        self.prev = None
+        self.owner = None
+
+
+class DoublyLinkedList(LinkedList):
+    """
+    A Doubly Linked List with the LinkedList API plus O(1) node-handle operations.
+
+    Besides the inherited operations, the DoublyLinkedList provides:
+    - insert_after / insert_before: Insert next to a node handle
+    - remove: Unlink a node handle
+    - move_to_front / move_to_end: Relocate a node handle
+    - find: Get the handle of the first node holding a value
+
+    Insert methods return the handle of the new node. Deleting near the tail
+    and positional access walk from whichever end is closer.
+
+    Unlike LinkedList there is no indexed= option, so the inherited indexed
+    property is always False.
+
+    Attributes:
+        head (DoublyNode): Reference to the first node in the list
+        tail (DoublyNode): Reference to the last node in the list
+        _size (int): Internal counter for the number of elements
+        sink: Callable receiving an Event per operation (None = silent)
+    """
+
+    __slots__ = ()
+
+    def __init__(self, sink=None):
+        """
+        Initialize an empty doubly linked list.
+
+        The value index of LinkedList (indexed=True) is not offered here:
+        handles already give O(1) removal once an element has been found.
+
+        Args:
+            sink: Event sink for operation reports (default: the module default from events.py)
+        """
+        super().__init__(sink=sink)
+
+    def _link(self, node, previous, following):
+        """
+        Link an unlinked node between two neighbouring nodes.
+
+        Args:
+            node (DoublyNode): The node to link in
+            previous (DoublyNode): Node that will precede it (None to make it the head)
+            following (DoublyNode): Node that will follow it (None to make it the tail)
+        """
+        node.prev = previous
+        node.next = following
+        node.owner = self
+        if previous is None:
+            self.head = node
+        else:
+            previous.next = node
+        if following is None:
+            self.tail = node
+        else:
+            following.prev = node
+        self._size += 1
+
+    def _unlink(self, node):
+        """
+        Unlink a node from its neighbours and detach it.
+
+        Args:
+            node (DoublyNode): The node to unlink
+        """
+        previous = node.prev
+        following = node.next
+        if previous is None:
+            self.head = following
+        else:
+            previous.next = following
+        if following is None:
+            self.tail = previous
+        else:
+            following.prev = previous
+        # A detached node has no neighbours and no owner, so _check_handle rejects it
+        node.prev = None
+        node.next = None
+        node.owner = None
+        self._size -= 1
+
+    def _check_handle(self, node):
+        """
+        Reject handles of nodes that are not linked into this list.
+
+        Args:
+            node (DoublyNode): The handle to check
+
+        Raises:
+            ValueError: If the node has been removed or belongs to another list
+        """
+        if node.owner is not self:
+            raise ValueError(f"Node '{node.data}' is not in the list")
+
+    def _node_at(self, position):
+        """
+        Return the node at a valid position, walking from the closer end.
+
+        Args:
+            position (int): The position to access (0-indexed)
+
+        Returns:
+            DoublyNode: The node at that position
+        """
+        if position < self._size // 2:
+            current = self.head
+            for i in range(position):
+                current = current.next
+        else:
+            current = self.tail
+            for i in range(self._size - 1 - position):
+                current = current.prev
+        return current
+
+    def insert_at_beginning(self, data):
+        """
+        Insert a new node at the beginning of the list.
+
+        Args:
+            data: The value to be inserted
+
+        Returns:
+            DoublyNode: Handle of the new node
+        """
+        new_node = DoublyNode(data)
+        self._link(new_node, None, self.head)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_beginning", f"Inserted '{data}' at the beginning of the list", data))
+        return new_node
+
+    def insert_at_end(self, data):
+        """
+        Insert a new node at the end of the list.
+
+        Args:
+            data: The value to be inserted
+
+        Returns:
+            DoublyNode: Handle of the new node
+        """
+        new_node = DoublyNode(data)
+        self._link(new_node, self.tail, None)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_end", f"Inserted '{data}' at the end of the list", data))
+        return new_node
+
+    def insert_at_position(self, data, position):
+        """
+        Insert a new node at a specific position in the list.
+
+        The insertion point is reached from the closer end of the list.
+
+        Args:
+            data: The value to be inserted
+            position (int): The position where to insert (0-indexed)
+
+        Returns:
+            DoublyNode: Handle of the new node
+
+        Raises:
+            IndexError: If position is negative or greater than list size
+        """
+        # Validate position
+        if position < 0 or position > self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        # If inserting at beginning, use specialized method
+        if position == 0:
+            return self.insert_at_beginning(data)
+
+        new_node = DoublyNode(data)
+        if position == self._size:
+            self._link(new_node, self.tail, None)
+        else:
+            following = self._node_at(position)
+            self._link(new_node, following.prev, following)
+
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_position", f"Inserted '{data}' at position {position}", data))
+        return new_node
+
+    def insert_after(self, node, data):
+        """
+        Insert a new node directly after a node handle in O(1).
+
+        Args:
+            node (DoublyNode): Handle of a node in this list
+            data: The value to be inserted
+
+        Returns:
+            DoublyNode: Handle of the new node
+
+        Raises:
+            ValueError: If the handle has been removed or belongs to another list
+        """
+        self._check_handle(node)
+        new_node = DoublyNode(data)
+        self._link(new_node, node, node.next)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_after", f"Inserted '{data}' after '{node.data}'", data))
+        return new_node
+
+    def insert_before(self, node, data):
+        """
+        Insert a new node directly before a node handle in O(1).
+
+        Args:
+            node (DoublyNode): Handle of a node in this list
+            data: The value to be inserted
+
+        Returns:
+            DoublyNode: Handle of the new node
+
+        Raises:
+            ValueError: If the handle has been removed or belongs to another list
+        """
+        self._check_handle(node)
+        new_node = DoublyNode(data)
+        self._link(new_node, node.prev, node)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_before", f"Inserted '{data}' before '{node.data}'", data))
+        return new_node
+
+    def extend(self, iterable):
+        """
+        Insert every element of an iterable at the end of the list.
+
+        Args:
+            iterable: The values to be inserted, in order
+
+        Returns:
+            int: Number of values inserted
+        """
+        added_count = 0
+        for data in iterable:
+            self._link(DoublyNode(data), self.tail, None)
+            added_count += 1
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend",
+                            f"Inserted {added_count} items at the end of the list", added_count))
+        return added_count
+
+    def extend_left(self, iterable):
+        """
+        Insert every element of an iterable at the beginning of the list.
+
+        Like collections.deque.extendleft(), the values end up in reverse order.
+
+        Args:
+            iterable: The values to be inserted
+
+        Returns:
+            int: Number of values inserted
+        """
+        added_count = 0
+        for data in iterable:
+            self._link(DoublyNode(data), None, self.head)
+            added_count += 1
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend_left",
+                            f"Inserted {added_count} items at the beginning of the list",
+                            added_count))
+        return added_count
+
+    def remove(self, node):
+        """
+        Unlink a node handle from the list in O(1).
+
+        Args:
+            node (DoublyNode): Handle of a node in this list
+
+        Returns:
+            The data of the removed node
+
+        Raises:
+            ValueError: If the handle has already been removed or belongs to another list
+        """
+        self._check_handle(node)
+        self._unlink(node)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "remove", f"Removed '{node.data}' from the list", node.data))
+        return node.data
+
+    def move_to_front(self, node):
+        """
+        Move a node handle to the beginning of the list in O(1).
+
+        The handle stays valid; this is the "touch" step of an LRU cache.
+
+        Args:
+            node (DoublyNode): Handle of a node in this list
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the handle has been removed or belongs to another list
+        """
+        self._check_handle(node)
+        if node is not self.head:
+            self._unlink(node)
+            self._link(node, None, self.head)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "move_to_front", f"Moved '{node.data}' to the front of the list", node.data))
+
+    def move_to_end(self, node):
+        """
+        Move a node handle to the end of the list in O(1).
+
+        Args:
+            node (DoublyNode): Handle of a node in this list
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the handle has been removed or belongs to another list
+        """
+        self._check_handle(node)
+        if node is not self.tail:
+            self._unlink(node)
+            self._link(node, self.tail, None)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "move_to_end", f"Moved '{node.data}' to the end of the list", node.data))
+
+    def find(self, data):
+        """
+        Return the handle of the first node holding a value.
+
+        Args:
+            data: The value to look for
+
+        Returns:
+            DoublyNode: Handle of the first matching node, or None if not found
+        """
+        current = self.head
+        while current is not None:
+            if current.data == data:
+                return current
+            current = current.next
+        return None
+
+    def delete_by_value(self, data):
+        """
+        Delete the first occurrence of a node with the given value.
+
+        Args:
+            data: The value to be deleted
+
+        Returns:
+            bool: True if deletion was successful, False if value not found
+        """
+        # Check if list is empty
+        if self.head is None:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Cannot delete '{data}': List is empty", data))
+            return False
+
+        node = self.find(data)
+        if node is None:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Value '{data}' not found in the list", data))
+            return False
+
+        self._unlink(node)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_by_value", f"Deleted '{data}' from the list", data))
+        return True
+
+    def delete_at_position(self, position):
+        """
+        Delete a node at a specific position in the list.
+
+        The node is reached from the closer end, so deleting near the tail
+        does not walk the whole list.
+
+        Args:
+            position (int): The position of the node to delete (0-indexed)
+
+        Returns:
+            The data of the deleted node
+
+        Raises:
+            IndexError: If position is invalid or list is empty
+        """
+        # Check if list is empty
+        if self.head is None:
+            raise IndexError("Cannot delete from an empty list")
+
+        # Validate position
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        node = self._node_at(position)
+        self._unlink(node)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_at_position", f"Deleted '{node.data}' from position {position}", node.data))
+        return node.data
+
+    def clear(self):
+        """
+        Remove all elements from the list.
+
+        Every node is detached so that handles kept from before the clear
+        are rejected instead of corrupting the empty list; this makes
+        clear() O(n).
+
+        Returns:
+            None
+        """
+        current = self.head
+        while current is not None:
+            following = current.next
+            current.prev = None
+            current.next = None
+            current.owner = None
+            current = following
+        super().clear()
+
+    def get_at_position(self, position):
+        """
+        Get the data at a specific position, walking from the closer end.
+
+        Args:
+            position (int): The position to access (0-indexed)
+
+        Returns:
+            The data at the specified position
+
+        Raises:
+            IndexError: If position is invalid
+        """
+        # Validate position
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        current = self._node_at(position)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "get_at_position", f"Element at position {position}: {current.data}", current.data))
+        return current.data
+
+    def display(self):
+        """
+        Display the current contents of the list, linked in both directions.
+
+        Returns:
+            None
+        """
+        if self.head is None:
+            print("Doubly Linked List is empty: []")
+            return
+
+        values = [str(data) for data in self]
+        print(f"Doubly Linked List: None <- {' <-> '.join(values)} -> None")
+        print(f"Head: {self.head.data}, Tail: {self.tail.data}")
+
+    def __reversed__(self):
+        """
+        Iterate over the node values from tail to head by following prev references.
+
+        Yields:
+            The data of each node in reverse order
+        """
+        current = self.tail
+        while current is not None:
+            yield current.data
+            current = current.prev
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    print("=== Doubly Linked List Data Structure Demo ===")
+
+    # Create a new doubly linked list instance
+    doubly_linked_list = DoublyLinkedList(sink=PrintSink())
+
+    # Test insertion operations, keeping the returned handles
+    print("\n1. Testing insertion operations:")
+    first = doubly_linked_list.insert_at_end("First")
+    last = doubly_linked_list.insert_at_end("Last")
+    middle = doubly_linked_list.insert_after(first, "Middle")
+    doubly_linked_list.display()
+
+    # Test handle operations
+    print("\n2. Testing handle operations:")
+    doubly_linked_list.move_to_front(last)
+    doubly_linked_list.insert_before(middle, "Before Middle")
+    doubly_linked_list.display()
+
+    # Test removal by handle
+    print("\n3. Testing removal by handle:")
+    doubly_linked_list.remove(middle)
+    doubly_linked_list.display()
+    print(f"Reversed: {list(reversed(doubly_linked_list))}")
+
+    print("\n=== Doubly Linked List Demo Complete ===")
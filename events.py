@@ -0,0 +1,113 @@
+"""
+Operation Event Sinks
+
+This module defines the observer hook the data structures use to report
+their operations. Every structure holds a `sink`: a callable that receives
+an Event describing each operation. The default sink is None, which keeps
+the hot path silent - no message is formatted and nothing is written.
+
+Printing and logging are opt-in sinks:
+
+    stack = Stack(sink=PrintSink())          # per-instance
+    set_default_sink(LoggingSink())          # every structure created afterwards
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import logging
+from collections import namedtuple
+
+
+# A single reported operation:
+#   structure: Name of the reporting class (e.g. "Stack")
+#   operation: Name of the operation (e.g. "push")
+#   message:   Human-readable description of what happened
+#   value:     The element involved, or the relevant count/position
+Event = namedtuple("Event", ["structure", "operation", "message", "value"])
+
+
+# Sink given to structures created without an explicit one (None = silent)
+_default_sink = None
+
+
+def set_default_sink(sink):
+    """
+    Set the module-level sink used by structures created without a sink.
+
+    Structures pick up the default when they are constructed, so changing
+    it does not affect existing instances.
+
+    Args:
+        sink: A callable taking an Event, or None to disable reporting
+    """
+    global _default_sink
+    _default_sink = sink
+
+
+def get_default_sink():
+    """
+    Get the module-level default sink.
+
+    Returns:
+        The current default sink, or None if reporting is disabled
+    """
+    return _default_sink
+
+
+class PrintSink:
+    """
+    A sink that prints each event's message to standard output.
+
+    This reproduces the verbose console output used by the demonstrations.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, event):
+        """
+        Print the event message.
+
+        Args:
+            event (Event): The reported operation
+        """
+        print(event.message)
+
+
+class LoggingSink:
+    """
+    A sink that forwards events to the standard logging module.
+
+    The structure, operation and value are attached to each log record as
+    extra attributes so structured log handlers can pick them up.
+
+    Attributes:
+        logger (logging.Logger): Logger receiving the records
+        level (int): Log level used for every record
+    """
+
+    __slots__ = ("logger", "level")
+
+    def __init__(self, logger=None, level=logging.INFO):
+        """
+        Initialize the sink.
+
+        Args:
+            logger (logging.Logger): Target logger (default: the "datastructures" logger)
+            level (int): Log level for the records (default: logging.INFO)
+        """
+        self.logger = logger if logger is not None else logging.getLogger("datastructures")
+        self.level = level
+
+    def __call__(self, event):
+        """
+        Log the event message with its fields as record attributes.
+
+        Args:
+            event (Event): The reported operation
+        """
+        self.logger.log(self.level, event.message, extra={
+            "structure": event.structure,
+            "operation": event.operation,
+            "value": event.value,
+        })
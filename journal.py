@@ -0,0 +1,595 @@
+"""
+Write-Ahead Journal for Crash-Consistent Structures
+
+This module adds an optional append-only journal (write-ahead log) to the
+Stack, Queue and LinkedList. A JournaledStructure wraps a structure and
+appends every mutating call (push, enqueue, delete_at_position, ...) to a
+journal file as it applies it. After a crash or restart, the structure
+is rebuilt from the last snapshot plus the calls journaled since then.
+
+    tasks = JournaledStructure(Queue, "state/tasks", fsync="batch")
+    tasks.enqueue("Email Report")      # applied and journaled
+    tasks.dequeue()
+    tasks.close()
+
+    tasks = JournaledStructure(Queue, "state/tasks")   # replays the journal
+
+Each record is a 4-byte length and a CRC32 checksum (little-endian)
+followed by a pickle of (operation, args, kwargs, failed). failed is None
+for a call that returned, and the exception class name for a call that
+raised, since it may have changed the structure before raising (e.g. a
+push_many that stopped halfway). Replay streams the file record by
+record and stops at the first torn or corrupt record, which is what a
+crash in the middle of a write leaves behind. A replayed call may only
+raise the exception it raised originally; any other error (a corrupt
+record that still passed its checksum, a method whose signature changed
+between versions, ...) stops recovery.
+
+Durability is chosen with the fsync policy:
+- "always": every call returns only after its record is fsynced. Calls
+  from several threads that wait at the same time share one fsync (group
+  commit).
+- "batch": records are written and fsynced together once batch_size
+  records are pending or batch_interval seconds have passed since the last
+  commit (checked on each call), and on commit() and close().
+- "never": records are written in batches but never fsynced; the
+  operating system decides when they reach the disk.
+
+Compaction writes a snapshot (see persistence.py) and starts an empty
+journal. Files carry a generation number, snapshot-G.bin and
+journal-G.log, and recovery loads the newest snapshot and replays only
+the journal of the same generation, so a crash in the middle of a
+compaction never replays a call twice.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import os
+import pickle
+import re
+import struct
+import threading
+import time
+import zlib
+
+from linkedlist import LinkedList
+from persistence import write_snapshot
+from queue import Queue
+from stack import Stack
+
+
+# Length and CRC32 of the record payload
+_RECORD_HEADER = struct.Struct("<II")
+
+FSYNC_POLICIES = ("always", "batch", "never")
+
+# Methods that change each structure family and are journaled
+MUTATORS = {
+    "stack": frozenset({"push", "pop", "push_many", "pop_many", "clear"}),
+    "queue": frozenset({"enqueue", "dequeue", "enqueue_many", "dequeue_many",
+                        "requeue_front", "clear"}),
+    "linkedlist": frozenset({"insert_at_beginning", "insert_at_end", "insert_at_position",
+                             "extend", "extend_left", "delete_by_value",
+                             "delete_at_position", "clear"}),
+}
+
+# Bulk methods whose iterable argument is materialized before journaling
+_BULK_METHODS = frozenset({"push_many", "enqueue_many", "extend", "extend_left"})
+
+_SNAPSHOT_NAME = re.compile(r"snapshot-(\d+)\.bin$")
+
+
+class Journal:
+    """
+    An append-only file of operation records with group commit.
+
+    Appending only queues the encoded record in memory; commit() writes
+    every queued record with one write() and, unless the policy is
+    "never", one fsync(). Commits are serialized, so a thread that finds
+    its record already committed by another thread returns at once.
+
+    Attributes:
+        path (str): The journal file
+        fsync (str): Durability policy: "always", "batch" or "never"
+        batch_size (int): Pending records that trigger a commit ("batch" and "never")
+        batch_interval (float): Seconds since the last commit that trigger one ("batch" and "never")
+        _file: The journal file, opened for appending
+        _pending (list): Encoded records not yet written
+        _appended (int): Sequence number of the last appended record
+        _committed (int): Sequence number of the last committed record
+        _last_commit (float): time.monotonic() of the last commit
+        _lock (threading.Lock): Guards the pending records and counters
+        _commit_lock (threading.Lock): Serializes commits
+    """
+
+    __slots__ = ("path", "fsync", "batch_size", "batch_interval", "_file", "_pending",
+                 "_appended", "_committed", "_last_commit", "_lock", "_commit_lock")
+
+    def __init__(self, path, fsync="batch", batch_size=64, batch_interval=0.05):
+        """
+        Open (or create) a journal file for appending.
+
+        Args:
+            path (str): The journal file
+            fsync (str): Durability policy: "always", "batch" or "never" (default: "batch")
+            batch_size (int): Pending records that trigger a commit (default: 64)
+            batch_interval (float): Seconds after which pending records are committed (default: 0.05)
+
+        Raises:
+            ValueError: If fsync is not a known policy
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got '{fsync}'")
+        self.path = path
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._file = open(path, "ab")
+        self._pending = []
+        self._appended = 0
+        self._committed = 0
+        self._last_commit = time.monotonic()
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+
+    @property
+    def record_count(self):
+        """
+        Number of records in the journal, including records not yet committed.
+
+        Returns:
+            int: Records replayed from the file plus records appended since
+        """
+        return self._appended
+
+    def replay(self):
+        """
+        Stream the records already in the file, oldest first.
+
+        Records are read one at a time. Reading stops at the first torn or
+        corrupt record; once the records are exhausted, the file is
+        truncated after the last good one so new records follow it.
+
+        Yields:
+            tuple: (operation, args, kwargs, failed) for each record
+        """
+        valid_end = 0
+        count = 0
+        with open(self.path, "rb") as journal_file:
+            while True:
+                header = journal_file.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    break
+                length, checksum = _RECORD_HEADER.unpack(header)
+                payload = journal_file.read(length)
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+                valid_end += _RECORD_HEADER.size + length
+                count += 1
+                yield pickle.loads(payload)
+        self._file.truncate(valid_end)
+        self._appended = self._committed = count
+
+    @staticmethod
+    def encode(operation, args=(), kwargs=None, failed=None):
+        """
+        Encode a record for an operation without queuing it.
+
+        Encoding before a call is applied rejects arguments that cannot be
+        pickled while the structure is still unchanged.
+
+        Args:
+            operation (str): Name of the method called
+            args (tuple): Positional arguments of the call
+            kwargs (dict): Keyword arguments of the call (default: none)
+            failed (str): Name of the exception the call raised (default: None, it returned)
+
+        Returns:
+            bytes: The record, header included
+        """
+        payload = pickle.dumps((operation, args, kwargs or {}, failed), pickle.HIGHEST_PROTOCOL)
+        return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def append(self, operation, args=(), kwargs=None, failed=None):
+        """
+        Queue a record for an operation.
+
+        Under the "batch" and "never" policies, this commits when batch_size
+        records are pending or batch_interval has passed. Under "always",
+        call wait_committed() with the returned sequence number.
+
+        Args:
+            operation (str): Name of the method called
+            args (tuple): Positional arguments of the call
+            kwargs (dict): Keyword arguments of the call (default: none)
+            failed (str): Name of the exception the call raised (default: None, it returned)
+
+        Returns:
+            int: Sequence number of the record
+        """
+        return self.append_record(self.encode(operation, args, kwargs, failed))
+
+    def append_record(self, record):
+        """
+        Queue a record made by encode(); see append().
+
+        Args:
+            record (bytes): The encoded record
+
+        Returns:
+            int: Sequence number of the record
+        """
+        with self._lock:
+            self._pending.append(record)
+            self._appended += 1
+            sequence = self._appended
+            due = self.fsync != "always" and (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_commit >= self.batch_interval)
+        if due:
+            self.commit()
+        return sequence
+
+    def wait_committed(self, sequence):
+        """
+        Return once the record with the given sequence number is committed.
+
+        If another thread's commit already covered the record this returns
+        at once; otherwise this thread commits every pending record.
+
+        Args:
+            sequence (int): Sequence number returned by append()
+        """
+        with self._commit_lock:
+            if self._committed < sequence:
+                self._commit_pending()
+
+    def commit(self):
+        """
+        Write every pending record and fsync the file (unless the policy is "never").
+
+        Returns:
+            None
+        """
+        with self._commit_lock:
+            self._commit_pending()
+
+    def _commit_pending(self):
+        """
+        Write out the pending records; the caller holds the commit lock.
+        """
+        with self._lock:
+            records, self._pending = self._pending, []
+            target = self._appended
+        if records:
+            self._file.write(b"".join(records))
+            self._file.flush()
+            if self.fsync != "never":
+                os.fsync(self._file.fileno())
+        self._committed = target
+        self._last_commit = time.monotonic()
+
+    def close(self):
+        """
+        Commit the pending records and close the file.
+
+        Returns:
+            None
+        """
+        self.commit()
+        self._file.close()
+
+
+class JournaledStructure:
+    """
+    A proxy that journals every mutating call of a Stack, Queue or LinkedList.
+
+    Creating the proxy recovers the structure from its directory: the
+    newest snapshot is loaded and the journal of the same generation is
+    replayed. Mutating calls (see MUTATORS) are then applied and appended
+    to the journal under one lock; every other attribute is read from the
+    wrapped structure directly. A call that raised (e.g. pop() on an empty
+    stack) is journaled with its exception name, because it may have
+    changed the structure first; on replay it must raise the same
+    exception, and any other replay error is raised from the constructor.
+    A BoundedStack's on_evict callback is attached only after recovery, so
+    elements evicted while replaying are not reported a second time.
+
+    Only the methods in MUTATORS are journaled. The thread-safe put/get API
+    of Queue and the node-handle methods of DoublyLinkedList bypass the
+    journal, so do not use them through the proxy.
+
+    Attributes:
+        directory (str): Directory holding the snapshot and journal files
+        compact_every (int): Compact automatically once the journal holds this many records (None = never)
+        _structure: The wrapped structure
+        _family (str): Structure family: "stack", "queue" or "linkedlist"
+        _journal (Journal): Journal of the current generation
+        _generation (int): Generation number of the current files
+        _journal_options (dict): fsync, batch_size and batch_interval for new journals
+        _lock (threading.Lock): Keeps journal order equal to apply order
+    """
+
+    __slots__ = ("directory", "compact_every", "_structure", "_family", "_journal",
+                 "_generation", "_journal_options", "_lock")
+
+    def __init__(self, cls, directory, fsync="batch", batch_size=64, batch_interval=0.05,
+                 compact_every=None, sink=None, **options):
+        """
+        Recover a journaled structure from a directory (empty if the directory is new).
+
+        Args:
+            cls: Structure class (Stack, Queue, LinkedList or a subclass)
+            directory (str): Directory for the snapshot and journal files
+            fsync (str): Durability policy: "always", "batch" or "never" (default: "batch")
+            batch_size (int): Pending records that trigger a commit (default: 64)
+            batch_interval (float): Seconds after which pending records are committed (default: 0.05)
+            compact_every (int): Journal length that triggers compact() (default: never)
+            sink: Event sink for the structure, attached after recovery
+            **options: Extra keyword arguments for the structure constructor
+                       (a BoundedStack's on_evict is attached after recovery)
+
+        Raises:
+            TypeError: If cls is not a Stack, Queue or LinkedList class
+            Exception: Whatever a replayed call raises that it did not raise originally
+        """
+        for family, base in (("stack", Stack), ("queue", Queue), ("linkedlist", LinkedList)):
+            if issubclass(cls, base):
+                self._family = family
+                break
+        else:
+            raise TypeError(f"Cannot journal {cls.__name__}; expected a Stack, Queue or LinkedList")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.compact_every = compact_every
+        self._journal_options = {"fsync": fsync, "batch_size": batch_size,
+                                 "batch_interval": batch_interval}
+        self._lock = threading.Lock()
+        # Evictions during recovery were already reported when the calls first ran
+        on_evict = options.pop("on_evict", None)
+
+        # Load the newest snapshot, if any, then replay its journal
+        generations = [int(match.group(1)) for match in map(_SNAPSHOT_NAME.match, os.listdir(directory))
+                       if match]
+        self._generation = max(generations, default=0)
+        snapshot_path = self._snapshot_path(self._generation)
+        if os.path.exists(snapshot_path):
+            self._structure = cls.load(snapshot_path, **options)
+        else:
+            self._structure = cls(**options)
+        self._journal = Journal(self._journal_path(self._generation), **self._journal_options)
+        for operation, args, kwargs, failed in self._journal.replay():
+            try:
+                getattr(self._structure, operation)(*args, **kwargs)
+            except Exception as error:
+                # Only the failure that was journaled is expected again
+                if type(error).__name__ != failed:
+                    self._journal.close()
+                    raise
+        self._remove_stale_files()
+        if on_evict is not None:
+            self._structure.on_evict = on_evict
+        if sink is not None:
+            self._structure.sink = sink
+
+    def _snapshot_path(self, generation):
+        """Return the snapshot file name of a generation."""
+        return os.path.join(self.directory, f"snapshot-{generation:08d}.bin")
+
+    def _journal_path(self, generation):
+        """Return the journal file name of a generation."""
+        return os.path.join(self.directory, f"journal-{generation:08d}.log")
+
+    def _remove_stale_files(self):
+        """
+        Delete files of older generations and leftover temporary files.
+        """
+        current = {os.path.basename(self._snapshot_path(self._generation)),
+                   os.path.basename(self._journal_path(self._generation))}
+        for name in os.listdir(self.directory):
+            if name not in current and (name.startswith(("snapshot-", "journal-"))):
+                os.remove(os.path.join(self.directory, name))
+
+    @property
+    def structure(self):
+        """
+        The wrapped structure (changes made to it directly are not journaled).
+
+        Returns:
+            The Stack, Queue or LinkedList being journaled
+        """
+        return self._structure
+
+    @property
+    def journal(self):
+        """
+        The journal of the current generation.
+
+        Returns:
+            Journal: The journal records are appended to
+        """
+        return self._journal
+
+    def _call(self, operation, args, kwargs):
+        """
+        Apply a mutating call, journal it, and wait for durability if required.
+
+        A call that raises is journaled too, with its exception name, and
+        the exception is re-raised once the record is queued (and, under
+        "always", committed).
+
+        Args:
+            operation (str): Name of the method
+            args (tuple): Positional arguments
+            kwargs (dict): Keyword arguments
+
+        Returns:
+            Whatever the structure method returns
+        """
+        if operation in _BULK_METHODS and args:
+            # A generator could only be consumed once: journal and apply the same list
+            args = (list(args[0]),) + args[1:]
+        failure = None
+        with self._lock:
+            journal = self._journal
+            # Encode first, so unpicklable arguments are rejected before anything changes
+            record = journal.encode(operation, args, kwargs)
+            try:
+                result = getattr(self._structure, operation)(*args, **kwargs)
+            except Exception as error:
+                failure = error
+                record = journal.encode(operation, args, kwargs, type(error).__name__)
+            sequence = journal.append_record(record)
+            if (failure is None and self.compact_every is not None
+                    and journal.record_count >= self.compact_every):
+                self._compact_locked()
+        if journal.fsync == "always":
+            journal.wait_committed(sequence)
+        if failure is not None:
+            raise failure
+        return result
+
+    def __getattr__(self, name):
+        """
+        Return journaled versions of mutating methods and everything else unchanged.
+
+        Args:
+            name (str): Attribute name
+
+        Returns:
+            The attribute of the wrapped structure, or a journaling wrapper for mutators
+        """
+        if name.startswith("_"):
+            # Private names are never forwarded (this also avoids recursion during __init__)
+            raise AttributeError(name)
+        attribute = getattr(self._structure, name)
+        if name not in MUTATORS[self._family]:
+            return attribute
+
+        def journaled(*args, **kwargs):
+            return self._call(name, args, kwargs)
+        journaled.__name__ = name
+        journaled.__doc__ = attribute.__doc__
+        return journaled
+
+    def commit(self):
+        """
+        Make every journaled call durable now, regardless of the fsync policy's batching.
+
+        Returns:
+            None
+        """
+        self._journal.commit()
+
+    def compact(self):
+        """
+        Write a snapshot of the current state and start an empty journal.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        """
+        Compact while holding the proxy lock.
+
+        The new snapshot is fsynced before the old generation's files are
+        deleted, so there is always a complete snapshot + journal pair.
+        """
+        self._journal.commit()
+        generation = self._generation + 1
+        write_snapshot(self._snapshot_path(generation), self._family, list(self._structure),
+                       durable=True)
+        old_journal = self._journal
+        self._journal = Journal(self._journal_path(generation), **self._journal_options)
+        self._generation = generation
+        old_journal.close()
+        self._remove_stale_files()
+
+    def close(self):
+        """
+        Commit the journal and close it.
+
+        Returns:
+            None
+        """
+        self._journal.close()
+
+    def __enter__(self):
+        """
+        Return the proxy itself for use in a with statement.
+
+        Returns:
+            JournaledStructure: This proxy
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the journal when the with block ends.
+        """
+        self.close()
+
+    def __len__(self):
+        """
+        Return the number of elements in the wrapped structure.
+
+        Returns:
+            int: Number of elements
+        """
+        return len(self._structure)
+
+    def __iter__(self):
+        """
+        Iterate over the wrapped structure.
+
+        Returns:
+            iterator: Iterator over the elements
+        """
+        return iter(self._structure)
+
+    def __contains__(self, item):
+        """
+        Check whether an element is in the wrapped structure.
+
+        Args:
+            item: The element to look for
+
+        Returns:
+            bool: True if the element is present
+        """
+        return item in self._structure
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    import tempfile
+
+    from events import PrintSink
+
+    print("=== Journaled Structure Demo ===")
+
+    state_directory = tempfile.mkdtemp(prefix="journal-demo-")
+
+    print("\n1. Journaling queue operations:")
+    tasks = JournaledStructure(Queue, state_directory, fsync="always", sink=PrintSink())
+    tasks.enqueue_many(["Email Report", "Update Database", "Backup Files"])
+    tasks.dequeue()
+    tasks.enqueue("Send Notifications")
+    print(f"Journal records: {tasks.journal.record_count}")
+    tasks.close()
+
+    print("\n2. Recovering after a restart:")
+    tasks = JournaledStructure(Queue, state_directory)
+    tasks.display()
+
+    print("\n3. Compacting into a snapshot:")
+    tasks.compact()
+    print(f"Files: {sorted(os.listdir(state_directory))}")
+    tasks.close()
+
+    print("\n=== Journaled Structure Demo Complete ===")
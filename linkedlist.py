@@ -9,6 +9,9 @@ Author: Educational Python Project
 Date: July 28, 2025
 """
 
+from events import Event, PrintSink, get_default_sink
+from persistence import read_snapshot, write_snapshot
+
 
 class Node:
     """
@@ -22,6 +25,9 @@ class Node:
         next: Reference to the next node in the list (None if last node)
     """
     
+    # Fixed attribute layout: no per-instance __dict__ for every element
+    __slots__ = ("data", "next")
+    
     def __init__(self, data):
         """
         Initialize a new node with given data.
@@ -50,27 +56,144 @@ class LinkedList:
     
     The LinkedList class provides standard linked list operations:
     - insert: Add elements at various positions
+    - extend / extend_left: Add many elements at either end
     - delete: Remove elements by value or position
     - search: Find elements in the list
     - display: Show the current list contents
     - size: Get the number of elements
     
+    Operations are reported to an optional event sink (see events.py).
+    
+    An optional value index (LinkedList(indexed=True)) maps every value to
+    the predecessors of the nodes holding it. It makes membership tests,
+    search misses and delete_by_value of unique values O(1) on average, at
+    the cost of one set entry per node. Indexed lists require hashable values.
+    
     Attributes:
         head (Node): Reference to the first node in the list
+        tail (Node): Reference to the last node in the list
         _size (int): Internal counter for the number of elements
+        sink: Callable receiving an Event per operation (None = silent)
+        _index (dict): Value -> set of predecessor nodes (None for the head), or None if not indexed
     """
     
-    def __init__(self):
+    __slots__ = ("head", "tail", "_size", "sink", "_index")
+    
+    def __init__(self, sink=None, indexed=False):
         """
         Initialize an empty linked list.
         
         The constructor sets up an empty list with no nodes.
-        Using a head pointer to track the beginning of the list.
+        Using a head pointer to track the beginning of the list and a tail
+        pointer to track the end of the list.
+        
+        Args:
+            sink: Event sink for operation reports (default: the module default from events.py)
+            indexed (bool): Maintain a value index for O(1) lookups (default: False)
         """
         # Initialize head pointer as None (empty list)
         self.head = None
+        # Initialize tail pointer as None (empty list has no last node)
+        self.tail = None
         # Keep track of list size for efficiency
         self._size = 0
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
+        # Optional value index; None keeps unhashable payloads working
+        self._index = {} if indexed else None
+    
+    @property
+    def indexed(self):
+        """
+        Whether this list maintains a value index.
+        
+        Returns:
+            bool: True if the list was created with indexed=True
+        """
+        return self._index is not None
+    
+    @staticmethod
+    def _require_hashable(data):
+        """
+        Check that a value can go into the index, before any link is changed.
+        
+        Args:
+            data: The value about to be inserted
+        
+        Raises:
+            TypeError: If the value is unhashable
+        """
+        try:
+            hash(data)
+        except TypeError:
+            raise TypeError(f"Indexed lists require hashable values, got {type(data).__name__}") from None
+    
+    def _index_linked(self, previous, node):
+        """
+        Record in the index that node was just linked in after previous.
+        
+        The successor of node used to follow previous, so its entry moves
+        from previous to node. That update happens first, so equal values
+        in adjacent nodes share one set correctly.
+        
+        Args:
+            previous (Node): The node before the new node (None if it is the head)
+            node (Node): The newly linked node
+        """
+        index = self._index
+        if node.next is not None:
+            predecessors = index[node.next.data]
+            predecessors.discard(previous)
+            predecessors.add(node)
+        index.setdefault(node.data, set()).add(previous)
+    
+    def _index_unlinked(self, previous, node):
+        """
+        Record in the index that node was just unlinked from after previous.
+        
+        The removed node must still reference its old successor, whose
+        entry moves from node back to previous.
+        
+        Args:
+            previous (Node): The node before the removed node (None if it was the head)
+            node (Node): The removed node
+        """
+        index = self._index
+        predecessors = index[node.data]
+        predecessors.discard(previous)
+        if not predecessors:
+            del index[node.data]
+        if node.next is not None:
+            predecessors = index[node.next.data]
+            predecessors.discard(node)
+            predecessors.add(previous)
+    
+    def _index_find(self, data):
+        """
+        Use the index to find the predecessor of the first node holding data.
+        
+        A unique value is found in O(1). With duplicates the first
+        occurrence is found by walking from the head.
+        
+        Args:
+            data: The value to look for
+        
+        Returns:
+            tuple: (found, previous) where previous is None for the head node
+        """
+        predecessors = self._index.get(data)
+        if not predecessors:
+            return False, None
+        if len(predecessors) == 1:
+            return True, next(iter(predecessors))
+        
+        # Several nodes hold the value: the first occurrence is nearest the head
+        previous = None
+        current = self.head
+        while not (current.data is data or current.data == data):
+            previous = current
+            current = current.next
+        return True, previous
     
     def insert_at_beginning(self, data):
         """
@@ -83,7 +206,13 @@ class LinkedList:
         
         Returns:
             None
+        
+        Raises:
+            TypeError: If the list is indexed and the value is unhashable
         """
+        if self._index is not None:
+            self._require_hashable(data)
+        
         # Create a new node with the given data
         new_node = Node(data)
         
@@ -93,42 +222,172 @@ class LinkedList:
         # Update head to point to the new node
         self.head = new_node
         
+        # The first node of an empty list is also its last node
+        if self.tail is None:
+            self.tail = new_node
+        
+        if self._index is not None:
+            self._index_linked(None, new_node)
+        
         # Increment the size counter
         self._size += 1
         
-        print(f"Inserted '{data}' at the beginning of the list")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_beginning", f"Inserted '{data}' at the beginning of the list", data))
     
     def insert_at_end(self, data):
         """
         Insert a new node at the end of the list.
         
-        This operation has O(n) time complexity as we need to traverse to the end.
+        This operation has O(1) time complexity as the tail pointer gives
+        direct access to the last node.
         
         Args:
             data: The value to be inserted
         
         Returns:
             None
+        
+        Raises:
+            TypeError: If the list is indexed and the value is unhashable
         """
+        if self._index is not None:
+            self._require_hashable(data)
+        
         # Create a new node with the given data
         new_node = Node(data)
+        previous = self.tail
         
         # If list is empty, make new node the head
         if self.head is None:
             self.head = new_node
         else:
-            # Traverse to the end of the list
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            
             # Link the last node to the new node
-            current.next = new_node
+            self.tail.next = new_node
+        
+        # The new node is now the last node
+        self.tail = new_node
+        
+        if self._index is not None:
+            self._index_linked(previous, new_node)
         
         # Increment the size counter
         self._size += 1
         
-        print(f"Inserted '{data}' at the end of the list")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_end", f"Inserted '{data}' at the end of the list", data))
+    
+    def extend(self, iterable):
+        """
+        Insert every element of an iterable at the end of the list.
+        
+        The new nodes are chained together in one loop and attached after
+        the tail once; one event is reported for the whole batch.
+        
+        Args:
+            iterable: The values to be inserted, in order
+        
+        Returns:
+            int: Number of values inserted
+        
+        Raises:
+            TypeError: If the list is indexed and a value is unhashable (the list is left unchanged)
+        """
+        # Build the new chain from a placeholder node, then splice it in, so an
+        # iterable that fails part-way leaves the list unchanged
+        anchor = Node(None)
+        last = anchor
+        added_count = 0
+        for data in iterable:
+            if self._index is not None:
+                self._require_hashable(data)
+            last.next = Node(data)
+            last = last.next
+            added_count += 1
+        
+        if added_count:
+            previous = self.tail
+            if self.head is None:
+                self.head = anchor.next
+            else:
+                self.tail.next = anchor.next
+            self.tail = last
+            self._size += added_count
+            
+            # Index the new nodes, each following the one before it (the old
+            # tail had no successor, so no existing entry changes)
+            if self._index is not None:
+                index = self._index
+                current = anchor.next
+                while current is not None:
+                    index.setdefault(current.data, set()).add(previous)
+                    previous = current
+                    current = current.next
+        
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend",
+                            f"Inserted {added_count} items at the end of the list", added_count))
+        return added_count
+    
+    def extend_left(self, iterable):
+        """
+        Insert every element of an iterable at the beginning of the list.
+        
+        Like collections.deque.extendleft(), each value is inserted at the
+        beginning in turn, so the values end up in reverse order. One event
+        is reported for the whole batch.
+        
+        Args:
+            iterable: The values to be inserted
+        
+        Returns:
+            int: Number of values inserted
+        
+        Raises:
+            TypeError: If the list is indexed and a value is unhashable (the list is left unchanged)
+        """
+        # Build the new chain first (its last node holds the first value), then
+        # splice it in, so an iterable that fails part-way leaves the list unchanged
+        chain_head = None
+        chain_last = None
+        added_count = 0
+        for data in iterable:
+            if self._index is not None:
+                self._require_hashable(data)
+            new_node = Node(data)
+            new_node.next = chain_head
+            chain_head = new_node
+            if chain_last is None:
+                chain_last = new_node
+            added_count += 1
+        
+        if added_count:
+            old_head = self.head
+            chain_last.next = old_head
+            self.head = chain_head
+            if self.tail is None:
+                self.tail = chain_last
+            self._size += added_count
+            
+            # Index the new nodes; the old head now follows the chain's last node
+            if self._index is not None:
+                index = self._index
+                if old_head is not None:
+                    predecessors = index[old_head.data]
+                    predecessors.discard(None)
+                    predecessors.add(chain_last)
+                previous = None
+                current = chain_head
+                while current is not old_head:
+                    index.setdefault(current.data, set()).add(previous)
+                    previous = current
+                    current = current.next
+        
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend_left",
+                            f"Inserted {added_count} items at the beginning of the list",
+                            added_count))
+        return added_count
     
     def insert_at_position(self, data, position):
         """
@@ -145,10 +404,13 @@ class LinkedList:
             
         Raises:
             IndexError: If position is negative or greater than list size
+            TypeError: If the list is indexed and the value is unhashable
         """
         # Validate position
         if position < 0 or position > self._size:
             raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+        if self._index is not None:
+            self._require_hashable(data)
         
         # If inserting at beginning, use specialized method
         if position == 0:
@@ -167,16 +429,25 @@ class LinkedList:
         new_node.next = current.next
         current.next = new_node
         
+        # Inserting after the last node makes the new node the tail
+        if current is self.tail:
+            self.tail = new_node
+        
+        if self._index is not None:
+            self._index_linked(current, new_node)
+        
         # Increment the size counter
         self._size += 1
         
-        print(f"Inserted '{data}' at position {position}")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_position", f"Inserted '{data}' at position {position}", data))
     
     def delete_by_value(self, data):
         """
         Delete the first occurrence of a node with the given value.
         
-        This operation has O(n) time complexity in the worst case.
+        This operation has O(n) time complexity in the worst case, or O(1)
+        on average for a unique value in an indexed list.
         
         Args:
             data: The value to be deleted
@@ -186,29 +457,60 @@ class LinkedList:
         """
         # Check if list is empty
         if self.head is None:
-            print(f"Cannot delete '{data}': List is empty")
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Cannot delete '{data}': List is empty", data))
+            return False
+        
+        # With an index, jump straight to the predecessor of the first match
+        if self._index is not None:
+            found, previous = self._index_find(data)
+            if found:
+                removed = self.head if previous is None else previous.next
+                if previous is None:
+                    self.head = removed.next
+                else:
+                    previous.next = removed.next
+                # Deleting the last node makes its predecessor the tail
+                if removed is self.tail:
+                    self.tail = previous
+                self._index_unlinked(previous, removed)
+                self._size -= 1
+                if self.sink is not None:
+                    self.sink(Event(type(self).__name__, "delete_by_value", f"Deleted '{data}' from the list", data))
+                return True
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Value '{data}' not found in the list", data))
             return False
         
         # If head node contains the data to delete
         if self.head.data == data:
             self.head = self.head.next
+            # Deleting the only node empties the list
+            if self.head is None:
+                self.tail = None
             self._size -= 1
-            print(f"Deleted '{data}' from the list")
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Deleted '{data}' from the list", data))
             return True
         
         # Search for the node to delete
         current = self.head
         while current.next is not None:
             if current.next.data == data:
+                # Deleting the last node makes its predecessor the tail
+                if current.next is self.tail:
+                    self.tail = current
                 # Remove the node by updating the link
                 current.next = current.next.next
                 self._size -= 1
-                print(f"Deleted '{data}' from the list")
+                if self.sink is not None:
+                    self.sink(Event(type(self).__name__, "delete_by_value", f"Deleted '{data}' from the list", data))
                 return True
             current = current.next
         
         # Value not found
-        print(f"Value '{data}' not found in the list")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_by_value", f"Value '{data}' not found in the list", data))
         return False
     
     def delete_at_position(self, position):
@@ -234,10 +536,17 @@ class LinkedList:
         
         # If deleting head node
         if position == 0:
-            deleted_data = self.head.data
-            self.head = self.head.next
+            removed = self.head
+            deleted_data = removed.data
+            self.head = removed.next
+            # Deleting the only node empties the list
+            if self.head is None:
+                self.tail = None
+            if self._index is not None:
+                self._index_unlinked(None, removed)
             self._size -= 1
-            print(f"Deleted '{deleted_data}' from position {position}")
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_at_position", f"Deleted '{deleted_data}' from position {position}", deleted_data))
             return deleted_data
         
         # Traverse to the position just before deletion point
@@ -245,19 +554,29 @@ class LinkedList:
         for i in range(position - 1):
             current = current.next
         
+        # Deleting the last node makes its predecessor the tail
+        if current.next is self.tail:
+            self.tail = current
+        
         # Get the data to return and update the link
-        deleted_data = current.next.data
-        current.next = current.next.next
+        removed = current.next
+        deleted_data = removed.data
+        current.next = removed.next
+        if self._index is not None:
+            self._index_unlinked(current, removed)
         self._size -= 1
         
-        print(f"Deleted '{deleted_data}' from position {position}")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_at_position", f"Deleted '{deleted_data}' from position {position}", deleted_data))
         return deleted_data
     
     def search(self, data):
         """
         Search for a value in the linked list.
         
-        This operation has O(n) time complexity in the worst case.
+        This operation has O(n) time complexity in the worst case. In an
+        indexed list a missing value is reported in O(1); a present value
+        still needs a walk to count its position.
         
         Args:
             data: The value to search for
@@ -269,15 +588,21 @@ class LinkedList:
         current = self.head
         position = 0
         
+        # The index rules out missing values without walking the list
+        if self._index is not None and data not in self._index:
+            current = None
+        
         while current is not None:
             if current.data == data:
-                print(f"Found '{data}' at position {position}")
+                if self.sink is not None:
+                    self.sink(Event(type(self).__name__, "search", f"Found '{data}' at position {position}", position))
                 return position
             current = current.next
             position += 1
         
         # Value not found
-        print(f"Value '{data}' not found in the list")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "search", f"Value '{data}' not found in the list", -1))
         return -1
     
     def display(self):
@@ -316,7 +641,8 @@ class LinkedList:
         Returns:
             int: Number of elements in the list
         """
-        print(f"Linked List size: {self._size}")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Linked List size: {self._size}", self._size))
         return self._size
     
     def is_empty(self):
@@ -337,10 +663,14 @@ class LinkedList:
         Returns:
             None
         """
-        # Reset head pointer and size counter
+        # Reset head and tail pointers, size counter and index
         self.head = None
+        self.tail = None
         self._size = 0
-        print("Linked List has been cleared")
+        if self._index is not None:
+            self._index.clear()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Linked List has been cleared", None))
     
     def get_at_position(self, position):
         """
@@ -364,8 +694,109 @@ class LinkedList:
         for i in range(position):
             current = current.next
         
-        print(f"Element at position {position}: {current.data}")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "get_at_position", f"Element at position {position}: {current.data}", current.data))
         return current.data
+    
+    def save(self, path):
+        """
+        Save the elements, head to tail, to a binary snapshot file.
+        
+        The nodes are walked iteratively and each element is encoded on its
+        own (see persistence.py), so long chains do not hit the recursion
+        limit the way pickling the node chain does.
+        
+        Args:
+            path (str): Destination file
+        
+        Returns:
+            int: Number of elements saved
+        """
+        saved_count = write_snapshot(path, "linkedlist", list(self))
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "save", f"Saved {saved_count} items to '{path}'", saved_count))
+        return saved_count
+    
+    @classmethod
+    def load(cls, path, sink=None, **options):
+        """
+        Create a linked list from a snapshot file written by save().
+        
+        Args:
+            path (str): Snapshot file
+            sink: Event sink for the new list
+            **options: Extra keyword arguments for the constructor (e.g. indexed=True)
+        
+        Returns:
+            A new linked list of this class with the saved elements
+        
+        Raises:
+            ValueError: If the file is not a linked list snapshot
+        """
+        linked_list = cls(sink=sink, **options)
+        linked_list.extend(read_snapshot(path, "linkedlist"))
+        return linked_list
+    
+    def __len__(self):
+        """
+        Return the number of elements, enabling len(linked_list).
+        
+        Unlike size(), this does not report an event.
+        
+        Returns:
+            int: Number of elements in the list
+        """
+        return self._size
+    
+    def __iter__(self):
+        """
+        Iterate over the node values from head to tail.
+        
+        A cursor follows the next references, so a full traversal is a
+        single O(n) pass instead of one get_at_position() walk per element.
+        
+        Yields:
+            The data of each node in list order
+        """
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+    
+    def __reversed__(self):
+        """
+        Iterate over the node values from tail to head.
+        
+        A singly linked list cannot walk backwards, so this takes an O(n)
+        snapshot of the values and iterates over it in reverse.
+        
+        Returns:
+            iterator: Reverse iterator over the list values
+        """
+        return reversed(list(self))
+    
+    def __contains__(self, data):
+        """
+        Check whether a value is in the list, enabling `data in linked_list`.
+        
+        Unlike search(), this does not compute a position or report an event.
+        In an indexed list this is an O(1) average dictionary lookup.
+        
+        Args:
+            data: The value to look for
+        
+        Returns:
+            bool: True if a node holds an equal value
+        """
+        if self._index is not None:
+            return data in self._index
+        
+        current = self.head
+        while current is not None:
+            if current.data is data or current.data == data:
+                return True
+            current = current.next
+        return False
 
 
 # Example usage and testing (only runs when script is executed directly)
@@ -373,7 +804,7 @@ if __name__ == "__main__":
     print("=== Linked List Data Structure Demo ===")
     
     # Create a new linked list instance
-    linked_list = LinkedList()
+    linked_list = LinkedList(sink=PrintSink())
     
     # Test empty list
     print("\n1. Testing empty list:")
@@ -10,11 +10,18 @@ Author: Educational Python Project
 Date: July 28, 2025
 """
 
+import argparse
+import contextlib
+import io
+
 # Import all three data structure modules
 # This demonstrates modular design and low coupling
-from stack import Stack
+from stack import BoundedStack
 from queue import Queue
 from linkedlist import LinkedList
+from events import PrintSink
+from metrics import InstrumentedStructure, to_prometheus
+from workload import format_reports, load_test, run_task_stream
 
 
 class DataStructureManager:
@@ -25,21 +32,48 @@ class DataStructureManager:
     in a larger system while maintaining high cohesion and clear responsibilities.
     
     Attributes:
-        stack (Stack): Stack instance for LIFO operations
+        stack (BoundedStack): Stack instance for LIFO operations (the undo stack)
         queue (Queue): Queue instance for FIFO operations  
         linked_list (LinkedList): Linked List instance for flexible data storage
+        sink: Event sink shared by the managed structures (None = silent)
+        metrics_enabled (bool): Whether the structures are wrapped in InstrumentedStructure
     """
     
-    def __init__(self):
+    # The demonstration scenarios, in the order main() runs them
+    SCENARIOS = (
+        "demonstrate_basic_operations",
+        "demonstrate_integration_scenario",
+        "demonstrate_data_flow",
+        "demonstrate_error_handling",
+        "display_summary",
+    )
+    
+    def __init__(self, sink=None, undo_limit=1000, undo_max_bytes=None, metrics=False):
         """
         Initialize the data structure manager with instances of all three structures.
         
         This constructor demonstrates dependency injection and composition patterns.
+        
+        Args:
+            sink: Event sink passed to every structure the manager creates
+            undo_limit (int): Most entries the undo stack keeps; older ones are evicted (default: 1000)
+            undo_max_bytes (int): Approximate memory budget of the undo stack (default: none)
+            metrics (bool): Record operation metrics for the three structures (default: False)
         """
-        # Create instances of all three data structures
-        self.stack = Stack()
-        self.queue = Queue() 
-        self.linked_list = LinkedList()
+        # Create instances of all three data structures, sharing one event sink
+        self.sink = sink
+        # The undo stack is bounded so old task payloads are not held forever
+        self.stack = BoundedStack(max_items=undo_limit, max_bytes=undo_max_bytes, sink=sink)
+        self.queue = Queue(sink=sink)
+        # The history list is searched by task name, so keep a value index
+        self.linked_list = LinkedList(sink=sink, indexed=True)
+        
+        # Metrics are opt-in: wrapping is skipped entirely when they are off
+        self.metrics_enabled = metrics
+        if metrics:
+            self.stack = InstrumentedStructure(self.stack, name="undo_stack")
+            self.queue = InstrumentedStructure(self.queue, name="task_queue")
+            self.linked_list = InstrumentedStructure(self.linked_list, name="history")
         
         print("=== Data Structure Manager Initialized ===")
         print("Stack, Queue, and Linked List are ready for use!")
@@ -183,18 +217,9 @@ class DataStructureManager:
             # Remove from completed tasks
             completed_tasks.remove(last_task)
             
-            # Add back to front of processing queue (high priority)
-            # Note: We'll create a new queue with this task first
-            temp_queue = Queue()
-            temp_queue.enqueue(last_task)
-            
-            # Add remaining queue items
-            while not self.queue.is_empty():
-                temp_queue.enqueue(self.queue.dequeue())
-            
-            # Replace the queue
-            self.queue = temp_queue
-            
+            # Add back to front of processing queue (high priority) in O(1)
+            self.queue.requeue_front(last_task)
+
             print(f"   Undid task: {last_task}")
             print(f"   Task returned to front of queue for reprocessing")
         
@@ -250,9 +275,8 @@ class DataStructureManager:
         print("\n2. Transferring data from linked list to queue:")
         print("   (Reading linked list sequentially)")
         
-        # Read all items from linked list and add to queue
-        for i in range(self.linked_list.size()):
-            item = self.linked_list.get_at_position(i)
+        # Read all items from linked list in one pass and add to queue
+        for item in self.linked_list:
             self.queue.enqueue(item)
         
         print("\n   Queue after transfer:")
@@ -400,6 +424,59 @@ class DataStructureManager:
             self.linked_list.display()
             self.linked_list.size()
 
+    
+    def metrics_snapshot(self):
+        """
+        Collect the metrics of all three structures.
+        
+        Returns:
+            dict: Snapshot per structure name (empty if metrics are disabled)
+        """
+        if not self.metrics_enabled:
+            return {}
+        return {structure.name: structure.snapshot()
+                for structure in (self.stack, self.queue, self.linked_list)}
+    
+    def metrics_prometheus(self):
+        """
+        Export the metrics of all three structures in Prometheus text format.
+        
+        Returns:
+            str: The exposition text (empty if metrics are disabled)
+        """
+        if not self.metrics_enabled:
+            return ""
+        return to_prometheus(self.metrics_snapshot().values())
+    
+    def run_workload(self, tasks=100_000, arrival_rate=None, payload_size=64,
+                     undo_probability=0.0, lookup_probability=0.0, history_limit=1000, seed=0,
+                     max_undos=None):
+        """
+        Run a synthetic task stream through the queue, undo stack and history.
+        
+        This is the integration scenario at scale: tasks arrive, are queued,
+        processed into the undo stack and history, and are sometimes undone
+        or looked up. The structures are cleared first; see
+        workload.run_task_stream() for the latency model.
+        
+        Args:
+            tasks (int): Number of tasks to generate (default: 100000)
+            arrival_rate (float): Tasks per second, or None for closed loop (default: None)
+            payload_size (int): Characters per task (default: 64)
+            undo_probability (float): Chance that a processed task is undone (default: 0)
+            lookup_probability (float): Chance that processing searches the history (default: 0)
+            history_limit (int): Most entries kept in the history list (default: 1000)
+            seed: Seed for the generated stream (default: 0)
+            max_undos (int): Most times one task is undone (default: None, unbounded)
+        
+        Returns:
+            dict: Throughput, utilization, backlog and latency percentiles
+        """
+        return run_task_stream(self, tasks=tasks, arrival_rate=arrival_rate,
+                               payload_size=payload_size, undo_probability=undo_probability,
+                               lookup_probability=lookup_probability,
+                               history_limit=history_limit, seed=seed, max_undos=max_undos)
+
 
 def main():
     """
@@ -415,7 +492,8 @@ def main():
     
     # Create the data structure manager
     # This demonstrates composition and dependency management
-    manager = DataStructureManager()
+    # The demonstration opts in to printing every operation
+    manager = DataStructureManager(sink=PrintSink())
     
     try:
         # Run all demonstrations
@@ -459,6 +537,68 @@ def main():
         print("="*80)
 
 
+def parse_arguments(argv=None):
+    """
+    Parse the command line.
+    
+    Args:
+        argv (list): Arguments to parse (default: sys.argv[1:])
+    
+    Returns:
+        argparse.Namespace: The parsed options
+    """
+    parser = argparse.ArgumentParser(description="Stack, Queue, and Linked List integration demo")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile each scenario instead of running the demonstration")
+    parser.add_argument("--scale", type=int, nargs="+", default=[10, 100, 1000],
+                        help="back-to-back runs per scenario when profiling (default: 10 100 1000)")
+    parser.add_argument("--scenario", nargs="+", choices=DataStructureManager.SCENARIOS,
+                        default=list(DataStructureManager.SCENARIOS), help="scenarios to profile (default: all)")
+    parser.add_argument("--top", type=int, default=15, help="rows in each hot-function table (default: 15)")
+    parser.add_argument("--profile-dir", default="profiles",
+                        help="directory for .folded and .prof files (default: profiles)")
+    parser.add_argument("--interval", type=float, default=0.001,
+                        help="sampling interval in seconds of CPU time (default: 0.001)")
+    parser.add_argument("--load-test", action="store_true",
+                        help="run synthetic task streams instead of the demonstration")
+    parser.add_argument("--tasks", type=int, default=100_000, help="tasks per load-test run (default: 100000)")
+    parser.add_argument("--rate", type=float, nargs="+",
+                        help="arrival rates in tasks/s (default: 50%%, 80%% and 95%% of measured capacity)")
+    parser.add_argument("--payload-size", type=int, default=64, help="characters per task (default: 64)")
+    parser.add_argument("--undo-probability", type=float, default=0.05,
+                        help="chance that a processed task is undone (default: 0.05)")
+    parser.add_argument("--max-undos", type=int,
+                        help="most times one task is undone (default: unbounded)")
+    parser.add_argument("--lookup-probability", type=float, default=0.1,
+                        help="chance that processing searches the history (default: 0.1)")
+    parser.add_argument("--history-limit", type=int, default=1000,
+                        help="most entries kept in the history list (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the task streams (default: 0)")
+    return parser.parse_args(argv)
+
+
 # Entry point - only run when this script is executed directly
 if __name__ == "__main__":
-    main()
+    arguments = parse_arguments()
+    if arguments.profile:
+        # Imported here so the plain demonstration does not load the profilers
+        from profiling import profile_scenarios
+        profile_scenarios(DataStructureManager, arguments.scenario, scales=arguments.scale,
+                          top=arguments.top, output_dir=arguments.profile_dir,
+                          interval=arguments.interval)
+    elif arguments.load_test:
+        def silent_manager():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return DataStructureManager()
+        
+        print(f"Load test: {arguments.tasks} tasks, {arguments.payload_size}-character payloads, "
+              f"undo {arguments.undo_probability:.0%}, lookups {arguments.lookup_probability:.0%}")
+        reports = load_test(silent_manager, rates=arguments.rate, tasks=arguments.tasks,
+                            payload_size=arguments.payload_size,
+                            undo_probability=arguments.undo_probability,
+                            lookup_probability=arguments.lookup_probability,
+                            history_limit=arguments.history_limit, seed=arguments.seed,
+                            max_undos=arguments.max_undos)
+        print(format_reports(reports))
+    else:
+        main()
@@ -0,0 +1,386 @@
+"""
+Operation Metrics for the Data Structures
+
+This module provides an opt-in instrumentation layer. An
+InstrumentedStructure wraps a Stack, Queue or LinkedList (or any of the
+other structures) and records, per public method:
+
+- how many times it was called, and how many calls raised
+- a latency histogram built from a sample of the calls (every
+  sample_every-th call is timed)
+
+plus, for the structure as a whole, its high-water size and the number
+of underflows (removing or peeking at an empty structure).
+
+Metrics cost nothing unless they are enabled: an uninstrumented structure
+runs exactly the same code as before. When enabled, an unsampled call
+costs one counter increment and one len() on top of the call itself.
+
+    queue = InstrumentedStructure(Queue(), name="tasks")
+    queue.enqueue("Email Report")
+    queue.dequeue()
+    print(to_prometheus([queue.snapshot()]))
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import inspect
+import time
+
+from queue import Empty
+
+
+# Latency buckets are powers of two of nanoseconds: 128 ns, 256 ns, ... 2**27 ns (~134 ms), then +Inf
+_FIRST_BUCKET_BITS = 7
+_BUCKET_COUNT = 21
+
+# Exceptions that mean the structure had nothing to remove or show
+_UNDERFLOW_ERRORS = (IndexError, Empty)
+
+# Public attributes of the proxy itself; other public names are set on the structure
+_PROXY_ATTRIBUTES = frozenset(("name", "sample_every"))
+
+
+class OperationStats:
+    """
+    Counters and a sampled latency histogram for one method.
+
+    Attributes:
+        count (int): Number of calls
+        errors (int): Number of calls that raised an exception
+        samples (int): Number of timed calls
+        total_ns (int): Sum of the timed calls' durations in nanoseconds
+        buckets (list): Timed calls per latency bucket (the last one is +Inf)
+    """
+
+    __slots__ = ("count", "errors", "samples", "total_ns", "buckets")
+
+    def __init__(self):
+        """
+        Initialize zeroed counters.
+        """
+        self.count = 0
+        self.errors = 0
+        self.samples = 0
+        self.total_ns = 0
+        self.buckets = [0] * (_BUCKET_COUNT + 1)
+
+    def record_latency(self, elapsed_ns):
+        """
+        Add one timed call to the histogram.
+
+        Args:
+            elapsed_ns (int): Duration of the call in nanoseconds
+        """
+        self.samples += 1
+        self.total_ns += elapsed_ns
+        bucket = max(0, elapsed_ns.bit_length() - _FIRST_BUCKET_BITS)
+        self.buckets[min(bucket, _BUCKET_COUNT)] += 1
+
+    def snapshot(self):
+        """
+        Return the counters as a plain dict.
+
+        Returns:
+            dict: count, errors and a latency dict with samples, sum_ns and
+                  cumulative bucket counts keyed by upper bound in nanoseconds
+        """
+        cumulative = {}
+        running = 0
+        for bucket, bucket_count in enumerate(self.buckets):
+            running += bucket_count
+            upper_bound = 2 ** (bucket + _FIRST_BUCKET_BITS) if bucket < _BUCKET_COUNT else "+Inf"
+            cumulative[upper_bound] = running
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "latency": {"samples": self.samples, "sum_ns": self.total_ns, "buckets": cumulative},
+        }
+
+
+class InstrumentedStructure:
+    """
+    A proxy that records metrics for every public method of a structure.
+
+    Public methods are replaced by counting wrappers the first time they
+    are looked up, and the wrappers are cached on the proxy. Other
+    attributes, including callables stored on the structure such as its
+    sink or on_evict, and len()/iteration/`in` go straight to the wrapped
+    structure. Setting a public attribute other than name and
+    sample_every sets it on the structure.
+
+    Attributes:
+        name (str): Label for exported metrics (default: the class name)
+        sample_every (int): Time one call in this many per method
+        _structure: The wrapped structure
+        _stats (dict): OperationStats per method name
+        _high_water (int): Largest size seen after a call
+        _underflows (int): Calls that found the structure empty
+    """
+
+    # Wrappers are cached in the instance __dict__, so after the first lookup
+    # a method is found directly instead of going through __getattr__
+    __slots__ = ("name", "sample_every", "_structure", "_stats", "_high_water",
+                 "_underflows", "__dict__")
+
+    def __init__(self, structure, name=None, sample_every=16):
+        """
+        Wrap a structure.
+
+        Args:
+            structure: The Stack, Queue, LinkedList (or other structure) to instrument
+            name (str): Label for exported metrics (default: the class name)
+            sample_every (int): Time one call in this many per method (default: 16; 1 times every call)
+
+        Raises:
+            ValueError: If sample_every is smaller than 1
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, got {sample_every}")
+        self.name = name if name is not None else type(structure).__name__
+        self.sample_every = sample_every
+        self._structure = structure
+        self._stats = {}
+        self._high_water = len(structure)
+        self._underflows = 0
+
+    @property
+    def structure(self):
+        """
+        The wrapped structure (calls made on it directly are not counted).
+
+        Returns:
+            The instrumented structure
+        """
+        return self._structure
+
+    def _wrap(self, name, method):
+        """
+        Build the counting wrapper for one method.
+
+        Args:
+            name (str): Method name
+            method: The bound method of the wrapped structure
+
+        Returns:
+            The wrapper function
+        """
+        stats = self._stats.setdefault(name, OperationStats())
+        structure = self._structure
+        sample_every = self.sample_every
+        perf_counter_ns = time.perf_counter_ns
+
+        def instrumented(*args, **kwargs):
+            stats.count += 1
+            sampled = stats.count % sample_every == 0
+            if sampled:
+                start = perf_counter_ns()
+            try:
+                result = method(*args, **kwargs)
+            except _UNDERFLOW_ERRORS:
+                stats.errors += 1
+                if not len(structure):
+                    self._underflows += 1
+                raise
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                if sampled:
+                    stats.record_latency(perf_counter_ns() - start)
+            size = len(structure)
+            if size > self._high_water:
+                self._high_water = size
+            return result
+
+        instrumented.__name__ = name
+        instrumented.__doc__ = method.__doc__
+        return instrumented
+
+    def __getattr__(self, name):
+        """
+        Return the counting wrapper of a public method, or the plain attribute.
+
+        Only methods bound to the structure are wrapped and cached; other
+        attributes are read from the structure on every lookup, so later
+        changes to them are seen.
+
+        Args:
+            name (str): Attribute name
+
+        Returns:
+            The wrapper or attribute
+        """
+        if name.startswith("_"):
+            # Private names are never forwarded (this also avoids recursion during __init__)
+            raise AttributeError(name)
+        attribute = getattr(self._structure, name)
+        if not (inspect.ismethod(attribute) and attribute.__self__ is self._structure):
+            return attribute
+        wrapper = self._wrap(name, attribute)
+        self.__dict__[name] = wrapper
+        return wrapper
+
+    def __setattr__(self, name, value):
+        """
+        Set an attribute of the proxy, or a public attribute of the structure.
+
+        Changing sample_every drops the cached wrappers, which read it when
+        they are built; their counters are kept.
+
+        Args:
+            name (str): Attribute name
+            value: The new value
+        """
+        if name.startswith("_") or name in _PROXY_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+            if name == "sample_every":
+                self.__dict__.clear()
+        else:
+            setattr(self._structure, name, value)
+            # A method replaced on the structure must not be shadowed by its old wrapper
+            self.__dict__.pop(name, None)
+
+    def snapshot(self):
+        """
+        Return every metric as a plain dict (e.g. for JSON export).
+
+        Returns:
+            dict: name, structure class, size, high_water, underflows and
+                  per-operation stats (see OperationStats.snapshot())
+        """
+        return {
+            "name": self.name,
+            "structure": type(self._structure).__name__,
+            "size": len(self._structure),
+            "high_water": self._high_water,
+            "underflows": self._underflows,
+            "operations": {name: stats.snapshot() for name, stats in sorted(self._stats.items())},
+        }
+
+    def reset(self):
+        """
+        Zero every counter; the high-water mark restarts at the current size.
+
+        Returns:
+            None
+        """
+        for stats in self._stats.values():
+            stats.__init__()
+        self._high_water = len(self._structure)
+        self._underflows = 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the wrapped structure.
+
+        Returns:
+            int: Number of elements
+        """
+        return len(self._structure)
+
+    def __iter__(self):
+        """
+        Iterate over the wrapped structure.
+
+        Returns:
+            iterator: Iterator over the elements
+        """
+        return iter(self._structure)
+
+    def __reversed__(self):
+        """
+        Iterate over the wrapped structure in reverse.
+
+        Returns:
+            iterator: Reverse iterator over the elements
+        """
+        return reversed(self._structure)
+
+    def __contains__(self, item):
+        """
+        Check whether an element is in the wrapped structure.
+
+        Args:
+            item: The element to look for
+
+        Returns:
+            bool: True if the element is present
+        """
+        return item in self._structure
+
+
+def _label_value(value):
+    """
+    Escape a label value for the Prometheus text format.
+
+    Args:
+        value (str): The raw label value
+
+    Returns:
+        str: The value with backslashes, double quotes and newlines escaped
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(snapshots):
+    """
+    Render metric snapshots in the Prometheus text exposition format.
+
+    Every sample carries a structure label with the snapshot name, so the
+    snapshots of several structures can be exported together. Label
+    values are escaped, so any name is safe to export.
+
+    Args:
+        snapshots: Iterable of dicts returned by InstrumentedStructure.snapshot()
+
+    Returns:
+        str: The exposition text
+    """
+    snapshots = [dict(snapshot, name=_label_value(snapshot["name"]),
+                      operations={_label_value(operation): stats
+                                  for operation, stats in snapshot["operations"].items()})
+                 for snapshot in snapshots]
+    lines = []
+
+    def family(metric, metric_type, description):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+
+    family("datastructure_size", "gauge", "Current number of elements.")
+    for snapshot in snapshots:
+        lines.append(f'datastructure_size{{structure="{snapshot["name"]}"}} {snapshot["size"]}')
+
+    family("datastructure_size_high_water", "gauge", "Largest number of elements seen.")
+    for snapshot in snapshots:
+        lines.append(f'datastructure_size_high_water{{structure="{snapshot["name"]}"}} {snapshot["high_water"]}')
+
+    family("datastructure_underflows_total", "counter", "Calls that found the structure empty.")
+    for snapshot in snapshots:
+        lines.append(f'datastructure_underflows_total{{structure="{snapshot["name"]}"}} {snapshot["underflows"]}')
+
+    family("datastructure_operations_total", "counter", "Calls per operation.")
+    for snapshot in snapshots:
+        for operation, stats in snapshot["operations"].items():
+            lines.append(f'datastructure_operations_total{{structure="{snapshot["name"]}",'
+                         f'operation="{operation}"}} {stats["count"]}')
+
+    family("datastructure_operation_errors_total", "counter", "Calls per operation that raised.")
+    for snapshot in snapshots:
+        for operation, stats in snapshot["operations"].items():
+            lines.append(f'datastructure_operation_errors_total{{structure="{snapshot["name"]}",'
+                         f'operation="{operation}"}} {stats["errors"]}')
+
+    family("datastructure_operation_latency_seconds", "histogram", "Latency of sampled calls.")
+    for snapshot in snapshots:
+        for operation, stats in snapshot["operations"].items():
+            labels = f'structure="{snapshot["name"]}",operation="{operation}"'
+            latency = stats["latency"]
+            for upper_bound, cumulative in latency["buckets"].items():
+                bound = upper_bound if upper_bound == "+Inf" else f"{upper_bound / 1e9:g}"
+                lines.append(f'datastructure_operation_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"datastructure_operation_latency_seconds_sum{{{labels}}} {latency['sum_ns'] / 1e9:g}")
+            lines.append(f"datastructure_operation_latency_seconds_count{{{labels}}} {latency['samples']}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,399 @@
+"""
+Snapshot Persistence for the Data Structures
+
+This module saves the contents of a Stack, Queue or LinkedList to a flat
+binary snapshot file and reads them back. The structures expose it as
+save(path) and load(path) methods; this module holds the file format.
+
+A snapshot is a 16-byte header followed by the elements in iteration
+order (bottom to top, front to rear, head to tail):
+
+    magic "DSCS" | version | structure code | encoding | typecode | count (uint64)
+
+The typecode byte records the array module type code when the elements
+came from an array.array (a TypedStack), so it can be restored with the
+same type; it is zero otherwise.
+
+The elements are written in bulk with one of four encodings, chosen from
+the element types:
+
+- 'q': all ints that fit in 64 bits -> packed little-endian int64 array
+- 'd': all floats -> packed little-endian float64 array
+- 's': all strings -> int64 end offsets, then the UTF-8 bytes back to back
+- 'p': anything else -> int64 end offsets, then one pickle per element
+
+Elements are encoded one at a time, never as a chain, so long linked lists
+do not hit the recursion limit the way pickling a node chain does.
+
+Snapshot gives lazy, memory-mapped access to a file: elements are decoded
+only when they are indexed or iterated.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+
+
+MAGIC = b"DSCS"
+VERSION = 1
+
+# magic, version, structure code, encoding, array typecode (zero if none), element count
+_HEADER = struct.Struct("<4sBBccQ")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+# Structure family names stored in the header as one byte
+_STRUCTURE_CODES = {"stack": 1, "queue": 2, "linkedlist": 3}
+_STRUCTURE_NAMES = {code: name for name, code in _STRUCTURE_CODES.items()}
+
+_INT64_MIN = -2**63
+_INT64_MAX = 2**63 - 1
+
+
+def _choose_encoding(items):
+    """
+    Pick the most compact encoding that can hold every element.
+
+    Args:
+        items (list): The elements to encode
+
+    Returns:
+        bytes: One of b"q", b"d", b"s" or b"p"
+    """
+    if isinstance(items, array) and items.typecode in ("q", "d"):
+        return items.typecode.encode()
+    types = set(map(type, items))
+    if types == {int} and _INT64_MIN <= min(items) and max(items) <= _INT64_MAX:
+        return b"q"
+    if types == {float}:
+        return b"d"
+    if types == {str}:
+        return b"s"
+    return b"p"
+
+
+def _little_endian(values):
+    """
+    Return an array in little-endian byte order (a no-op on little-endian machines).
+
+    Args:
+        values (array.array): Native-order array
+
+    Returns:
+        array.array: Little-endian array
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def _encode(items, encoding):
+    """
+    Encode the elements as the chunks of a snapshot body.
+
+    Args:
+        items: The elements to encode
+        encoding (bytes): The encoding chosen by _choose_encoding()
+
+    Returns:
+        list: Bytes-like chunks to be written after the header
+    """
+    if encoding in (b"q", b"d"):
+        # Arrays of other type codes (e.g. 'i') are widened to the 8-byte encoding
+        typecode = encoding.decode()
+        values = items if getattr(items, "typecode", None) == typecode else array(typecode, items)
+        return [_little_endian(values)]
+
+    if encoding == b"s":
+        blobs = [item.encode("utf-8") for item in items]
+    else:
+        blobs = [pickle.dumps(item, pickle.HIGHEST_PROTOCOL) for item in items]
+    ends = array("q")
+    end = 0
+    for blob in blobs:
+        end += len(blob)
+        ends.append(end)
+    return [_little_endian(ends), b"".join(blobs)]
+
+
+def write_snapshot(path, structure, items, durable=False):
+    """
+    Write elements to a snapshot file.
+
+    The file is written under a temporary name and then renamed, so an
+    interrupted save never leaves a truncated snapshot behind. If writing
+    fails, the temporary file is removed and the error is raised.
+
+    Args:
+        path (str): Destination file
+        structure (str): Structure family: "stack", "queue" or "linkedlist"
+        items: The elements in iteration order (a list, array or other iterable)
+        durable (bool): fsync the file before renaming it (default: False)
+
+    Returns:
+        int: Number of elements written
+    """
+    if not isinstance(items, (list, array)):
+        items = list(items)
+    encoding = _choose_encoding(items) if len(items) else b"p"
+    typecode = items.typecode.encode() if isinstance(items, array) else b"\0"
+    header = _HEADER.pack(MAGIC, VERSION, _STRUCTURE_CODES[structure], encoding, typecode, len(items))
+    temporary_path = f"{path}.tmp"
+    try:
+        with open(temporary_path, "wb") as snapshot_file:
+            snapshot_file.write(header)
+            for chunk in _encode(items, encoding):
+                snapshot_file.write(chunk)
+            if durable:
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        # An unpicklable element, a full disk, ...: leave no partial file behind
+        try:
+            os.unlink(temporary_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return len(items)
+
+
+def _parse_header(data, path, structure=None):
+    """
+    Validate a snapshot header.
+
+    Args:
+        data: Buffer starting with the header
+        path (str): File name, for error messages
+        structure (str): Expected structure family (default: accept any)
+
+    Returns:
+        tuple: (structure family, encoding, array typecode or None, element count)
+
+    Raises:
+        ValueError: If the file is not a snapshot, or holds another structure
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError(f"'{path}' is not a snapshot file (too short)")
+    magic, version, code, encoding, typecode, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or code not in _STRUCTURE_NAMES:
+        raise ValueError(f"'{path}' is not a snapshot file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version} in '{path}'")
+    name = _STRUCTURE_NAMES[code]
+    if structure is not None and name != structure:
+        raise ValueError(f"'{path}' holds a {name} snapshot, not a {structure}")
+    typecode = typecode.decode() if typecode != b"\0" else None
+    return name, encoding, typecode, count
+
+
+def _decode_all(data, encoding, count):
+    """
+    Decode every element of a snapshot body.
+
+    Args:
+        data (memoryview): The whole snapshot file
+        encoding (bytes): The body encoding from the header
+        count (int): Number of elements
+
+    Returns:
+        list: The elements in iteration order
+    """
+    body = data[_HEADER.size:]
+    if encoding in (b"q", b"d"):
+        values = array(encoding.decode())
+        values.frombytes(body[:count * 8])
+        return _little_endian(values).tolist()
+
+    ends = array("q")
+    ends.frombytes(body[:count * 8])
+    ends = _little_endian(ends)
+    blob = body[count * 8:]
+    items = []
+    start = 0
+    if encoding == b"s":
+        for end in ends:
+            items.append(str(blob[start:end], "utf-8"))
+            start = end
+    else:
+        for end in ends:
+            items.append(pickle.loads(blob[start:end]))
+            start = end
+    return items
+
+
+def read_snapshot(path, structure=None):
+    """
+    Read every element of a snapshot file.
+
+    Args:
+        path (str): Snapshot file
+        structure (str): Expected structure family (default: accept any)
+
+    Returns:
+        list: The elements in iteration order
+
+    Raises:
+        ValueError: If the file is not a snapshot, or holds another structure
+    """
+    with open(path, "rb") as snapshot_file:
+        data = memoryview(snapshot_file.read())
+    _, encoding, _, count = _parse_header(data, path, structure)
+    return _decode_all(data, encoding, count)
+
+
+class Snapshot:
+    """
+    A lazy, read-only view of a snapshot file through a memory map.
+
+    Opening a Snapshot only reads the header. Indexing decodes a single
+    element straight from the mapped file and iteration decodes one element
+    at a time, so a large snapshot can be inspected, or streamed into a
+    structure with restore(), without first reading all of it.
+
+    Attributes:
+        path (str): The snapshot file
+        structure (str): Structure family stored in the file
+        encoding (bytes): Body encoding (b"q", b"d", b"s" or b"p")
+        typecode (str): array module type code of the saved elements (None if not an array)
+        _file: The open snapshot file
+        _mapped (mmap.mmap): Read-only map of the file
+        _count (int): Number of elements
+    """
+
+    __slots__ = ("path", "structure", "encoding", "typecode", "_file", "_mapped", "_count")
+
+    def __init__(self, path, structure=None):
+        """
+        Open and map a snapshot file.
+
+        Args:
+            path (str): Snapshot file
+            structure (str): Expected structure family (default: accept any)
+
+        Raises:
+            ValueError: If the file is not a snapshot, or holds another structure
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.structure, self.encoding, self.typecode, self._count = _parse_header(
+                self._mapped, path, structure)
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+
+    def _item(self, index):
+        """
+        Decode the element at a valid index.
+
+        Args:
+            index (int): Element index (0 to len - 1)
+
+        Returns:
+            The decoded element
+        """
+        base = _HEADER.size
+        if self.encoding == b"q":
+            return _INT64.unpack_from(self._mapped, base + index * 8)[0]
+        if self.encoding == b"d":
+            return _FLOAT64.unpack_from(self._mapped, base + index * 8)[0]
+
+        blob_start = base + self._count * 8
+        start = _INT64.unpack_from(self._mapped, base + (index - 1) * 8)[0] if index else 0
+        end = _INT64.unpack_from(self._mapped, base + index * 8)[0]
+        raw = self._mapped[blob_start + start:blob_start + end]
+        return raw.decode("utf-8") if self.encoding == b"s" else pickle.loads(raw)
+
+    def restore(self, cls, sink=None, **options):
+        """
+        Build a structure from the snapshot, streaming the elements from the map.
+
+        A class with a typecode (a TypedStack) gets the saved type code
+        unless a typecode option is given.
+
+        Args:
+            cls: Structure class to create (e.g. Stack, Queue, LinkedList or a subclass)
+            sink: Event sink for the new structure
+            **options: Extra keyword arguments for the constructor (e.g. indexed=True)
+
+        Returns:
+            A new structure holding the snapshot elements
+        """
+        if self.typecode is not None and hasattr(cls, "typecode"):
+            options.setdefault("typecode", self.typecode)
+        structure = cls(sink=sink, **options)
+        bulk_add = {"stack": "push_many", "queue": "enqueue_many", "linkedlist": "extend"}[self.structure]
+        getattr(structure, bulk_add)(iter(self))
+        return structure
+
+    def close(self):
+        """
+        Unmap and close the snapshot file.
+
+        Returns:
+            None
+        """
+        self._mapped.close()
+        self._file.close()
+
+    def __enter__(self):
+        """
+        Return the snapshot itself for use in a with statement.
+
+        Returns:
+            Snapshot: This snapshot
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the snapshot when the with block ends.
+        """
+        self.close()
+
+    def __len__(self):
+        """
+        Return the number of elements in the snapshot.
+
+        Returns:
+            int: Number of elements
+        """
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        Decode and return the element at an index (negative counts from the end).
+
+        Args:
+            index (int): Element index
+
+        Returns:
+            The element at the given position
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("snapshot index out of range")
+        return self._item(index)
+
+    def __iter__(self):
+        """
+        Decode the elements one at a time, in iteration order.
+
+        Yields:
+            Each stored element
+        """
+        for index in range(self._count):
+            yield self._item(index)
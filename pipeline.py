@@ -0,0 +1,327 @@
+"""
+Multi-Process Task Processing Pipeline
+
+This module scales the integration scenario's task processing system
+beyond one thread. Tasks wait in a dispatcher Queue. The pipeline takes
+them off in chunks and hands each chunk to a worker process through a
+ProcessPoolExecutor. As chunks finish, their results flow back into the
+parent's structures, just as in the single-threaded scenario:
+
+- every processed task is pushed onto the undo Stack
+- every task's TaskRecord (task and result) is appended to the history LinkedList
+
+Submitting chunks instead of single tasks amortizes the inter-process
+cost (pickling, pipe writes, future bookkeeping) over chunk_size tasks.
+Only a bounded number of chunks is in flight at a time, so the queue can
+hold far more tasks than are pickled at once. Results are collected in
+submission order, so the history keeps the queue's FIFO order whatever
+order the workers finish in.
+
+The worker function must be picklable, i.e. defined at module level.
+
+    with TaskPipeline(render_report, workers=4) as pipeline:
+        pipeline.submit_many(tasks)
+        pipeline.run()
+    pipeline.history.display()
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import os
+from collections import deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+
+from linkedlist import LinkedList
+from queue import Queue
+from stack import Stack
+
+
+class TaskRecord:
+    """
+    A processed task and its result, as stored in the history.
+
+    Records compare equal when their tasks and results are equal, so an
+    indexed history can find TaskRecord(task, result). They hash by the
+    task alone, so results of any type (lists, dicts, ...) can go into an
+    indexed history list; the task must be hashable for that. A record
+    unpacks like a (task, result) pair.
+
+    Attributes:
+        task: The task as submitted
+        result: What the worker returned for it
+    """
+
+    __slots__ = ("task", "result")
+
+    def __init__(self, task, result):
+        """
+        Initialize a record.
+
+        Args:
+            task: The task as submitted
+            result: What the worker returned for it
+        """
+        self.task = task
+        self.result = result
+
+    def __iter__(self):
+        """
+        Unpack as (task, result).
+
+        Returns:
+            iterator: Iterator over the task and the result
+        """
+        return iter((self.task, self.result))
+
+    def __eq__(self, other):
+        """
+        Compare by task and result.
+
+        Args:
+            other: The object to compare with
+
+        Returns:
+            bool: True if other is a TaskRecord with an equal task and result
+        """
+        if not isinstance(other, TaskRecord):
+            return NotImplemented
+        return self.task == other.task and self.result == other.result
+
+    def __hash__(self):
+        """
+        Hash by the task, which unlike the result is hashable.
+
+        Returns:
+            int: Hash of the task
+        """
+        return hash(self.task)
+
+    def __repr__(self):
+        """
+        String representation showing the task and its result.
+
+        Returns:
+            str: Representation of the record
+        """
+        return f"TaskRecord({self.task!r}, {self.result!r})"
+
+
+def _process_chunk(worker, chunk):
+    """
+    Run the worker on every task of a chunk (executed in a worker process).
+
+    A failing task does not fail the rest of its chunk: its exception is
+    returned in place of a result.
+
+    Args:
+        worker: Module-level function taking one task
+        chunk (list): The tasks
+
+    Returns:
+        list: (succeeded, result or exception) for each task, in order
+    """
+    outcomes = []
+    for task in chunk:
+        try:
+            outcomes.append((True, worker(task)))
+        except Exception as error:
+            outcomes.append((False, error))
+    return outcomes
+
+
+class TaskPipeline:
+    """
+    A dispatcher queue feeding a pool of worker processes.
+
+    Attributes:
+        worker: Function applied to each task in a worker process
+        workers (int): Number of worker processes
+        chunk_size (int): Tasks per submission
+        max_pending (int): Most chunks in flight at once
+        queue (Queue): Dispatcher queue of tasks waiting to be processed
+        stack (Stack): Undo stack; processed tasks are pushed here
+        history (LinkedList): TaskRecord of each processed task, in processing order
+        failures (list): (task, exception) pairs for tasks whose worker raised
+        _executor (ProcessPoolExecutor): The pool, started on first use
+    """
+
+    __slots__ = ("worker", "workers", "chunk_size", "max_pending", "queue", "stack", "history",
+                 "failures", "_executor")
+
+    def __init__(self, worker, workers=None, chunk_size=64, max_pending=None,
+                 queue=None, stack=None, history=None, sink=None):
+        """
+        Initialize a pipeline; worker processes start on the first run().
+
+        Args:
+            worker: Module-level function taking one task and returning its result
+            workers (int): Number of worker processes (default: os.cpu_count())
+            chunk_size (int): Tasks per submission (default: 64)
+            max_pending (int): Most chunks in flight at once (default: 2 per worker)
+            queue (Queue): Dispatcher queue to use (default: a new Queue)
+            stack (Stack): Undo stack to fill (default: a new Stack)
+            history (LinkedList): History list to fill (default: a new LinkedList)
+            sink: Event sink for the structures the pipeline creates (default: None)
+
+        Raises:
+            ValueError: If workers, chunk_size or max_pending is smaller than 1
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        max_pending = max_pending if max_pending is not None else 2 * workers
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+
+        self.worker = worker
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+        self.queue = queue if queue is not None else Queue(sink=sink)
+        self.stack = stack if stack is not None else Stack(sink=sink)
+        self.history = history if history is not None else LinkedList(sink=sink)
+        self.failures = []
+        self._executor = None
+
+    @classmethod
+    def for_manager(cls, manager, worker, **options):
+        """
+        Create a pipeline over a DataStructureManager's queue, undo stack and history.
+
+        Args:
+            manager: The DataStructureManager whose structures to use
+            worker: Module-level function taking one task and returning its result
+            **options: Further TaskPipeline arguments (workers, chunk_size, max_pending)
+
+        Returns:
+            TaskPipeline: The pipeline
+        """
+        return cls(worker, queue=manager.queue, stack=manager.stack,
+                   history=manager.linked_list, **options)
+
+    def submit(self, task):
+        """
+        Add a task to the dispatcher queue.
+
+        Args:
+            task: The task (must be picklable)
+        """
+        self.queue.enqueue(task)
+
+    def submit_many(self, tasks):
+        """
+        Add several tasks to the dispatcher queue.
+
+        Args:
+            tasks: Iterable of tasks (each must be picklable)
+        """
+        self.queue.enqueue_many(tasks)
+
+    def _record(self, chunk, outcomes):
+        """
+        Move a finished chunk's results into the undo stack and history.
+
+        Args:
+            chunk (list): The tasks that were submitted
+            outcomes (list): What _process_chunk() returned for them
+        """
+        processed = []
+        records = []
+        for task, (succeeded, result) in zip(chunk, outcomes):
+            if succeeded:
+                processed.append(task)
+                records.append(TaskRecord(task, result))
+            else:
+                self.failures.append((task, result))
+        self.stack.push_many(processed)
+        self.history.extend(records)
+
+    def run(self):
+        """
+        Process every task in the dispatcher queue and wait for the results.
+
+        Tasks submitted while run() is collecting results are processed in
+        the same run. If run() fails (e.g. a worker process dies), the
+        tasks of every chunk not yet recorded are put back at the front of
+        the queue in their original order, and the error is raised. A
+        broken pool is shut down, so the next run() starts a fresh one.
+
+        Returns:
+            int: Number of tasks processed successfully
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        in_flight = deque()
+        succeeded = 0
+        try:
+            while in_flight or not self.queue.is_empty():
+                # Keep the pool busy without pickling the whole queue up front
+                while len(in_flight) < self.max_pending and not self.queue.is_empty():
+                    chunk = self.queue.dequeue_many(self.chunk_size)
+                    try:
+                        future = self._executor.submit(_process_chunk, self.worker, chunk)
+                    except BaseException:
+                        # A pool that broke meanwhile refuses the chunk; it goes back behind in_flight
+                        for task in reversed(chunk):
+                            self.queue.requeue_front(task)
+                        raise
+                    in_flight.append((chunk, future))
+
+                chunk, future = in_flight[0]
+                outcomes = future.result()
+                self._record(chunk, outcomes)
+                in_flight.popleft()
+                succeeded += sum(1 for outcome_succeeded, _ in outcomes if outcome_succeeded)
+        except BrokenExecutor:
+            self._requeue(in_flight)
+            # A pool whose worker died refuses all further work; drop it
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            raise
+        except BaseException:
+            self._requeue(in_flight)
+            raise
+        return succeeded
+
+    def _requeue(self, in_flight):
+        """
+        Put the tasks of unrecorded chunks back at the front of the queue.
+
+        Args:
+            in_flight (deque): (chunk, future) pairs not yet recorded, oldest first
+        """
+        # Newest chunk first, so the original order is kept
+        for chunk, future in reversed(in_flight):
+            future.cancel()
+            for task in reversed(chunk):
+                self.queue.requeue_front(task)
+
+    def close(self):
+        """
+        Shut the worker processes down.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        """
+        Enter a with-block; the worker processes are shut down on exit.
+
+        Returns:
+            TaskPipeline: This pipeline
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Shut the worker processes down when leaving a with-block.
+        """
+        self.close()
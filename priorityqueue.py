@@ -0,0 +1,428 @@
+"""
+Priority Queue Data Structure Implementation
+
+This module implements a PriorityQueue on top of a binary heap (the
+standard library's heapq module). Elements are served in priority order,
+lowest priority value first, and elements with equal priority are served
+in the order they were enqueued (FIFO), which is what a task queue needs.
+
+The priority of a queued element can be changed (decrease-key) and an
+element can be removed from anywhere in the queue. Both use lazy deletion:
+the old heap entry is only marked as removed, and marked entries are
+discarded when they reach the top of the heap.
+
+An element may be queued more than once. enqueue() returns a handle for
+the new occurrence, which addresses exactly that occurrence later.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import heapq
+from itertools import count
+
+from events import Event, PrintSink, get_default_sink
+
+
+# Placeholder for the handle of a heap entry that has been removed or reprioritized
+_REMOVED = object()
+
+
+class PriorityHandle:
+    """
+    Handle of one queued occurrence of an element, returned by enqueue().
+
+    A handle stays valid until its occurrence is dequeued or removed, and
+    lets reprioritize/remove/priority address that occurrence even when the
+    same element is queued several times.
+
+    Attributes:
+        item: The queued element
+        _entry (list): The live [priority, sequence, handle] heap entry, or None once gone
+        _owner (PriorityQueue): The queue holding the occurrence, or None once gone
+    """
+
+    __slots__ = ("item", "_entry", "_owner")
+
+    def __init__(self, item, owner):
+        """
+        Initialize a handle for an occurrence about to be queued.
+
+        Args:
+            item: The element
+            owner (PriorityQueue): The queue it is queued in
+        """
+        self.item = item
+        self._entry = None
+        self._owner = owner
+
+    def __repr__(self):
+        """
+        String representation showing the element.
+
+        Returns:
+            str: Representation of the handle
+        """
+        return f"PriorityHandle({self.item!r})"
+
+
+class PriorityQueue:
+    """
+    A heap-based priority queue with stable ordering and decrease-key.
+
+    The PriorityQueue class provides these operations:
+    - enqueue: Add an element with a priority (O(log n))
+    - dequeue: Remove and return the element with the lowest priority value (O(log n))
+    - reprioritize: Change the priority of a queued element (O(log n))
+    - remove: Remove a queued element wherever it is (O(1))
+    - front: View the next element without removing it
+    - is_empty / size / display / clear
+
+    Heap entries are [priority, sequence, handle] lists. The sequence number
+    comes from a counter, so entries with equal priority compare by
+    insertion order and the items themselves are never compared. Elements
+    must be hashable. An element may be queued several times; enqueue()
+    returns a PriorityHandle for each occurrence. reprioritize, remove,
+    priority and `in` accept either a handle or an element, and given an
+    element they act on its earliest-enqueued occurrence.
+
+    Attributes:
+        _heap (list): Heap of entries, including entries marked as removed
+        _entry_finder (dict): Maps each queued element to its live handles, in enqueue order
+        _size (int): Number of live handles
+        _counter: Iterator producing the sequence numbers
+        sink: Callable receiving an Event per operation (None = silent)
+    """
+
+    __slots__ = ("_heap", "_entry_finder", "_size", "_counter", "sink")
+
+    def __init__(self, sink=None):
+        """
+        Initialize an empty priority queue.
+
+        Args:
+            sink: Event sink for operation reports (default: the module default from events.py)
+        """
+        self._heap = []
+        self._entry_finder = {}
+        self._size = 0
+        self._counter = count()
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
+
+    def _push(self, handle, priority):
+        """
+        Add a live heap entry for a handle.
+
+        Args:
+            handle (PriorityHandle): The occurrence to be queued
+            priority: Its priority (lower is served first)
+        """
+        entry = [priority, next(self._counter), handle]
+        handle._entry = entry
+        heapq.heappush(self._heap, entry)
+
+    def _mark_removed(self, handle):
+        """
+        Retire the live entry of a handle without touching the heap order.
+
+        When more than half of the heap is made of retired entries the heap
+        is rebuilt from the live ones, so memory stays proportional to size.
+
+        Args:
+            handle (PriorityHandle): A queued occurrence
+        """
+        handle._entry[-1] = _REMOVED
+        handle._entry = None
+        if len(self._heap) > 2 * self._size + 8:
+            self._heap = [entry for entry in self._heap if entry[-1] is not _REMOVED]
+            heapq.heapify(self._heap)
+
+    def _forget(self, handle):
+        """
+        Drop a handle whose occurrence has left the queue.
+
+        Args:
+            handle (PriorityHandle): The occurrence leaving the queue
+        """
+        handles = self._entry_finder[handle.item]
+        del handles[handle]
+        if not handles:
+            del self._entry_finder[handle.item]
+        handle._owner = None
+        self._size -= 1
+
+    def _find(self, item):
+        """
+        Return the handle an item or handle argument refers to.
+
+        Args:
+            item: A PriorityHandle, or an element (its earliest-enqueued occurrence)
+
+        Returns:
+            PriorityHandle: The live handle, or None if it is not in this queue
+        """
+        if isinstance(item, PriorityHandle):
+            return item if item._owner is self else None
+        handles = self._entry_finder.get(item)
+        return next(iter(handles)) if handles else None
+
+    def _discard_removed(self):
+        """
+        Pop retired entries off the top of the heap.
+        """
+        heap = self._heap
+        while heap and heap[0][-1] is _REMOVED:
+            heapq.heappop(heap)
+
+    def enqueue(self, item, priority=0):
+        """
+        Add an element with the given priority.
+
+        An element that is already queued is queued once more; each
+        occurrence is dequeued separately.
+
+        Args:
+            item: The element to be added (must be hashable)
+            priority: The priority of the element; lower values are served first (default: 0)
+
+        Returns:
+            PriorityHandle: Handle of the new occurrence
+        """
+        handle = PriorityHandle(item, self)
+        self._entry_finder.setdefault(item, {})[handle] = None
+        self._size += 1
+        self._push(handle, priority)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "enqueue", f"Enqueued '{item}' with priority {priority}", item))
+        return handle
+
+    def dequeue(self):
+        """
+        Remove and return the element with the lowest priority value.
+
+        Among elements of equal priority, the one enqueued first is returned.
+
+        Returns:
+            The next element
+
+        Raises:
+            IndexError: If the priority queue is empty (underflow condition)
+        """
+        if not self._size:
+            raise IndexError("Cannot dequeue from an empty priority queue (Queue Underflow)")
+
+        self._discard_removed()
+        priority, _, handle = heapq.heappop(self._heap)
+        handle._entry = None
+        self._forget(handle)
+        item = handle.item
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "dequeue", f"Dequeued '{item}' with priority {priority}", item))
+        return item
+
+    def reprioritize(self, item, priority):
+        """
+        Change the priority of a queued element (decrease-key or increase-key).
+
+        The element goes behind other elements of its new priority.
+
+        Args:
+            item: A PriorityHandle, or a queued element (its earliest-enqueued occurrence)
+            priority: The new priority
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the element is not in the priority queue
+        """
+        handle = self._find(item)
+        if handle is None:
+            raise ValueError(f"Item '{item}' is not in the priority queue")
+
+        self._mark_removed(handle)
+        self._push(handle, priority)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "reprioritize", f"Changed priority of '{handle.item}' to {priority}", handle.item))
+
+    def remove(self, item):
+        """
+        Remove a queued element, wherever it is in the queue.
+
+        Args:
+            item: A PriorityHandle, or the element to be removed (its earliest-enqueued occurrence)
+
+        Returns:
+            bool: True if the element was removed, False if it was not queued
+        """
+        handle = self._find(item)
+        if handle is None:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "remove", f"Item '{item}' not found in the priority queue", item))
+            return False
+
+        self._forget(handle)
+        self._mark_removed(handle)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "remove", f"Removed '{handle.item}' from the priority queue", handle.item))
+        return True
+
+    def priority(self, item):
+        """
+        Return the current priority of a queued element.
+
+        Args:
+            item: A PriorityHandle, or a queued element (its earliest-enqueued occurrence)
+
+        Returns:
+            The element's priority
+
+        Raises:
+            ValueError: If the element is not in the priority queue
+        """
+        handle = self._find(item)
+        if handle is None:
+            raise ValueError(f"Item '{item}' is not in the priority queue")
+        return handle._entry[0]
+
+    def front(self):
+        """
+        Return the next element without removing it.
+
+        Returns:
+            The element dequeue() would return
+
+        Raises:
+            IndexError: If the priority queue is empty
+        """
+        if not self._size:
+            raise IndexError("Cannot access front of an empty priority queue")
+
+        self._discard_removed()
+        front_item = self._heap[0][-1].item
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "front", f"Front element is '{front_item}'", front_item))
+        return front_item
+
+    def _live_entries(self):
+        """
+        Return the live heap entries in dequeue order.
+
+        Returns:
+            list: Sorted [priority, sequence, handle] entries
+        """
+        return sorted(entry for entry in self._heap if entry[-1] is not _REMOVED)
+
+    def is_empty(self):
+        """
+        Check if the priority queue is empty.
+
+        Returns:
+            bool: True if no element is queued, False otherwise
+        """
+        return not self._size
+
+    def size(self):
+        """
+        Get the number of queued elements.
+
+        Returns:
+            int: Number of elements (retired heap entries are not counted)
+        """
+        queue_size = self._size
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Priority queue size: {queue_size}", queue_size))
+        return queue_size
+
+    def display(self):
+        """
+        Display the queued elements in the order they would be dequeued.
+
+        Returns:
+            None
+        """
+        if self.is_empty():
+            print("Priority queue is empty: []")
+        else:
+            entries = self._live_entries()
+            print(f"Priority queue contents (next first): {[(entry[2].item, entry[0]) for entry in entries]}")
+            print(f"Front -> {entries[0][2].item}")
+
+    def clear(self):
+        """
+        Remove all elements from the priority queue.
+
+        Every handle is detached so that handles kept from before the clear
+        are rejected; this makes clear() O(n).
+
+        Returns:
+            None
+        """
+        for entry in self._heap:
+            if entry[-1] is not _REMOVED:
+                entry[-1]._entry = None
+                entry[-1]._owner = None
+        self._heap = []
+        self._entry_finder = {}
+        self._size = 0
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Priority queue has been cleared", None))
+
+    def __len__(self):
+        """
+        Return the number of queued elements, enabling len(priority_queue).
+
+        Returns:
+            int: Number of elements
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Iterate over the elements in dequeue order without removing them.
+
+        This sorts a snapshot of the live entries, so it costs O(n log n).
+
+        Returns:
+            iterator: Iterator over the queued elements
+        """
+        return iter([entry[2].item for entry in self._live_entries()])
+
+    def __contains__(self, item):
+        """
+        Check whether an element is queued in O(1), enabling `item in priority_queue`.
+
+        Args:
+            item: The element, or a PriorityHandle, to look for
+
+        Returns:
+            bool: True if the element is queued
+        """
+        return self._find(item) is not None
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    print("=== Priority Queue Demo ===")
+
+    priority_queue = PriorityQueue(sink=PrintSink())
+
+    print("\n1. Testing enqueue operations:")
+    priority_queue.enqueue("Backup Files", priority=3)
+    priority_queue.enqueue("Email Report", priority=1)
+    priority_queue.enqueue("Update Database", priority=2)
+    priority_queue.enqueue("Send Notifications", priority=1)
+    priority_queue.display()
+
+    print("\n2. Testing reprioritize and remove:")
+    priority_queue.reprioritize("Backup Files", 0)
+    priority_queue.remove("Update Database")
+    priority_queue.display()
+
+    print("\n3. Testing dequeue operations (equal priorities stay FIFO):")
+    while not priority_queue.is_empty():
+        priority_queue.dequeue()
+    priority_queue.display()
+
+    print("\n=== Priority Queue Demo Complete ===")
@@ -0,0 +1,216 @@
+"""
+Scenario Profiling Harness
+
+This module profiles the DataStructureManager scenarios, one at a time,
+so time can be attributed to an integration flow rather than to single
+operations. Each scenario is run `scale` times in a row on fresh, silent
+managers (their printing goes to a throwaway buffer) and profiled twice:
+
+1. With a sampling profiler: a SIGPROF timer interrupts the run every
+   interval seconds of CPU time and records the Python call stack. The
+   stacks are written in the folded format (`frame;frame;frame count`)
+   that flamegraph.pl, speedscope and inferno read directly.
+2. With cProfile: the statistics are saved as a .prof file (for pstats,
+   snakeviz, ...) and the top-N functions by own time are printed.
+
+The sampler relies on signal.setitimer, which is only available on Unix;
+elsewhere only the cProfile pass runs.
+
+Run it through main.py:
+
+    python main.py --profile [--scale 10 100 1000] [--top 15] [--profile-dir profiles]
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import signal
+from collections import Counter
+
+
+class StackSampler:
+    """
+    A statistical profiler that samples the call stack on a CPU-time timer.
+
+    Only frames below the sampler's root code object are recorded, so the
+    harness itself does not appear in the stacks.
+
+    Attributes:
+        interval (float): Seconds of CPU time between samples
+        counts (Counter): Number of samples per folded stack
+        _root_code: Code object whose frame is the top of every recorded stack
+        _previous_handler: SIGPROF handler to restore on stop()
+    """
+
+    __slots__ = ("interval", "counts", "_root_code", "_previous_handler")
+
+    def __init__(self, root_code, interval=0.001):
+        """
+        Initialize an idle sampler.
+
+        Args:
+            root_code: Code object of the function that runs the profiled work
+            interval (float): Seconds of CPU time between samples (default: 0.001)
+        """
+        self.interval = interval
+        self.counts = Counter()
+        self._root_code = root_code
+        self._previous_handler = None
+
+    @staticmethod
+    def available():
+        """
+        Check whether the platform supports CPU-time interval timers.
+
+        Returns:
+            bool: True if sampling can run here
+        """
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def _sample(self, signum, frame):
+        """
+        Record the stack of the interrupted frame (the SIGPROF handler).
+        """
+        names = []
+        while frame is not None and frame.f_code is not self._root_code:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if frame is None:
+            # Interrupted outside the profiled work
+            return
+        names.reverse()
+        self.counts[";".join(names) or "<root>"] += 1
+
+    def start(self):
+        """
+        Install the signal handler and start the timer.
+        """
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        """
+        Stop the timer and restore the previous signal handler.
+        """
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+    def write_folded(self, path):
+        """
+        Write the samples in folded-stack format, one stack per line.
+
+        Args:
+            path (str): Destination file
+
+        Returns:
+            int: Total number of samples
+        """
+        with open(path, "w") as folded_file:
+            for stack, count in sorted(self.counts.items()):
+                folded_file.write(f"{stack} {count}\n")
+        return sum(self.counts.values())
+
+
+def _run_scenario(managers, name):
+    """
+    Run one scenario on each prepared manager (the root frame of every sample).
+
+    Args:
+        managers (list): Fresh DataStructureManager instances
+        name (str): Name of the scenario method
+    """
+    for manager in managers:
+        getattr(manager, name)()
+
+
+def _prepare(manager_factory, scale):
+    """
+    Create fresh managers with their construction output discarded.
+
+    Args:
+        manager_factory: Callable returning a silent DataStructureManager
+        scale (int): Number of managers
+
+    Returns:
+        list: The managers
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [manager_factory() for _ in range(scale)]
+
+
+def top_functions(profiler, top):
+    """
+    Format the functions with the most own time as a table.
+
+    Args:
+        profiler (cProfile.Profile): A profiler that has been run
+        top (int): Number of rows
+
+    Returns:
+        str: The table
+    """
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda entry: entry[1][2], reverse=True)[:top]
+    lines = [f"    {'calls':>9} {'own s':>9} {'total s':>9}  function"]
+    for (filename, line, function), (_, calls, own_time, total_time, _) in rows:
+        location = f"{os.path.basename(filename)}:{line}" if line else filename
+        lines.append(f"    {calls:>9} {own_time:>9.4f} {total_time:>9.4f}  {function} ({location})")
+    return "\n".join(lines)
+
+
+def profile_scenarios(manager_factory, scenarios, scales=(1,), top=15, output_dir="profiles",
+                      interval=0.001):
+    """
+    Profile every scenario at every scale and write the results.
+
+    For each scenario and scale this writes <scenario>-x<scale>.folded
+    (sampled stacks, Unix only) and <scenario>-x<scale>.prof (cProfile
+    statistics) to output_dir, and prints the top-N table.
+
+    Args:
+        manager_factory: Callable returning a silent DataStructureManager
+        scenarios: Names of the manager methods to profile
+        scales: Numbers of back-to-back runs per scenario (default: (1,))
+        top (int): Rows in each hot-function table (default: 15)
+        output_dir (str): Directory for the output files (default: "profiles")
+        interval (float): Sampling interval in seconds of CPU time (default: 0.001)
+
+    Returns:
+        None
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    sampling = StackSampler.available()
+    if not sampling:
+        print("Note: signal.setitimer is unavailable here; skipping the sampling profiler")
+
+    for name in scenarios:
+        for scale in scales:
+            stem = os.path.join(output_dir, f"{name}-x{scale}")
+            print(f"\n=== {name} x{scale} ===")
+
+            if sampling:
+                managers = _prepare(manager_factory, scale)
+                sampler = StackSampler(_run_scenario.__code__, interval)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sampler.start()
+                    try:
+                        _run_scenario(managers, name)
+                    finally:
+                        sampler.stop()
+                samples = sampler.write_folded(f"{stem}.folded")
+                print(f"  {samples} samples -> {stem}.folded")
+
+            managers = _prepare(manager_factory, scale)
+            profiler = cProfile.Profile()
+            with contextlib.redirect_stdout(io.StringIO()):
+                profiler.runcall(_run_scenario, managers, name)
+            profiler.dump_stats(f"{stem}.prof")
+            total = sum(entry[2] for entry in pstats.Stats(profiler).stats.values())
+            print(f"  cProfile: {total:.4f} s own time -> {stem}.prof")
+            print(top_functions(profiler, top))
@@ -1,45 +1,128 @@
 """
 Queue Data Structure Implementation
 
-This module implements a Queue data structure using Python's built-in list.
-A queue follows the FIFO (First In, First Out) principle.
+This module implements a Queue data structure on top of a growable ring
+buffer (see ringbuffer.py). A queue follows the FIFO (First In, First Out)
+principle.
+
+Besides the single-threaded enqueue/dequeue API, the Queue offers a
+thread-safe blocking API (put/get/task_done/join) with the same semantics
+as the standard library's queue.Queue, including the Empty and Full
+exceptions defined here.
+
+This module shadows the standard library's queue inside the project, so
+it also provides SimpleQueue, taken from the same C module the standard
+library uses. Standard library code that does 'import queue'
+(concurrent.futures, multiprocessing.pool, logging.handlers) needs
+Queue, SimpleQueue, Empty and Full, and expects SimpleQueue to raise
+this module's Empty.
 
 Author: Educational Python Project  
 Date: July 28, 2025
 """
 
+import threading
+import time
+
+from events import Event, PrintSink, get_default_sink
+from persistence import read_snapshot, write_snapshot
+from ringbuffer import RingBuffer
+
+
+try:
+    # SimpleQueue.get() raises _queue.Empty, so Empty must be that same class
+    from _queue import Empty
+except ImportError:
+    class Empty(Exception):
+        """
+        Raised by get() when no element becomes available (non-blocking or timed out).
+        """
+        pass
+
+
+class Full(Exception):
+    """
+    Raised by put() when no space becomes available (non-blocking or timed out).
+    """
+    pass
+
 
 class Queue:
     """
-    A Queue implementation using Python list as the underlying data structure.
+    A Queue implementation using a circular buffer as the underlying data structure.
     
     The Queue class provides standard queue operations:
     - enqueue: Add an element to the rear
     - dequeue: Remove and return the front element
+    - enqueue_many / dequeue_many: Bulk versions of enqueue and dequeue
+    - requeue_front: Put an element back at the front in O(1)
     - front: View the front element without removing it
     - is_empty: Check if queue is empty
     - size: Get the number of elements
     
+    Concurrent mode: put/get/task_done/join are thread-safe and block on
+    condition variables instead of busy-polling. The other methods take no
+    lock, so a queue shared between threads should only be used through
+    the concurrent methods (plus qsize/empty/full).
+    
+    Operations are reported to an optional event sink (see events.py),
+    except for the concurrent methods: they are the standard library's
+    API, and standard library code creating a Queue(maxsize) would
+    otherwise report to the module default sink.
+    
     Attributes:
-        _items (list): Internal list to store queue elements
+        _items (RingBuffer): Internal circular buffer (or storage engine) to store queue elements
+        sink: Callable receiving an Event per operation (None = silent)
+        maxsize (int): Capacity enforced by put() (0 or less means unbounded)
+        _mutex (threading.Lock): Lock guarding the concurrent methods
+        _not_empty (threading.Condition): Signalled when an element is put
+        _not_full (threading.Condition): Signalled when an element is taken by get
+        _all_tasks_done (threading.Condition): Signalled when the unfinished count hits zero
+        _unfinished_tasks (int): Elements put but not yet marked with task_done()
     """
     
-    def __init__(self):
+    __slots__ = ("_items", "sink", "maxsize", "_mutex", "_not_empty", "_not_full",
+                 "_all_tasks_done", "_unfinished_tasks")
+    
+    def __init__(self, maxsize=0, *, sink=None, storage=None):
         """
         Initialize an empty queue.
         
-        The constructor creates an empty list to store queue elements.
+        The constructor creates an empty ring buffer to store queue elements.
         Using a private attribute (_items) to encapsulate the internal structure.
-        Front of queue is at index 0, rear is at the end of the list.
+        Front of queue is at index 0, rear is at index -1 of the buffer.
+        
+        Any storage engine with the RingBuffer methods used here (append,
+        appendleft, popleft, extend, popleft_many, clear, indexing at 0 and
+        -1, len()) can be used instead, e.g. a Deque (see deque.py).
+        
+        maxsize comes first, as in the standard library, so Queue(10) is a
+        bounded queue.
+        
+        Args:
+            maxsize (int): Capacity for put(); producers block when it is reached (default: unbounded)
+            sink: Event sink for operation reports (default: the module default from events.py)
+            storage: Storage engine for the elements, front first (default: a new RingBuffer)
         """
-        # Initialize empty list to store queue elements
-        self._items = []
+        # Initialize empty ring buffer to store queue elements
+        self._items = storage if storage is not None else RingBuffer()
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
+        
+        # Synchronization for the concurrent methods: three conditions share one lock
+        self.maxsize = maxsize
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._unfinished_tasks = 0
     
     def enqueue(self, item):
         """
         Add an element to the rear of the queue.
         
-        This operation has O(1) time complexity as we append to the end of the list.
+        This operation has amortized O(1) time complexity as we write at the
+        tail index of the ring buffer.
         
         Args:
             item: The element to be added to the queue (can be any data type)
@@ -47,16 +130,35 @@ class Queue:
         Returns:
             None
         """
-        # Append the item to the end of the list (rear of queue)
+        # Append the item at the tail of the buffer (rear of queue)
         self._items.append(item)
-        print(f"Enqueued '{item}' to the queue")
-    
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "enqueue", f"Enqueued '{item}' to the queue", item))
+
+    def requeue_front(self, item):
+        """
+        Put an element back at the front of the queue, ahead of all others.
+
+        This is meant for returning a task for reprocessing (e.g. after an
+        undo). It has amortized O(1) time complexity: the head index of the
+        ring buffer steps back one slot, so no other element moves.
+
+        Args:
+            item: The element to be placed at the front
+
+        Returns:
+            None
+        """
+        self._items.appendleft(item)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "requeue_front", f"Requeued '{item}' at the front of the queue", item))
+
     def dequeue(self):
         """
         Remove and return the front element from the queue.
         
-        This operation has O(n) time complexity due to list shifting,
-        but provides clear FIFO semantics for educational purposes.
+        This operation has amortized O(1) time complexity: the head index
+        advances instead of shifting the remaining elements.
         
         Returns:
             The front element from the queue
@@ -68,11 +170,58 @@ class Queue:
         if self.is_empty():
             raise IndexError("Cannot dequeue from an empty queue (Queue Underflow)")
         
-        # Remove and return the first element (front of queue)
-        dequeued_item = self._items.pop(0)
-        print(f"Dequeued '{dequeued_item}' from the queue")
+        # Remove and return the element at the head (front of queue)
+        dequeued_item = self._items.popleft()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "dequeue", f"Dequeued '{dequeued_item}' from the queue", dequeued_item))
         return dequeued_item
     
+    def enqueue_many(self, iterable):
+        """
+        Add every element of an iterable to the rear of the queue.
+        
+        The ring buffer grows at most once and copies the elements in with
+        slice assignments; one event is reported for the whole batch.
+        
+        Args:
+            iterable: The elements to be added, front to rear
+        
+        Returns:
+            int: Number of elements enqueued
+        """
+        enqueued_count = self._items.extend(iterable)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "enqueue_many",
+                            f"Enqueued {enqueued_count} items to the queue", enqueued_count))
+        return enqueued_count
+    
+    def dequeue_many(self, n):
+        """
+        Remove and return up to n elements from the front of the queue.
+        
+        The elements are sliced out of the ring buffer in one operation and
+        one event is reported for the whole batch. Asking for more elements
+        than the queue holds drains it instead of raising an error.
+        
+        Args:
+            n (int): Maximum number of elements to remove
+        
+        Returns:
+            list: The removed elements in FIFO order
+            
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError(f"Cannot dequeue a negative number of elements ({n})")
+        
+        dequeued_items = self._items.popleft_many(n)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "dequeue_many",
+                            f"Dequeued {len(dequeued_items)} items from the queue",
+                            len(dequeued_items)))
+        return dequeued_items
+    
     def front(self):
         """
         Return the front element without removing it from the queue.
@@ -91,7 +240,8 @@ class Queue:
         
         # Return the first element without removing it
         front_item = self._items[0]
-        print(f"Front element is '{front_item}'")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "front", f"Front element is '{front_item}'", front_item))
         return front_item
     
     def rear(self):
@@ -112,7 +262,8 @@ class Queue:
         
         # Return the last element without removing it
         rear_item = self._items[-1]
-        print(f"Rear element is '{rear_item}'")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "rear", f"Rear element is '{rear_item}'", rear_item))
         return rear_item
     
     def is_empty(self):
@@ -124,7 +275,7 @@ class Queue:
         Returns:
             bool: True if queue is empty, False otherwise
         """
-        # Return True if list length is 0, False otherwise
+        # Return True if buffer length is 0, False otherwise
         return len(self._items) == 0
     
     def size(self):
@@ -136,9 +287,10 @@ class Queue:
         Returns:
             int: Number of elements in the queue
         """
-        # Return the length of the internal list
+        # Return the length of the internal buffer
         queue_size = len(self._items)
-        print(f"Queue size: {queue_size}")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Queue size: {queue_size}", queue_size))
         return queue_size
     
     def display(self):
@@ -155,7 +307,7 @@ class Queue:
             print("Queue is empty: []")
         else:
             # Display queue with front and rear elements indicated
-            print(f"Queue contents (front to rear): {self._items}")
+            print(f"Queue contents (front to rear): {list(self._items)}")
             print(f"Front -> {self._items[0]}, Rear -> {self._items[-1]}")
     
     def clear(self):
@@ -167,9 +319,274 @@ class Queue:
         Returns:
             None
         """
-        # Clear all elements from the internal list
+        # Clear all elements from the internal buffer
         self._items.clear()
-        print("Queue has been cleared")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Queue has been cleared", None))
+    
+    def save(self, path):
+        """
+        Save the elements, front to rear, to a binary snapshot file.
+        
+        See persistence.py for the format; integer, float and string
+        queues are written as packed arrays.
+        
+        Args:
+            path (str): Destination file
+        
+        Returns:
+            int: Number of elements saved
+        """
+        saved_count = write_snapshot(path, "queue", self._items)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "save", f"Saved {saved_count} items to '{path}'", saved_count))
+        return saved_count
+    
+    @classmethod
+    def load(cls, path, sink=None, **options):
+        """
+        Create a queue from a snapshot file written by save().
+        
+        Args:
+            path (str): Snapshot file
+            sink: Event sink for the new queue
+            **options: Extra keyword arguments for the constructor (e.g. maxsize=100)
+        
+        Returns:
+            A new queue of this class with the saved elements
+        
+        Raises:
+            ValueError: If the file is not a queue snapshot
+        """
+        queue = cls(sink=sink, **options)
+        queue.enqueue_many(read_snapshot(path, "queue"))
+        return queue
+    
+    def put(self, item, block=True, timeout=None):
+        """
+        Add an element to the rear of the queue (thread-safe, reports no event).
+        
+        If the queue has a maxsize and is full, the caller waits on a
+        condition variable until a consumer makes room.
+        
+        Args:
+            item: The element to be added to the queue
+            block (bool): Wait for free space if the queue is full (default: True)
+            timeout (float): Maximum seconds to wait when blocking (default: forever)
+        
+        Returns:
+            None
+            
+        Raises:
+            Full: If no space became available (non-blocking call or timeout)
+            ValueError: If timeout is negative
+        """
+        with self._not_full:
+            if self.maxsize > 0:
+                if not block:
+                    if len(self._items) >= self.maxsize:
+                        raise Full
+                elif timeout is None:
+                    while len(self._items) >= self.maxsize:
+                        self._not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    deadline = time.monotonic() + timeout
+                    while len(self._items) >= self.maxsize:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0.0:
+                            raise Full
+                        self._not_full.wait(remaining)
+            
+            self._items.append(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+    
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the front element of the queue (thread-safe, reports no event).
+        
+        If the queue is empty, the caller waits on a condition variable
+        until a producer puts an element.
+        
+        Args:
+            block (bool): Wait for an element if the queue is empty (default: True)
+            timeout (float): Maximum seconds to wait when blocking (default: forever)
+        
+        Returns:
+            The front element from the queue
+            
+        Raises:
+            Empty: If no element became available (non-blocking call or timeout)
+            ValueError: If timeout is negative
+        """
+        with self._not_empty:
+            if not block:
+                if not len(self._items):
+                    raise Empty
+            elif timeout is None:
+                while not len(self._items):
+                    self._not_empty.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                deadline = time.monotonic() + timeout
+                while not len(self._items):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+            
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+    
+    def put_nowait(self, item):
+        """
+        Add an element without blocking; equivalent to put(item, block=False).
+        
+        Args:
+            item: The element to be added to the queue
+        
+        Raises:
+            Full: If the queue is full
+        """
+        return self.put(item, block=False)
+    
+    def get_nowait(self):
+        """
+        Remove and return the front element without blocking; equivalent to get(block=False).
+        
+        Returns:
+            The front element from the queue
+            
+        Raises:
+            Empty: If the queue is empty
+        """
+        return self.get(block=False)
+    
+    def task_done(self):
+        """
+        Mark one element previously returned by get() as fully processed.
+        
+        Consumers call this once per element so that join() knows when all
+        the work put into the queue has been handled.
+        
+        Raises:
+            ValueError: If called more times than elements were put
+        """
+        with self._all_tasks_done:
+            unfinished = self._unfinished_tasks - 1
+            if unfinished < 0:
+                raise ValueError("task_done() called too many times")
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+            self._unfinished_tasks = unfinished
+    
+    def join(self):
+        """
+        Block until every element put into the queue has been marked with task_done().
+        
+        Returns:
+            None
+        """
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+    
+    def qsize(self):
+        """
+        Get the number of elements under the lock (thread-safe, reports no event).
+        
+        Returns:
+            int: Number of elements in the queue
+        """
+        with self._mutex:
+            return len(self._items)
+    
+    def empty(self):
+        """
+        Check under the lock whether the queue is empty (thread-safe).
+        
+        Returns:
+            bool: True if the queue is empty
+        """
+        with self._mutex:
+            return not len(self._items)
+    
+    def full(self):
+        """
+        Check under the lock whether the queue has reached its maxsize (thread-safe).
+        
+        Returns:
+            bool: True if the queue is bounded and full
+        """
+        with self._mutex:
+            return 0 < self.maxsize <= len(self._items)
+    
+    def __len__(self):
+        """
+        Return the number of elements, enabling len(queue).
+        
+        Unlike size(), this does not report an event.
+        
+        Returns:
+            int: Number of elements in the queue
+        """
+        return len(self._items)
+    
+    def __iter__(self):
+        """
+        Iterate over the elements from front to rear without removing them.
+        
+        This is a single O(n) pass over the ring buffer.
+        
+        Returns:
+            iterator: Iterator over the queue elements
+        """
+        return iter(self._items)
+    
+    def __reversed__(self):
+        """
+        Iterate over the elements from rear to front without removing them.
+        
+        Returns:
+            iterator: Reverse iterator over the queue elements
+        """
+        return reversed(self._items)
+    
+    def __contains__(self, item):
+        """
+        Check whether an element is in the queue, enabling `item in queue`.
+        
+        Args:
+            item: The element to look for
+        
+        Returns:
+            bool: True if an equal element is in the queue
+        """
+        return item in self._items
+
+
+try:
+    # The standard library's lock-free C implementation
+    from _queue import SimpleQueue
+except ImportError:
+    class SimpleQueue(Queue):
+        """
+        An unbounded FIFO queue offering only put/get/put_nowait/get_nowait/empty/qsize.
+
+        Fallback for interpreters without the _queue C module.
+        """
+
+        __slots__ = ()
+
+        def __init__(self):
+            """
+            Initialize an empty, unbounded queue.
+            """
+            super().__init__()
 
 
 # Example usage and testing (only runs when script is executed directly)
@@ -177,7 +594,7 @@ if __name__ == "__main__":
     print("=== Queue Data Structure Demo ===")
     
     # Create a new queue instance
-    queue = Queue()
+    queue = Queue(sink=PrintSink())
     
     # Test empty queue
     print("\n1. Testing empty queue:")
@@ -0,0 +1,357 @@
+"""
+Ring Buffer Storage Engine
+
+This module implements a growable circular buffer that the queue-like data
+structures use as their backing store. Elements live in a fixed-size Python
+list and two indices (head and tail) chase each other around it, so adding
+at the rear and removing from the front never shift the other elements.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+
+class RingBuffer:
+    """
+    A growable circular buffer with amortized O(1) operations at both ends.
+
+    The buffer capacity is always a power of two so that wrapping an index
+    around the end of the backing list is a cheap bit mask instead of a
+    modulo. When the buffer fills up its capacity doubles, and when it
+    drains below a quarter of its capacity it shrinks by half, so memory
+    follows the number of stored elements.
+
+    Attributes:
+        _buffer (list): Backing list holding the elements (unused slots are None)
+        _head (int): Index of the front element
+        _tail (int): Index of the slot just past the rear element
+        _count (int): Number of stored elements
+        _mask (int): Capacity minus one, used to wrap indices
+    """
+
+    __slots__ = ("_buffer", "_head", "_tail", "_count", "_mask")
+
+    # Smallest capacity the buffer will shrink down to
+    MIN_CAPACITY = 8
+
+    def __init__(self, iterable=()):
+        """
+        Initialize the ring buffer, optionally filled from an iterable.
+
+        Args:
+            iterable: Elements to add to the buffer in order (default: empty)
+        """
+        self._buffer = [None] * self.MIN_CAPACITY
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._mask = self.MIN_CAPACITY - 1
+        for item in iterable:
+            self.append(item)
+
+    def append(self, item):
+        """
+        Add an element at the rear of the buffer.
+
+        This operation has amortized O(1) time complexity; the occasional
+        resize copies every element once.
+
+        Args:
+            item: The element to be added
+
+        Returns:
+            None
+        """
+        if self._count > self._mask:
+            self._resize((self._mask + 1) * 2)
+        self._buffer[self._tail] = item
+        self._tail = (self._tail + 1) & self._mask
+        self._count += 1
+
+    def appendleft(self, item):
+        """
+        Add an element at the front of the buffer.
+
+        The head index steps back one slot (wrapping around), so this is
+        amortized O(1) like append().
+
+        Args:
+            item: The element to be added
+
+        Returns:
+            None
+        """
+        if self._count > self._mask:
+            self._resize((self._mask + 1) * 2)
+        self._head = (self._head - 1) & self._mask
+        self._buffer[self._head] = item
+        self._count += 1
+
+    def popleft(self):
+        """
+        Remove and return the element at the front of the buffer.
+
+        This operation has amortized O(1) time complexity.
+
+        Returns:
+            The front element
+
+        Raises:
+            IndexError: If the buffer is empty
+        """
+        if self._count == 0:
+            raise IndexError("popleft from an empty ring buffer")
+
+        item = self._buffer[self._head]
+        # Drop the reference so the element can be garbage collected
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) & self._mask
+        self._count -= 1
+        self._shrink_if_sparse()
+        return item
+
+    def pop(self):
+        """
+        Remove and return the element at the rear of the buffer.
+
+        This operation has amortized O(1) time complexity.
+
+        Returns:
+            The rear element
+
+        Raises:
+            IndexError: If the buffer is empty
+        """
+        if self._count == 0:
+            raise IndexError("pop from an empty ring buffer")
+
+        self._tail = (self._tail - 1) & self._mask
+        item = self._buffer[self._tail]
+        # Drop the reference so the element can be garbage collected
+        self._buffer[self._tail] = None
+        self._count -= 1
+        self._shrink_if_sparse()
+        return item
+
+    def rotate(self, n=1):
+        """
+        Rotate the elements n steps to the right (to the left if n is negative).
+
+        Like collections.deque.rotate(), rotating one step to the right
+        moves the rear element to the front. Elements are moved the shorter
+        way around, so this costs O(min(k, len - k)) for k = n mod len, and
+        when the buffer is full only the indices move.
+
+        Args:
+            n (int): Number of steps to rotate (default: 1)
+
+        Returns:
+            None
+        """
+        count = self._count
+        if count <= 1:
+            return
+        n %= count
+        if n == 0:
+            return
+
+        buffer = self._buffer
+        mask = self._mask
+        if count > mask:
+            # No free slots: the element order is already circular
+            self._head = (self._head - n) & mask
+            self._tail = self._head
+            return
+
+        head = self._head
+        tail = self._tail
+        if n <= count - n:
+            # Move the last n elements into the free slots before the head
+            for _ in range(n):
+                tail = (tail - 1) & mask
+                head = (head - 1) & mask
+                buffer[head] = buffer[tail]
+                buffer[tail] = None
+        else:
+            # Move the first count - n elements into the free slots after the tail
+            for _ in range(count - n):
+                buffer[tail] = buffer[head]
+                buffer[head] = None
+                head = (head + 1) & mask
+                tail = (tail + 1) & mask
+        self._head = head
+        self._tail = tail
+
+    def extend(self, iterable):
+        """
+        Add every element of an iterable at the rear of the buffer.
+
+        The buffer grows at most once and the elements are copied in with
+        one or two slice assignments, instead of one append() per element.
+
+        Args:
+            iterable: Elements to add in order
+
+        Returns:
+            int: Number of elements added
+        """
+        items = iterable if isinstance(iterable, list) else list(iterable)
+        added = len(items)
+        if added == 0:
+            return 0
+
+        needed = self._count + added
+        capacity = self._mask + 1
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+        # Copy into the run up to the end of the backing list, then wrap around
+        tail = self._tail
+        first = min(added, capacity - tail)
+        self._buffer[tail:tail + first] = items[:first] if first < added else items
+        if first < added:
+            self._buffer[:added - first] = items[first:]
+        self._tail = (tail + added) & self._mask
+        self._count = needed
+        return added
+
+    def popleft_many(self, n):
+        """
+        Remove and return up to n elements from the front of the buffer.
+
+        The elements are copied out with one or two slices rather than one
+        popleft() per element.
+
+        Args:
+            n (int): Maximum number of elements to remove
+
+        Returns:
+            list: The removed elements in FIFO order (shorter than n if the buffer runs out)
+        """
+        count = min(n, self._count)
+        if count <= 0:
+            return []
+
+        head = self._head
+        capacity = self._mask + 1
+        first = min(count, capacity - head)
+        removed = self._buffer[head:head + first]
+        self._buffer[head:head + first] = [None] * first
+        if first < count:
+            rest = count - first
+            removed += self._buffer[:rest]
+            self._buffer[:rest] = [None] * rest
+        self._head = (head + count) & self._mask
+        self._count -= count
+
+        # Shrink in one step to the smallest capacity that is not sparse
+        target = capacity
+        while target > self.MIN_CAPACITY and self._count <= target // 4:
+            target //= 2
+        if target != capacity:
+            self._resize(target)
+        return removed
+
+    def clear(self):
+        """
+        Remove all elements and reset the buffer to its minimum capacity.
+
+        Returns:
+            None
+        """
+        self._buffer = [None] * self.MIN_CAPACITY
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._mask = self.MIN_CAPACITY - 1
+
+    def _shrink_if_sparse(self):
+        """
+        Halve the capacity when the buffer is at most a quarter full.
+
+        This way a drained buffer releases its memory.
+        """
+        capacity = self._mask + 1
+        if capacity > self.MIN_CAPACITY and self._count <= capacity // 4:
+            self._resize(capacity // 2)
+
+    def _resize(self, capacity):
+        """
+        Copy the elements into a new backing list of the given capacity.
+
+        The elements are unwrapped so the front element lands at index 0.
+
+        Args:
+            capacity (int): New capacity, a power of two no smaller than the count
+        """
+        new_buffer = list(self)
+        new_buffer.extend([None] * (capacity - self._count))
+        self._buffer = new_buffer
+        self._head = 0
+        self._tail = self._count & (capacity - 1)
+        self._mask = capacity - 1
+
+    def __len__(self):
+        """
+        Return the number of stored elements.
+
+        Returns:
+            int: Number of elements in the buffer
+        """
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        Return the element at a logical index (0 is the front, -1 the rear).
+
+        Args:
+            index (int): Position relative to the front (negative counts from the rear)
+
+        Returns:
+            The element at the given position
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("ring buffer index out of range")
+        return self._buffer[(self._head + index) & self._mask]
+
+    def __iter__(self):
+        """
+        Iterate over the elements from front to rear.
+
+        Yields:
+            Each stored element in FIFO order
+        """
+        end = self._head + self._count
+        if end <= self._mask + 1:
+            # Elements are contiguous in the backing list
+            yield from self._buffer[self._head:end]
+        else:
+            # Elements wrap around the end of the backing list
+            yield from self._buffer[self._head:]
+            yield from self._buffer[:self._tail]
+
+    def __reversed__(self):
+        """
+        Iterate over the elements from rear to front.
+
+        Yields:
+            Each stored element in reverse FIFO order
+        """
+        for offset in range(self._count - 1, -1, -1):
+            yield self._buffer[(self._head + offset) & self._mask]
+
+    def __repr__(self):
+        """
+        String representation listing the elements from front to rear.
+
+        Returns:
+            str: Representation of the buffer contents
+        """
+        return f"RingBuffer({list(self)!r})"
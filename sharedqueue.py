@@ -0,0 +1,647 @@
+"""
+Shared-Memory Queue for Inter-Process Handoff
+
+This module implements a FIFO queue of byte payloads whose storage is a
+ring buffer in multiprocessing.shared_memory. Any process that attaches
+to the same block reads and writes the payloads in place. Nothing is
+pickled or sent through a pipe. The consumer can even read a payload
+through a memoryview of the shared block without copying it (consume()).
+
+Layout of the shared block:
+
+    [ consumer line | producer line | capacity, mode | ring of records ... ]
+
+Each record is a 4-byte length followed by the payload, padded to 8
+bytes. A record never wraps around the end of the ring, so every payload
+is contiguous and can be handed out as one memoryview. When a record does
+not fit before the end, the producer writes a wrap marker and starts
+again at offset 0. The head (read) and tail (write) cursors are byte
+counts that only grow. They live on separate cache lines, and each is
+written by one side only.
+
+Modes:
+- "spsc": one producer and one consumer, no locks. The producer publishes
+  a record by writing the tail after the payload, and the consumer frees
+  it by writing the head after reading. This needs aligned 8-byte stores
+  that are atomic and a CPU that keeps stores in order and loads in order
+  (total store order), which x86-64 guarantees. Weaker memory models such
+  as ARM's may reorder the payload and cursor accesses, and Python code
+  cannot add the barriers, so on any other CPU both sides take a
+  multiprocessing.Lock instead.
+- "mpsc": any number of producers and one consumer. Producers take a
+  multiprocessing.Lock around each enqueue; on x86-64 the consumer stays
+  lock-free, elsewhere it takes the lock too.
+
+The lock comes from the multiprocessing context given to the
+constructor, which must match the context of the Process objects that
+receive the queue (e.g. context=multiprocessing.get_context("spawn")).
+
+Only the creating handle removes the shared block (on close()). The
+creator and its multiprocessing children share one resource tracker,
+where the block is registered once. Any other process that attaches
+unregisters the block from its own tracker right away, so the block is
+not removed when that process exits.
+
+Payloads are bytes-like objects (bytes, bytearray, memoryview, ...); send
+other objects as their serialized bytes. A payload may take up to half
+the ring, so a wrap marker can never make an empty ring look full.
+
+    queue = SharedMemoryQueue(capacity=1 << 20, mode="mpsc")
+    worker = multiprocessing.Process(target=produce, args=(queue,))  # the queue pickles as an attachment
+    ...
+    with queue.consume() as payload:   # a memoryview into shared memory
+        handle(payload)
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import contextlib
+import multiprocessing
+import os
+import platform
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from events import Event, get_default_sink
+from queue import Empty, Full
+
+
+# Header fields, as indexes of 8-byte words; each side's fields sit on their own 64-byte cache line
+_HEAD = 0            # consumer: byte cursor of the next record to read
+_DEQUEUED = 1        # consumer: records dequeued so far
+_TAIL = 8            # producer: byte cursor after the last published record
+_ENQUEUED = 9        # producer: records enqueued so far
+_CAPACITY = 16       # ring size in bytes
+_MODE = 17           # mode code
+_CREATOR = 18        # process id of the creator
+_DATA = 192          # start of the ring, in bytes
+
+_LENGTH = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF
+_ALIGNMENT = 8
+
+MODES = {"spsc": 1, "mpsc": 2}
+
+# Longest sleep between polls while put()/get() wait
+_MAX_BACKOFF = 0.001
+
+# Lock-free cursors need atomic 8-byte stores and total store order (64-bit x86)
+LOCK_FREE = platform.machine().lower() in ("x86_64", "amd64") and sys.maxsize > 2**32
+
+
+def _record_size(length):
+    """
+    Return the ring bytes used by a payload of the given length, including its prefix.
+    """
+    return (_LENGTH.size + length + _ALIGNMENT - 1) & -_ALIGNMENT
+
+
+def _shares_tracker(creator):
+    """
+    Check whether this process uses the resource tracker of the block's creator.
+
+    The creator itself and its multiprocessing children (forked or spawned)
+    share one tracker; any other process starts its own.
+
+    Args:
+        creator (int): Process id that created the block
+
+    Returns:
+        bool: True if the creator's registration lives in this process's tracker
+    """
+    parent = multiprocessing.parent_process()
+    return creator == os.getpid() or (parent is not None and parent.pid == creator)
+
+
+def _open_attached(name):
+    """
+    Attach to an existing shared block without leaving it on a foreign resource tracker.
+
+    Before Python 3.13 (which added track=False), attaching registers the
+    block with this process's resource tracker, which unlinks it when the
+    process exits, even though another process created it. Unless the
+    tracker is the creator's own (where the block is registered anyway),
+    the registration is undone right after the attach.
+
+    Args:
+        name (str): Name of the shared block
+
+    Returns:
+        SharedMemory: The attached block
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    memory = shared_memory.SharedMemory(name=name)
+    creator = memory.buf[:_DATA].cast("Q")
+    try:
+        shared = _shares_tracker(creator[_CREATOR])
+    finally:
+        creator.release()
+    if os.name == "posix" and not shared:
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+def _attach(name, lock, sink):
+    """
+    Re-create a queue from its pickled form (used by SharedMemoryQueue.__reduce__).
+
+    A pickled queue goes to a multiprocessing child, which shares the
+    creator's resource tracker, so the block is opened normally. (While a
+    spawned child unpickles its arguments, parent_process() is not set
+    yet, so _open_attached() could not tell.)
+    """
+    return SharedMemoryQueue(sink=sink, _memory=shared_memory.SharedMemory(name=name), _lock=lock)
+
+
+class SharedMemoryQueue:
+    """
+    A FIFO queue of byte payloads in a shared-memory ring buffer.
+
+    The queue offers the repo's Queue API for payloads:
+    - enqueue / dequeue: Add a payload, remove one as bytes
+    - consume: Read the front payload in place through a memoryview
+    - put / get / put_nowait / get_nowait: The same with queue.Queue semantics
+    - is_empty / size / len(): Number of payloads waiting
+
+    A SharedMemoryQueue passed to a child process (as a Process argument)
+    pickles as an attachment to the same shared block. Other processes can
+    attach by name with SharedMemoryQueue.attach().
+
+    Attributes:
+        mode (str): "spsc" or "mpsc"
+        capacity (int): Ring size in bytes
+        sink: Callable receiving an Event per operation (None = silent)
+        _memory (SharedMemory): The shared block
+        _buffer (memoryview): The block's buffer
+        _header (memoryview): The header as native 8-byte words
+        _lock: multiprocessing.Lock serializing producers in mpsc mode, and both
+               sides in either mode where LOCK_FREE is False (None otherwise)
+        _creator (int): Process id that created the block (None for attached handles)
+    """
+
+    __slots__ = ("mode", "capacity", "sink", "_memory", "_buffer", "_header", "_lock", "_creator")
+
+    def __init__(self, capacity=1 << 20, mode="spsc", name=None, sink=None, context=None,
+                 _memory=None, _lock=None):
+        """
+        Create a queue in a new shared-memory block.
+
+        Args:
+            capacity (int): Ring size in bytes, rounded up to a multiple of 8 (default: 1 MiB)
+            mode (str): "spsc" (one producer) or "mpsc" (several producers) (default: "spsc")
+            name (str): Name of the shared block (default: chosen by the system)
+            sink: Event sink for operation reports (default: the module default from events.py)
+            context: multiprocessing context whose processes will use the queue; the
+                     lock is created from it (default: the default context)
+
+        Raises:
+            ValueError: If the mode is unknown or capacity is smaller than 64 bytes
+        """
+        self.sink = sink if sink is not None else get_default_sink()
+        if _memory is not None:
+            # Attaching to an existing block (see attach())
+            self._memory = _memory
+            self._buffer = _memory.buf
+            self._header = self._buffer[:_DATA].cast("Q")
+            self.capacity = self._header[_CAPACITY]
+            codes = {code: known for known, code in MODES.items()}
+            self.mode = codes[self._header[_MODE]]
+            self._lock = _lock
+            self._creator = None
+            return
+
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+        if capacity < 64:
+            raise ValueError(f"capacity must be at least 64 bytes, got {capacity}")
+        capacity = (capacity + _ALIGNMENT - 1) & -_ALIGNMENT
+
+        self._memory = shared_memory.SharedMemory(name=name, create=True, size=_DATA + capacity)
+        self._buffer = self._memory.buf
+        # Native 8-byte words are read and written with single aligned loads and
+        # stores (struct's "<Q" would write byte by byte and could be seen torn)
+        self._header = self._buffer[:_DATA].cast("Q")
+        self._buffer[:_DATA] = bytes(_DATA)
+        self._header[_CAPACITY] = capacity
+        self._header[_MODE] = MODES[mode]
+        self._header[_CREATOR] = os.getpid()
+        self.capacity = capacity
+        self.mode = mode
+        context = context if context is not None else multiprocessing.get_context()
+        self._lock = context.Lock() if mode == "mpsc" or not LOCK_FREE else None
+        # A forked child inherits this handle as is, so ownership goes by process id
+        self._creator = os.getpid()
+
+    @classmethod
+    def attach(cls, name, lock=None, sink=None):
+        """
+        Attach to a queue created by another process.
+
+        Args:
+            name (str): Name of the shared block (the creator's queue.name)
+            lock: The creator's queue.lock; required to enqueue in mpsc mode, and to
+                  use the queue at all where LOCK_FREE is False
+            sink: Event sink for operation reports (default: the module default)
+
+        Returns:
+            SharedMemoryQueue: A handle on the same queue
+        """
+        return cls(sink=sink, _memory=_open_attached(name), _lock=lock)
+
+    @property
+    def name(self):
+        """
+        The name of the shared block, for attach().
+
+        Returns:
+            str: The block name
+        """
+        return self._memory.name
+
+    @property
+    def lock(self):
+        """
+        The queue's lock (None in lock-free spsc mode), for attach().
+
+        Returns:
+            The multiprocessing.Lock or None
+        """
+        return self._lock
+
+    def __reduce__(self):
+        """
+        Pickle as an attachment to the same shared block (for child processes).
+        """
+        return _attach, (self.name, self._lock, None)
+
+    def _try_write(self, payload):
+        """
+        Copy a payload into the ring and publish it, if there is room.
+
+        Args:
+            payload (memoryview): The payload as unsigned bytes
+
+        Returns:
+            bool: True if the payload was enqueued
+        """
+        buffer = self._buffer
+        header = self._header
+        capacity = self.capacity
+        length = payload.nbytes
+        size = _record_size(length)
+        head = header[_HEAD]
+        tail = header[_TAIL]
+
+        offset = tail % capacity
+        contiguous = capacity - offset
+        needed = size if size <= contiguous else contiguous + size
+        if tail + needed - head > capacity:
+            return False
+
+        if size > contiguous:
+            # Skip the end of the ring so the payload stays contiguous
+            _LENGTH.pack_into(buffer, _DATA + offset, _WRAP)
+            tail += contiguous
+            offset = 0
+
+        start = _DATA + offset
+        _LENGTH.pack_into(buffer, start, length)
+        buffer[start + _LENGTH.size:start + _LENGTH.size + length] = payload
+        # Publishing the tail last makes the record visible only once it is complete
+        header[_TAIL] = tail + size
+        header[_ENQUEUED] += 1
+        return True
+
+    def _try_enqueue(self, payload):
+        """
+        Enqueue a payload if there is room, taking the producer lock in mpsc mode.
+
+        Args:
+            payload: A bytes-like object
+
+        Returns:
+            bool: True if the payload was enqueued
+
+        Raises:
+            ValueError: If the payload is larger than half the ring
+            RuntimeError: If this handle needs the lock but was attached without it
+        """
+        payload = memoryview(payload).cast("B")
+        if _record_size(payload.nbytes) > self.capacity // 2:
+            raise ValueError(f"A {payload.nbytes}-byte payload does not fit a {self.capacity}-byte ring "
+                             f"(the limit is half the ring)")
+        if self.mode == "spsc" and LOCK_FREE:
+            return self._try_write(payload)
+        with self._locked():
+            return self._try_write(payload)
+
+    def _locked(self):
+        """
+        Return the queue's lock, for a with-block around a locked operation.
+
+        Returns:
+            The multiprocessing.Lock
+
+        Raises:
+            RuntimeError: If this handle was attached without the lock
+        """
+        if self._lock is None:
+            raise RuntimeError("This queue needs its lock here; pass queue.lock to attach()")
+        return self._lock
+
+    def _consumer_guard(self):
+        """
+        Return the context the consumer side runs in: the lock unless LOCK_FREE.
+
+        Returns:
+            A context manager
+        """
+        return contextlib.nullcontext() if LOCK_FREE else self._locked()
+
+    def _front(self):
+        """
+        Locate the front record without consuming it.
+
+        Returns:
+            tuple: (start of the payload, its length, head cursor after the record),
+                   or None if the queue is empty
+        """
+        buffer = self._buffer
+        header = self._header
+        head = header[_HEAD]
+        if head == header[_TAIL]:
+            return None
+        offset = head % self.capacity
+        length = _LENGTH.unpack_from(buffer, _DATA + offset)[0]
+        if length == _WRAP:
+            head += self.capacity - offset
+            offset = 0
+            length = _LENGTH.unpack_from(buffer, _DATA)[0]
+        return _DATA + offset + _LENGTH.size, length, head + _record_size(length)
+
+    def _release(self, next_head):
+        """
+        Free the front record for the producers (consumer side).
+
+        Args:
+            next_head (int): Head cursor after the record
+        """
+        header = self._header
+        header[_HEAD] = next_head
+        header[_DEQUEUED] += 1
+
+    def _try_dequeue(self):
+        """
+        Dequeue a copy of the front payload if there is one.
+
+        Returns:
+            bytes: The payload, or None if the queue is empty
+        """
+        with self._consumer_guard():
+            front = self._front()
+            if front is None:
+                return None
+            start, length, next_head = front
+            payload = bytes(self._buffer[start:start + length])
+            self._release(next_head)
+        return payload
+
+    def enqueue(self, payload):
+        """
+        Copy a payload into the rear of the queue.
+
+        Args:
+            payload: A bytes-like object
+
+        Returns:
+            None
+
+        Raises:
+            Full: If the ring has no room for the payload right now
+            ValueError: If the payload is larger than half the ring
+        """
+        if not self._try_enqueue(payload):
+            raise Full
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "enqueue", f"Enqueued {len(payload)} bytes to the queue", len(payload)))
+
+    def dequeue(self):
+        """
+        Remove the front payload and return a copy of it.
+
+        Only one process may dequeue from a queue (in both modes).
+
+        Returns:
+            bytes: The payload
+
+        Raises:
+            IndexError: If the queue is empty (underflow condition)
+        """
+        payload = self._try_dequeue()
+        if payload is None:
+            raise IndexError("Cannot dequeue from an empty queue (Queue Underflow)")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "dequeue", f"Dequeued {len(payload)} bytes from the queue", len(payload)))
+        return payload
+
+    @contextlib.contextmanager
+    def consume(self):
+        """
+        Read the front payload in place and remove it when the block ends.
+
+        The memoryview points into the shared ring and is released when the
+        with-block ends, since the producers may then overwrite the slot.
+        Copy anything that must outlive the block. If the block raises, the
+        payload stays at the front of the queue. Where LOCK_FREE is False,
+        the lock is held for the whole block.
+
+        Yields:
+            memoryview: The payload bytes
+
+        Raises:
+            IndexError: If the queue is empty (underflow condition)
+        """
+        with self._consumer_guard():
+            front = self._front()
+            if front is None:
+                raise IndexError("Cannot consume from an empty queue (Queue Underflow)")
+            start, length, next_head = front
+            payload = self._buffer[start:start + length]
+            try:
+                yield payload
+            except BaseException:
+                payload.release()
+                raise
+            payload.release()
+            self._release(next_head)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "consume", f"Consumed {length} bytes from the queue", length))
+
+    @staticmethod
+    def _wait(attempt, block, timeout, exception):
+        """
+        Poll an operation with exponential backoff until it succeeds.
+
+        Args:
+            attempt: Callable returning a non-None result on success
+            block (bool): Keep polling while the attempt fails
+            timeout (float): Maximum seconds to poll (None = forever)
+            exception: Exception class to raise on failure
+
+        Returns:
+            The attempt's result
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        result = attempt()
+        if result is not None or not block:
+            if result is None:
+                raise exception
+            return result
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.00001
+        while True:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0.0:
+                    raise exception
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            delay = min(delay * 2, _MAX_BACKOFF)
+            result = attempt()
+            if result is not None:
+                return result
+
+    def put(self, payload, block=True, timeout=None):
+        """
+        Copy a payload into the rear of the queue, waiting for room if needed.
+
+        There is no cross-process condition variable, so waiting polls the
+        ring with an exponential backoff of up to 1 ms.
+
+        Args:
+            payload: A bytes-like object
+            block (bool): Wait for room if the ring is full (default: True)
+            timeout (float): Maximum seconds to wait when blocking (default: forever)
+
+        Returns:
+            None
+
+        Raises:
+            Full: If no room became available (non-blocking call or timeout)
+            ValueError: If timeout is negative or the payload is larger than half the ring
+        """
+        self._wait(lambda: True if self._try_enqueue(payload) else None, block, timeout, Full)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "put", f"Put {len(payload)} bytes into the queue", len(payload)))
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove the front payload and return a copy, waiting for one if needed.
+
+        Args:
+            block (bool): Wait for a payload if the queue is empty (default: True)
+            timeout (float): Maximum seconds to wait when blocking (default: forever)
+
+        Returns:
+            bytes: The payload
+
+        Raises:
+            Empty: If no payload became available (non-blocking call or timeout)
+            ValueError: If timeout is negative
+        """
+        payload = self._wait(self._try_dequeue, block, timeout, Empty)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "get", f"Got {len(payload)} bytes from the queue", len(payload)))
+        return payload
+
+    def put_nowait(self, payload):
+        """
+        Add a payload without blocking; equivalent to put(payload, block=False).
+
+        Args:
+            payload: A bytes-like object
+
+        Raises:
+            Full: If the ring has no room for the payload
+        """
+        return self.put(payload, block=False)
+
+    def get_nowait(self):
+        """
+        Remove the front payload without blocking; equivalent to get(block=False).
+
+        Returns:
+            bytes: The payload
+
+        Raises:
+            Empty: If the queue is empty
+        """
+        return self.get(block=False)
+
+    def is_empty(self):
+        """
+        Check if the queue has no payloads waiting.
+
+        Returns:
+            bool: True if the queue is empty
+        """
+        header = self._header
+        return header[_HEAD] == header[_TAIL]
+
+    def size(self):
+        """
+        Get the number of payloads waiting (a snapshot while other processes run).
+
+        Returns:
+            int: Number of payloads in the queue
+        """
+        header = self._header
+        enqueued = header[_ENQUEUED]
+        return max(0, enqueued - header[_DEQUEUED])
+
+    def __len__(self):
+        """
+        Return the number of payloads waiting, enabling len(queue).
+
+        Returns:
+            int: Number of payloads in the queue
+        """
+        return self.size()
+
+    def close(self):
+        """
+        Detach this handle from the shared block; the creator also removes the block.
+
+        Returns:
+            None
+        """
+        if self._memory is None:
+            return
+        # The header view must be released before the block can be closed
+        self._header.release()
+        self._header = None
+        self._buffer = None
+        self._memory.close()
+        if self._creator == os.getpid():
+            self._memory.unlink()
+        self._memory = None
+
+    def __enter__(self):
+        """
+        Enter a with-block; the handle is closed on exit.
+
+        Returns:
+            SharedMemoryQueue: This queue
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the handle when leaving a with-block.
+        """
+        self.close()
@@ -0,0 +1,542 @@
+"""
+Indexable Skip List Data Structure Implementation
+
+This module implements an indexable skip list: a linked list with extra
+"express lane" links that skip over many nodes at once. Each link also
+records its width - how many elements it skips - so the structure can find
+the node at any position by adding up widths instead of counting one node
+at a time. Positional get, insert and delete therefore take O(log n)
+expected time instead of the O(position) of LinkedList.
+
+The IndexableSkipList offers the same positional API as LinkedList, so it
+can replace it where code pages through the middle of long lists.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import random
+
+from events import Event, PrintSink, get_default_sink
+
+
+class SkipNode:
+    """
+    A node of the skip list with one forward link per level.
+
+    Attributes:
+        data: The value stored in the node (None for the head sentinel)
+        next (list): next[level] is the following node at that level (None at the end)
+        width (list): width[level] is how many positions next[level] is ahead of this node
+    """
+
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data, level):
+        """
+        Initialize an unlinked node with the given number of levels.
+
+        Args:
+            data: The value to be stored in the node
+            level (int): Number of levels this node takes part in
+        """
+        self.data = data
+        self.next = [None] * level
+        self.width = [0] * level
+
+    def __str__(self):
+        """
+        String representation of the node for easy display.
+
+        Returns:
+            str: String representation of the node's data
+        """
+        return str(self.data)
+
+
+class IndexableSkipList:
+    """
+    A list with O(log n) expected positional access, insertion and deletion.
+
+    Every node is on level 0; each node is promoted to the next level with
+    probability P, so level k holds about n * P**k nodes. A lookup starts
+    on the highest level and drops a level whenever the next link would
+    overshoot the target position.
+
+    The IndexableSkipList class provides the LinkedList operations:
+    - insert_at_beginning / insert_at_end / insert_at_position
+    - extend / extend_left
+    - delete_by_value / delete_at_position
+    - get_at_position / search
+    - display / size / is_empty / clear
+
+    Value-based operations (search, delete_by_value) still scan level 0.
+
+    Attributes:
+        _head (SkipNode): Sentinel node linking to the first node on every level
+        _level (int): Number of levels currently in use
+        _size (int): Internal counter for the number of elements
+        sink: Callable receiving an Event per operation (None = silent)
+    """
+
+    __slots__ = ("_head", "_level", "_size", "sink")
+
+    # Probability that a node is promoted to the next level
+    P = 0.25
+    # Enough levels for about 4**16 (over 4 billion) elements
+    MAX_LEVEL = 16
+
+    def __init__(self, sink=None):
+        """
+        Initialize an empty skip list.
+
+        Args:
+            sink: Event sink for operation reports (default: the module default from events.py)
+        """
+        self._head = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
+
+    def _random_level(self):
+        """
+        Choose the number of levels for a new node.
+
+        Returns:
+            int: A level count between 1 and MAX_LEVEL (geometric distribution)
+        """
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < self.P:
+            level += 1
+        return level
+
+    def _predecessors(self, position):
+        """
+        Find, on every level in use, the last node before a position.
+
+        The head sentinel counts as position -1.
+
+        Args:
+            position (int): Target position (0 to size)
+
+        Returns:
+            tuple: (nodes, positions) where nodes[level] is the last node before
+                   the target on that level and positions[level] is its position
+        """
+        nodes = [None] * self._level
+        positions = [0] * self._level
+        node = self._head
+        node_position = -1
+        for level in range(self._level - 1, -1, -1):
+            # Move right while the next node on this level is still before the target
+            while node.next[level] is not None and node_position + node.width[level] < position:
+                node_position += node.width[level]
+                node = node.next[level]
+            nodes[level] = node
+            positions[level] = node_position
+        return nodes, positions
+
+    def _node_at(self, position):
+        """
+        Return the node at a valid position in O(log n) expected time.
+
+        Args:
+            position (int): The position to access (0-indexed)
+
+        Returns:
+            SkipNode: The node at that position
+        """
+        node = self._head
+        node_position = -1
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] is not None and node_position + node.width[level] <= position:
+                node_position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def _insert(self, data, position):
+        """
+        Link a new node in at a valid position (0 to size).
+
+        Args:
+            data: The value to be inserted
+            position (int): The position the new node will occupy
+        """
+        nodes, positions = self._predecessors(position)
+        level = self._random_level()
+        if level > self._level:
+            # New levels start out empty: the head links straight past the new node
+            for _ in range(self._level, level):
+                nodes.append(self._head)
+                positions.append(-1)
+            self._level = level
+
+        new_node = SkipNode(data, level)
+        for current in range(level):
+            previous = nodes[current]
+            following = previous.next[current]
+            new_node.next[current] = following
+            if following is not None:
+                # The following node moves from (its old position) to one further on
+                new_node.width[current] = positions[current] + previous.width[current] + 1 - position
+            previous.next[current] = new_node
+            previous.width[current] = position - positions[current]
+
+        # Links on higher levels now skip over one more node
+        for current in range(level, self._level):
+            if nodes[current].next[current] is not None:
+                nodes[current].width[current] += 1
+
+        self._size += 1
+
+    def _delete(self, position):
+        """
+        Unlink the node at a valid position.
+
+        Args:
+            position (int): The position of the node to delete
+
+        Returns:
+            The data of the deleted node
+        """
+        nodes, positions = self._predecessors(position)
+        target = nodes[0].next[0]
+        for current in range(self._level):
+            previous = nodes[current]
+            if previous.next[current] is target:
+                # Bridge over the target, absorbing its width
+                previous.next[current] = target.next[current]
+                if target.next[current] is not None:
+                    previous.width[current] += target.width[current] - 1
+                else:
+                    previous.width[current] = 0
+            elif previous.next[current] is not None:
+                previous.width[current] -= 1
+
+        # Drop levels that no longer hold any node
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+
+        self._size -= 1
+        return target.data
+
+    def insert_at_beginning(self, data):
+        """
+        Insert a new element at the beginning of the list.
+
+        Args:
+            data: The value to be inserted
+
+        Returns:
+            None
+        """
+        self._insert(data, 0)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_beginning", f"Inserted '{data}' at the beginning of the list", data))
+
+    def insert_at_end(self, data):
+        """
+        Insert a new element at the end of the list in O(log n) expected time.
+
+        Args:
+            data: The value to be inserted
+
+        Returns:
+            None
+        """
+        self._insert(data, self._size)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_end", f"Inserted '{data}' at the end of the list", data))
+
+    def insert_at_position(self, data, position):
+        """
+        Insert a new element at a specific position in O(log n) expected time.
+
+        Args:
+            data: The value to be inserted
+            position (int): The position where to insert (0-indexed)
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: If position is negative or greater than list size
+        """
+        # Validate position
+        if position < 0 or position > self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        self._insert(data, position)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_position", f"Inserted '{data}' at position {position}", data))
+
+    def extend(self, iterable):
+        """
+        Insert every element of an iterable at the end of the list.
+
+        Args:
+            iterable: The values to be inserted, in order
+
+        Returns:
+            int: Number of values inserted
+        """
+        added_count = 0
+        for data in iterable:
+            self._insert(data, self._size)
+            added_count += 1
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend",
+                            f"Inserted {added_count} items at the end of the list", added_count))
+        return added_count
+
+    def extend_left(self, iterable):
+        """
+        Insert every element of an iterable at the beginning of the list.
+
+        Like collections.deque.extendleft(), the values end up in reverse order.
+
+        Args:
+            iterable: The values to be inserted
+
+        Returns:
+            int: Number of values inserted
+        """
+        added_count = 0
+        for data in iterable:
+            self._insert(data, 0)
+            added_count += 1
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend_left",
+                            f"Inserted {added_count} items at the beginning of the list",
+                            added_count))
+        return added_count
+
+    def delete_by_value(self, data):
+        """
+        Delete the first occurrence of an element with the given value.
+
+        Finding the value is an O(n) scan of level 0; unlinking it is O(log n).
+
+        Args:
+            data: The value to be deleted
+
+        Returns:
+            bool: True if deletion was successful, False if value not found
+        """
+        # Check if list is empty
+        if self._size == 0:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Cannot delete '{data}': List is empty", data))
+            return False
+
+        position = self._find(data)
+        if position == -1:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Value '{data}' not found in the list", data))
+            return False
+
+        self._delete(position)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_by_value", f"Deleted '{data}' from the list", data))
+        return True
+
+    def delete_at_position(self, position):
+        """
+        Delete the element at a specific position in O(log n) expected time.
+
+        Args:
+            position (int): The position of the element to delete (0-indexed)
+
+        Returns:
+            The data of the deleted element
+
+        Raises:
+            IndexError: If position is invalid or list is empty
+        """
+        # Check if list is empty
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+
+        # Validate position
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        deleted_data = self._delete(position)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_at_position", f"Deleted '{deleted_data}' from position {position}", deleted_data))
+        return deleted_data
+
+    def get_at_position(self, position):
+        """
+        Get the data at a specific position in O(log n) expected time.
+
+        Args:
+            position (int): The position to access (0-indexed)
+
+        Returns:
+            The data at the specified position
+
+        Raises:
+            IndexError: If position is invalid
+        """
+        # Validate position
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        data = self._node_at(position).data
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "get_at_position", f"Element at position {position}: {data}", data))
+        return data
+
+    def _find(self, data):
+        """
+        Return the position of the first element equal to data by scanning level 0.
+
+        Args:
+            data: The value to look for
+
+        Returns:
+            int: The position of the first occurrence, or -1 if not found
+        """
+        current = self._head.next[0]
+        position = 0
+        while current is not None:
+            if current.data == data:
+                return position
+            current = current.next[0]
+            position += 1
+        return -1
+
+    def search(self, data):
+        """
+        Search for a value in the list (an O(n) scan of level 0).
+
+        Args:
+            data: The value to search for
+
+        Returns:
+            int: The position of the first occurrence (0-indexed), or -1 if not found
+        """
+        position = self._find(data)
+        if self.sink is not None:
+            if position == -1:
+                self.sink(Event(type(self).__name__, "search", f"Value '{data}' not found in the list", -1))
+            else:
+                self.sink(Event(type(self).__name__, "search", f"Found '{data}' at position {position}", position))
+        return position
+
+    def display(self):
+        """
+        Display the current contents of the list.
+
+        Returns:
+            None
+        """
+        if self._size == 0:
+            print("Skip List is empty: []")
+            return
+
+        values = [str(data) for data in self]
+        print(f"Skip List: {' -> '.join(values)} -> None")
+        print(f"Levels in use: {self._level}")
+
+    def size(self):
+        """
+        Get the number of elements in the list.
+
+        Returns:
+            int: Number of elements in the list
+        """
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Skip List size: {self._size}", self._size))
+        return self._size
+
+    def is_empty(self):
+        """
+        Check if the list is empty.
+
+        Returns:
+            bool: True if list is empty, False otherwise
+        """
+        return self._size == 0
+
+    def clear(self):
+        """
+        Remove all elements from the list.
+
+        Returns:
+            None
+        """
+        self._head = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Skip List has been cleared", None))
+
+    def __len__(self):
+        """
+        Return the number of elements, enabling len(skip_list).
+
+        Returns:
+            int: Number of elements in the list
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Iterate over the values in order by following level 0.
+
+        Yields:
+            The data of each node in list order
+        """
+        current = self._head.next[0]
+        while current is not None:
+            yield current.data
+            current = current.next[0]
+
+    def __reversed__(self):
+        """
+        Iterate over the values from last to first (over an O(n) snapshot).
+
+        Returns:
+            iterator: Reverse iterator over the list values
+        """
+        return reversed(list(self))
+
+    def __contains__(self, data):
+        """
+        Check whether a value is in the list, enabling `data in skip_list`.
+
+        Args:
+            data: The value to look for
+
+        Returns:
+            bool: True if an element holds an equal value
+        """
+        return self._find(data) != -1
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    print("=== Indexable Skip List Demo ===")
+
+    skip_list = IndexableSkipList(sink=PrintSink())
+
+    print("\n1. Testing insertion operations:")
+    skip_list.insert_at_beginning("First")
+    skip_list.insert_at_end("Last")
+    skip_list.insert_at_position("Middle", 1)
+    skip_list.display()
+
+    print("\n2. Testing positional access:")
+    skip_list.get_at_position(1)
+    skip_list.extend(f"Item {i}" for i in range(1000))
+    skip_list.get_at_position(500)
+
+    print("\n3. Testing deletion operations:")
+    skip_list.delete_at_position(1)
+    skip_list.delete_by_value("Item 999")
+    skip_list.size()
+
+    print("\n=== Skip List Demo Complete ===")
@@ -0,0 +1,489 @@
+"""
+Disk-Spilling Queue Implementation
+
+This module implements a Queue for backlogs that do not fit in memory.
+Only the two ends of the queue are kept in memory: a head segment that
+dequeue() reads from and a tail segment that enqueue() writes to. When the
+in-memory part is full, the tail segment is written to a segment file and
+a fresh tail is started; when the head runs out, the oldest segment file
+is read back through a memory map and deleted.
+
+Segment files hold length-prefixed pickles: each element is stored as a
+4-byte little-endian length followed by that many bytes of pickle data.
+
+    with SpillingQueue(memory_items=10_000) as queue:
+        queue.enqueue_many(range(1_000_000))   # ~990,000 elements go to disk
+        queue.dequeue()
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+import weakref
+
+from events import PrintSink
+from queue import Queue
+from ringbuffer import RingBuffer
+
+
+# Length prefix of every record in a segment file
+_LENGTH = struct.Struct("<I")
+
+
+class _Segment:
+    """
+    Bookkeeping for one spilled segment file.
+
+    Attributes:
+        path (str): Location of the segment file
+        count (int): Number of elements in the file
+        last: The last element of the segment, kept for O(1) rear access
+    """
+
+    __slots__ = ("path", "count", "last")
+
+    def __init__(self, path, count, last):
+        self.path = path
+        self.count = count
+        self.last = last
+
+
+def _remove_files(directory, owns_directory, segments):
+    """
+    Delete the segment files of a buffer, and its directory if the buffer created it.
+
+    This is the buffer's finalizer, so it must not reference the buffer itself.
+
+    Args:
+        directory (str): Directory holding the segment files
+        owns_directory (bool): Whether the directory itself should be deleted
+        segments (RingBuffer): The buffer's _Segment records
+    """
+    for segment in segments:
+        try:
+            os.remove(segment.path)
+        except FileNotFoundError:
+            pass
+    if owns_directory:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class SpillBuffer:
+    """
+    A FIFO storage engine that keeps its head and tail in memory and spills the middle to disk.
+
+    Logically the elements are head + spilled segments (oldest first) +
+    tail. The head is a RingBuffer and the tail a list, so both ends stay
+    O(1); each element is written to and read from disk at most once.
+    At most memory_items elements are held in memory (plus any elements put
+    back with appendleft()).
+
+    SpillBuffer implements the storage engine interface used by Queue
+    (append, appendleft, popleft, extend, popleft_many, clear, indexing,
+    len() and iteration), so the Queue logic is reused unchanged.
+
+    The segment last read by indexing is cached, so repeated front() calls
+    while the head is empty read its file once; this can hold one segment
+    beyond memory_items. If close() is never called, the segment files
+    (and the temporary directory) are deleted when the buffer is garbage
+    collected or the interpreter exits.
+
+    Attributes:
+        memory_items (int): Maximum number of elements kept in memory
+        segment_items (int): Number of elements per segment file
+        directory (str): Directory holding the segment files
+        _owns_directory (bool): Whether close() should delete the directory
+        _head (RingBuffer): In-memory front of the queue
+        _segments (RingBuffer): _Segment records, oldest first
+        _tail (list): In-memory rear of the queue
+        _spilled_count (int): Number of elements in segment files
+        _next_segment (int): Sequence number for the next segment file name
+        _cached_segment (_Segment): Segment whose elements are in _cached_items (None if none)
+        _cached_items (list): Elements of _cached_segment
+        _finalizer (weakref.finalize): Deletes the files if close() is never called
+    """
+
+    __slots__ = ("memory_items", "segment_items", "directory", "_owns_directory",
+                 "_head", "_segments", "_tail", "_spilled_count", "_next_segment",
+                 "_cached_segment", "_cached_items", "_finalizer", "__weakref__")
+
+    def __init__(self, memory_items=100_000, segment_items=None, directory=None):
+        """
+        Initialize an empty spilling buffer.
+
+        Args:
+            memory_items (int): Maximum number of elements kept in memory (default: 100,000)
+            segment_items (int): Elements per segment file (default: a quarter of memory_items)
+            directory (str): Directory for segment files (default: a new temporary directory)
+
+        Raises:
+            ValueError: If segment_items is not smaller than memory_items
+        """
+        if segment_items is None:
+            segment_items = max(1, memory_items // 4)
+        if not 0 < segment_items < memory_items:
+            raise ValueError(f"segment_items must be between 1 and memory_items - 1, got {segment_items}")
+        self.memory_items = memory_items
+        self.segment_items = segment_items
+        self._owns_directory = directory is None
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="spillqueue-")
+        else:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._head = RingBuffer()
+        self._segments = RingBuffer()
+        self._tail = []
+        self._spilled_count = 0
+        self._next_segment = 0
+        self._cached_segment = None
+        self._cached_items = None
+        self._finalizer = weakref.finalize(self, _remove_files, directory, self._owns_directory,
+                                           self._segments)
+
+    def _write_segment(self, items):
+        """
+        Write elements to a new segment file as length-prefixed pickles.
+
+        The records are assembled in memory and written with one call.
+
+        Args:
+            items (list): The elements to spill, in FIFO order
+        """
+        path = os.path.join(self.directory, f"segment-{self._next_segment:08d}.bin")
+        self._next_segment += 1
+        pack = _LENGTH.pack
+        dumps = pickle.dumps
+        chunks = []
+        for item in items:
+            record = dumps(item, pickle.HIGHEST_PROTOCOL)
+            chunks.append(pack(len(record)))
+            chunks.append(record)
+        with open(path, "wb") as segment_file:
+            segment_file.write(b"".join(chunks))
+        self._segments.append(_Segment(path, len(items), items[-1]))
+        self._spilled_count += len(items)
+
+    @staticmethod
+    def _read_segment(segment):
+        """
+        Read every element of a segment file through a read-only memory map.
+
+        Args:
+            segment (_Segment): The segment to read
+
+        Returns:
+            list: The elements in FIFO order
+        """
+        unpack_from = _LENGTH.unpack_from
+        loads = pickle.loads
+        items = []
+        with open(segment.path, "rb") as segment_file:
+            with mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = 0
+                for _ in range(segment.count):
+                    (length,) = unpack_from(mapped, offset)
+                    offset += _LENGTH.size
+                    items.append(loads(mapped[offset:offset + length]))
+                    offset += length
+        return items
+
+    def _load_segment(self, segment):
+        """
+        Return the elements of a segment, reading its file only if it is not cached.
+
+        Args:
+            segment (_Segment): The segment to load
+
+        Returns:
+            list: The elements in FIFO order
+        """
+        if segment is not self._cached_segment:
+            self._cached_items = self._read_segment(segment)
+            self._cached_segment = segment
+        return self._cached_items
+
+    def _fill_head(self):
+        """
+        Refill the empty head from the oldest segment file, or from the tail.
+
+        A segment file is deleted as soon as it has been read.
+        """
+        if len(self._segments):
+            segment = self._segments.popleft()
+            self._head.extend(self._load_segment(segment))
+            self._cached_segment = self._cached_items = None
+            self._spilled_count -= segment.count
+            os.remove(segment.path)
+        elif self._tail:
+            self._head.extend(self._tail)
+            self._tail = []
+
+    def append(self, item):
+        """
+        Add an element at the rear, spilling the tail segment when memory is full.
+
+        Args:
+            item: The element to be added
+        """
+        tail = self._tail
+        tail.append(item)
+        if len(tail) >= self.segment_items:
+            if not len(self._segments) and len(self._head) + len(tail) <= self.memory_items:
+                # Nothing is on disk yet and the head has room: keep everything in memory
+                self._head.extend(tail)
+            else:
+                self._write_segment(tail)
+            self._tail = []
+
+    def appendleft(self, item):
+        """
+        Put an element back at the front (it always stays in memory).
+
+        Args:
+            item: The element to be added
+        """
+        self._head.appendleft(item)
+
+    def popleft(self):
+        """
+        Remove and return the front element.
+
+        Returns:
+            The front element
+
+        Raises:
+            IndexError: If the buffer is empty
+        """
+        if not len(self._head):
+            self._fill_head()
+        return self._head.popleft()
+
+    def extend(self, iterable):
+        """
+        Add every element of an iterable at the rear.
+
+        Args:
+            iterable: Elements to add in order
+
+        Returns:
+            int: Number of elements added
+        """
+        added = 0
+        for item in iterable:
+            self.append(item)
+            added += 1
+        return added
+
+    def popleft_many(self, n):
+        """
+        Remove and return up to n elements from the front.
+
+        Args:
+            n (int): Maximum number of elements to remove
+
+        Returns:
+            list: The removed elements in FIFO order
+        """
+        removed = []
+        while len(removed) < n and len(self):
+            if not len(self._head):
+                self._fill_head()
+            removed.extend(self._head.popleft_many(n - len(removed)))
+        return removed
+
+    def clear(self):
+        """
+        Remove all elements and delete every segment file.
+        """
+        for segment in self._segments:
+            os.remove(segment.path)
+        self._head.clear()
+        self._segments.clear()
+        self._tail = []
+        self._spilled_count = 0
+        self._cached_segment = self._cached_items = None
+
+    def close(self):
+        """
+        Delete every segment file, and the directory if it was created here.
+        """
+        self.clear()
+        self._finalizer()
+
+    @property
+    def spilled_count(self):
+        """
+        Number of elements currently stored in segment files.
+
+        Returns:
+            int: Spilled elements
+        """
+        return self._spilled_count
+
+    @property
+    def segment_count(self):
+        """
+        Number of segment files currently on disk.
+
+        Returns:
+            int: Segment files
+        """
+        return len(self._segments)
+
+    def __len__(self):
+        """
+        Return the total number of elements, in memory and on disk.
+
+        Returns:
+            int: Number of elements
+        """
+        return len(self._head) + self._spilled_count + len(self._tail)
+
+    def __getitem__(self, index):
+        """
+        Return the element at a logical index (0 is the front, -1 the rear).
+
+        The two ends are O(1); an index inside a spilled segment reads that
+        segment's file, unless it is the segment read last.
+
+        Args:
+            index (int): Position relative to the front (negative counts from the rear)
+
+        Returns:
+            The element at the given position
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("spill buffer index out of range")
+
+        if index < len(self._head):
+            return self._head[index]
+        if index >= size - len(self._tail):
+            return self._tail[index - (size - len(self._tail))]
+        index -= len(self._head)
+        for segment in self._segments:
+            if index < segment.count:
+                if index == segment.count - 1:
+                    return segment.last
+                return self._load_segment(segment)[index]
+            index -= segment.count
+
+    def __iter__(self):
+        """
+        Iterate over the elements from front to rear, reading spilled segments one at a time.
+
+        Yields:
+            Each element in FIFO order
+        """
+        yield from self._head
+        for segment in list(self._segments):
+            yield from self._read_segment(segment)
+        yield from self._tail
+
+    def __reversed__(self):
+        """
+        Iterate over the elements from rear to front, reading spilled segments one at a time.
+
+        Yields:
+            Each element in reverse FIFO order
+        """
+        yield from reversed(self._tail)
+        for segment in reversed(list(self._segments)):
+            yield from reversed(self._read_segment(segment))
+        yield from reversed(self._head)
+
+
+class SpillingQueue(Queue):
+    """
+    A Queue whose backlog beyond a memory cap is spilled to segment files.
+
+    It offers the full Queue API (including the thread-safe put/get); only
+    the storage engine differs. Call close(), or use the queue as a context
+    manager, to delete the segment files when done.
+
+    Attributes:
+        _items (SpillBuffer): Storage engine holding the queue elements
+    """
+
+    __slots__ = ()
+
+    def __init__(self, memory_items=100_000, segment_items=None, directory=None, sink=None, maxsize=0):
+        """
+        Initialize an empty spilling queue.
+
+        Args:
+            memory_items (int): Maximum number of elements kept in memory (default: 100,000)
+            segment_items (int): Elements per segment file (default: a quarter of memory_items)
+            directory (str): Directory for segment files (default: a new temporary directory)
+            sink: Event sink for operation reports (default: the module default from events.py)
+            maxsize (int): Capacity for put(); producers block when it is reached (default: unbounded)
+        """
+        super().__init__(sink=sink, maxsize=maxsize,
+                         storage=SpillBuffer(memory_items, segment_items, directory))
+
+    @property
+    def spilled_count(self):
+        """
+        Number of elements currently stored on disk.
+
+        Returns:
+            int: Spilled elements
+        """
+        return self._items.spilled_count
+
+    def close(self):
+        """
+        Delete the segment files (and the temporary directory, if one was created).
+
+        The queue is empty afterwards.
+
+        Returns:
+            None
+        """
+        self._items.close()
+
+    def __enter__(self):
+        """
+        Return the queue itself for use in a with statement.
+
+        Returns:
+            SpillingQueue: This queue
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the queue when the with block ends.
+        """
+        self.close()
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    print("=== Spilling Queue Demo ===")
+
+    with SpillingQueue(memory_items=4, segment_items=2) as queue:
+        print("\n1. Testing enqueue beyond the memory cap:")
+        queue.enqueue_many([f"Task {number}" for number in range(1, 11)])
+        print(f"Elements on disk: {queue.spilled_count} of {len(queue)}")
+        queue.display()
+
+        print("\n2. Testing dequeue (segments are read back and deleted):")
+        queue.sink = PrintSink()
+        queue.dequeue_many(5)
+        print(f"Elements on disk: {queue.spilled_count} of {len(queue)}")
+        queue.display()
+
+    print("\n=== Spilling Queue Demo Complete ===")
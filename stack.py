@@ -1,13 +1,22 @@
 """
 Stack Data Structure Implementation
 
-This module implements a Stack data structure using Python's built-in list.
-A stack follows the LIFO (Last In, First Out) principle.
+This module implements a Stack data structure using Python's built-in list,
+a TypedStack variant that stores numbers unboxed in an array.array, and a
+BoundedStack variant that drops its oldest elements to stay within a count
+or memory budget. A stack follows the LIFO (Last In, First Out) principle.
 
 Author: Educational Python Project
 Date: July 28, 2025
 """
 
+import sys
+from array import array
+
+from events import Event, PrintSink, get_default_sink
+from persistence import Snapshot, read_snapshot, write_snapshot
+from ringbuffer import RingBuffer
+
 
 class Stack:
     """
@@ -16,23 +25,40 @@ class Stack:
     The Stack class provides standard stack operations:
     - push: Add an element to the top
     - pop: Remove and return the top element
+    - push_many / pop_many: Bulk versions of push and pop
     - peek: View the top element without removing it
     - is_empty: Check if stack is empty
     - size: Get the number of elements
     
+    Operations are reported to an optional event sink (see events.py).
+    
     Attributes:
-        _items (list): Internal list to store stack elements
+        _items (list): Internal list (or storage engine) to store stack elements
+        sink: Callable receiving an Event per operation (None = silent)
     """
     
-    def __init__(self):
+    __slots__ = ("_items", "sink")
+    
+    def __init__(self, sink=None, storage=None):
         """
         Initialize an empty stack.
         
         The constructor creates an empty list to store stack elements.
         Using a private attribute (_items) to encapsulate the internal structure.
+        
+        Any list-like storage engine with append/pop/extend/clear, indexing
+        at -1 and len() can be used instead, e.g. a Deque (see deque.py)
+        whose maxlen keeps only the most recent elements. An engine whose
+        extend() may drop elements must return the number it added.
+        
+        Args:
+            sink: Event sink for operation reports (default: the module default from events.py)
+            storage: Storage engine for the elements, bottom first (default: a new list)
         """
         # Initialize empty list to store stack elements
-        self._items = []
+        self._items = storage if storage is not None else []
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
     
     def push(self, item):
         """
@@ -48,7 +74,8 @@ class Stack:
         """
         # Append the item to the end of the list (top of stack)
         self._items.append(item)
-        print(f"Pushed '{item}' onto the stack")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "push", f"Pushed '{item}' onto the stack", item))
     
     def pop(self):
         """
@@ -68,9 +95,71 @@ class Stack:
         
         # Remove and return the last element (top of stack)
         popped_item = self._items.pop()
-        print(f"Popped '{popped_item}' from the stack")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "pop", f"Popped '{popped_item}' from the stack", popped_item))
         return popped_item
     
+    def push_many(self, iterable):
+        """
+        Add every element of an iterable to the top of the stack.
+        
+        The elements are appended with a single list.extend() call and one
+        event is reported for the whole batch. The last element of the
+        iterable ends up on top.
+        
+        Args:
+            iterable: The elements to be added, bottom to top
+        
+        Returns:
+            int: Number of elements pushed
+        """
+        # Extend the list in one C-level operation
+        previous_size = len(self._items)
+        pushed_count = self._items.extend(iterable)
+        if pushed_count is None:
+            # list and array.array return None and never drop elements
+            pushed_count = len(self._items) - previous_size
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "push_many",
+                            f"Pushed {pushed_count} items onto the stack", pushed_count))
+        return pushed_count
+    
+    def pop_many(self, n):
+        """
+        Remove and return up to n elements from the top of the stack.
+        
+        The elements are sliced off the end of the list in one operation and
+        one event is reported for the whole batch. Asking for more elements
+        than the stack holds drains it instead of raising an error.
+        
+        Args:
+            n (int): Maximum number of elements to remove
+        
+        Returns:
+            list: The removed elements in pop order (top first)
+            
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError(f"Cannot pop a negative number of elements ({n})")
+        
+        # Slice the top elements off the end of the list
+        popped_count = min(n, len(self._items))
+        if popped_count == 0:
+            popped_items = []
+        elif isinstance(self._items, list):
+            popped_items = self._items[-popped_count:]
+            del self._items[-popped_count:]
+            popped_items.reverse()
+        else:
+            # Storage engines without slicing (e.g. Deque) pop one element at a time
+            popped_items = [self._items.pop() for _ in range(popped_count)]
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "pop_many",
+                            f"Popped {popped_count} items from the stack", popped_count))
+        return popped_items
+    
     def peek(self):
         """
         Return the top element without removing it from the stack.
@@ -89,7 +178,8 @@ class Stack:
         
         # Return the last element without removing it
         top_item = self._items[-1]
-        print(f"Top element is '{top_item}'")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "peek", f"Top element is '{top_item}'", top_item))
         return top_item
     
     def is_empty(self):
@@ -115,7 +205,8 @@ class Stack:
         """
         # Return the length of the internal list
         stack_size = len(self._items)
-        print(f"Stack size: {stack_size}")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Stack size: {stack_size}", stack_size))
         return stack_size
     
     def display(self):
@@ -132,7 +223,7 @@ class Stack:
             print("Stack is empty: []")
         else:
             # Display stack with top element indicated
-            print(f"Stack contents (bottom to top): {self._items}")
+            print(f"Stack contents (bottom to top): {list(self._items)}")
             print(f"Top -> {self._items[-1]}")
     
     def clear(self):
@@ -146,7 +237,428 @@ class Stack:
         """
         # Clear all elements from the internal list
         self._items.clear()
-        print("Stack has been cleared")
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Stack has been cleared", None))
+    
+    def save(self, path):
+        """
+        Save the elements, bottom to top, to a binary snapshot file.
+        
+        See persistence.py for the format; integer, float and string
+        stacks are written as packed arrays.
+        
+        Args:
+            path (str): Destination file
+        
+        Returns:
+            int: Number of elements saved
+        """
+        saved_count = write_snapshot(path, "stack", self._items)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "save", f"Saved {saved_count} items to '{path}'", saved_count))
+        return saved_count
+    
+    @classmethod
+    def load(cls, path, sink=None, **options):
+        """
+        Create a stack from a snapshot file written by save().
+        
+        Args:
+            path (str): Snapshot file
+            sink: Event sink for the new stack
+            **options: Extra keyword arguments for the constructor (e.g. max_items=100)
+        
+        Returns:
+            A new stack of this class with the saved elements
+        
+        Raises:
+            ValueError: If the file is not a stack snapshot
+        """
+        stack = cls(sink=sink, **options)
+        stack.push_many(read_snapshot(path, "stack"))
+        return stack
+    
+    def __len__(self):
+        """
+        Return the number of elements, enabling len(stack).
+        
+        Unlike size(), this does not report an event.
+        
+        Returns:
+            int: Number of elements in the stack
+        """
+        return len(self._items)
+    
+    def __iter__(self):
+        """
+        Iterate over the elements from bottom to top.
+        
+        This is a single O(n) pass over the internal list, in the same
+        order display() shows the stack.
+        
+        Returns:
+            iterator: Iterator over the stack elements
+        """
+        return iter(self._items)
+    
+    def __reversed__(self):
+        """
+        Iterate over the elements from top to bottom (the order pop() returns them).
+        
+        Returns:
+            iterator: Reverse iterator over the stack elements
+        """
+        return reversed(self._items)
+    
+    def __contains__(self, item):
+        """
+        Check whether an element is in the stack, enabling `item in stack`.
+        
+        Args:
+            item: The element to look for
+        
+        Returns:
+            bool: True if an equal element is in the stack
+        """
+        return item in self._items
+
+
+class TypedStack(Stack):
+    """
+    A Stack of numbers stored unboxed in an array.array.
+    
+    A regular Stack keeps a pointer to a separate Python object for every
+    element. A TypedStack stores the raw machine values contiguously, so an
+    int64 or float64 element costs 8 bytes instead of roughly 36. It offers
+    the same push/pop/peek API; push_many and pop_many move whole slices
+    of the array at once.
+    
+    Common type codes (see the array module for the full list):
+    - 'q': signed 64-bit integers
+    - 'd': 64-bit floats
+    - 'i': signed C ints
+    
+    Pushing a value that does not fit the type code raises TypeError or
+    OverflowError, as array.array does.
+    
+    Attributes:
+        _items (array.array): Internal typed array to store stack elements
+        sink: Callable receiving an Event per operation (None = silent)
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, typecode="q", sink=None):
+        """
+        Initialize an empty typed stack.
+        
+        Args:
+            typecode (str): array module type code of the elements (default: 'q')
+            sink: Event sink for operation reports (default: the module default from events.py)
+        
+        Raises:
+            ValueError: If typecode is not a valid array type code
+        """
+        super().__init__(sink=sink)
+        # Replace the list with an unboxed typed array
+        self._items = array(typecode)
+    
+    @property
+    def typecode(self):
+        """
+        The array module type code of the stored elements.
+        
+        Returns:
+            str: The type code given to the constructor
+        """
+        return self._items.typecode
+    
+    @classmethod
+    def load(cls, path, sink=None, **options):
+        """
+        Create a typed stack from a snapshot file written by save().
+        
+        The type code saved in the snapshot is used unless a typecode
+        option is given.
+        
+        Args:
+            path (str): Snapshot file
+            sink: Event sink for the new stack
+            **options: Extra keyword arguments for the constructor (e.g. typecode='d')
+        
+        Returns:
+            TypedStack: A new stack with the saved elements
+        
+        Raises:
+            ValueError: If the file is not a stack snapshot
+        """
+        with Snapshot(path, "stack") as snapshot:
+            saved_typecode = snapshot.typecode
+        if saved_typecode is not None:
+            options.setdefault("typecode", saved_typecode)
+        return super().load(path, sink=sink, **options)
+    
+    def pop_many(self, n):
+        """
+        Remove and return up to n elements from the top of the stack.
+        
+        Behaves like Stack.pop_many(), but returns the elements as an
+        array.array of the same type code instead of a list.
+        
+        Args:
+            n (int): Maximum number of elements to remove
+        
+        Returns:
+            array.array: The removed elements in pop order (top first)
+            
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError(f"Cannot pop a negative number of elements ({n})")
+        
+        # Slice the top elements off the end of the array
+        popped_count = min(n, len(self._items))
+        if popped_count == 0:
+            popped_items = array(self._items.typecode)
+        else:
+            popped_items = self._items[-popped_count:]
+            del self._items[-popped_count:]
+            popped_items.reverse()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "pop_many",
+                            f"Popped {popped_count} items from the stack", popped_count))
+        return popped_items
+    
+    def clear(self):
+        """
+        Remove all elements from the stack.
+        
+        Returns:
+            None
+        """
+        # array.array has no clear(); delete every element in place
+        del self._items[:]
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Stack has been cleared", None))
+    
+    def buffer(self):
+        """
+        Return a zero-copy memoryview of the elements, bottom to top.
+        
+        The view shares memory with the stack, so it can be handed to code
+        that accepts the buffer protocol (struct, NumPy, file writes)
+        without copying. While any view is alive the array cannot be
+        resized, so push and pop raise BufferError until the view is
+        released (e.g. with `with stack.buffer() as view:`).
+        
+        Returns:
+            memoryview: View over the underlying array
+        """
+        return memoryview(self._items)
+    
+    def __buffer__(self, flags):
+        """
+        Export the underlying array through the buffer protocol (Python 3.12+).
+        
+        This lets memoryview(stack) and other buffer consumers use the
+        stack directly; see buffer() for the resizing restriction.
+        
+        Args:
+            flags (int): Buffer request flags
+        
+        Returns:
+            memoryview: View over the underlying array
+        """
+        return memoryview(self._items)
+
+
+class BoundedStack(Stack):
+    """
+    A Stack that evicts its oldest (bottom) elements to stay within a budget.
+    
+    The budget is a maximum number of elements, an approximate number of
+    bytes, or both. After every push, elements are evicted from the bottom
+    until the stack fits again; this suits undo histories, where the oldest
+    entries are the least useful. The elements live in a ring buffer, so
+    each eviction is an O(1) popleft().
+    
+    Sizes are measured once per element with sys.getsizeof() by default.
+    That is a shallow size (a container's contents are not counted), so a
+    custom sizeof function can be passed for nested payloads. The most
+    recently pushed element is never evicted, even if it alone exceeds
+    max_bytes.
+    
+    Evicted elements are reported to the event sink and passed to the
+    optional on_evict callback, which can spill them elsewhere.
+    
+    Attributes:
+        _items (RingBuffer): Internal circular buffer to store stack elements
+        sink: Callable receiving an Event per operation (None = silent)
+        max_items (int): Maximum number of elements (None means no count limit)
+        max_bytes (int): Approximate byte budget (None means no memory limit)
+        on_evict: Callable receiving each evicted element (None = no callback)
+        _sizeof: Callable returning the size of an element in bytes
+        _sizes (RingBuffer): Size of each element, bottom to top
+        _current_bytes (int): Sum of the sizes of the stored elements
+        _eviction_count (int): Number of elements evicted so far
+    """
+    
+    __slots__ = ("max_items", "max_bytes", "on_evict", "_sizeof", "_sizes",
+                 "_current_bytes", "_eviction_count")
+    
+    def __init__(self, max_items=None, max_bytes=None, on_evict=None, sizeof=sys.getsizeof,
+                 sink=None):
+        """
+        Initialize an empty bounded stack.
+        
+        Args:
+            max_items (int): Maximum number of elements (default: no count limit)
+            max_bytes (int): Approximate byte budget for the elements (default: no memory limit)
+            on_evict: Callable receiving each evicted element (default: none)
+            sizeof: Callable returning an element's size in bytes (default: sys.getsizeof)
+            sink: Event sink for operation reports (default: the module default from events.py)
+        
+        Raises:
+            ValueError: If max_items or max_bytes is smaller than 1
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError(f"max_items must be at least 1, got {max_items}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+        super().__init__(sink=sink, storage=RingBuffer())
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._sizeof = sizeof
+        self._sizes = RingBuffer()
+        self._current_bytes = 0
+        self._eviction_count = 0
+    
+    @property
+    def current_bytes(self):
+        """
+        Approximate number of bytes held by the stored elements.
+        
+        Returns:
+            int: Sum of the element sizes measured when they were pushed
+        """
+        return self._current_bytes
+    
+    @property
+    def eviction_count(self):
+        """
+        Number of elements evicted since the stack was created.
+        
+        Returns:
+            int: Total evictions
+        """
+        return self._eviction_count
+    
+    def _evict_overflow(self):
+        """
+        Evict bottom elements until the stack is within its budget.
+        
+        The top element is always kept.
+        """
+        while len(self._items) > 1 and (
+                (self.max_items is not None and len(self._items) > self.max_items)
+                or (self.max_bytes is not None and self._current_bytes > self.max_bytes)):
+            evicted_item = self._items.popleft()
+            self._current_bytes -= self._sizes.popleft()
+            self._eviction_count += 1
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "evict",
+                                f"Evicted '{evicted_item}' from the bottom of the stack", evicted_item))
+            if self.on_evict is not None:
+                self.on_evict(evicted_item)
+    
+    def push(self, item):
+        """
+        Add an element to the top of the stack, evicting from the bottom if over budget.
+        
+        Args:
+            item: The element to be added to the stack (can be any data type)
+        
+        Returns:
+            None
+        """
+        item_size = self._sizeof(item)
+        self._items.append(item)
+        self._sizes.append(item_size)
+        self._current_bytes += item_size
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "push", f"Pushed '{item}' onto the stack", item))
+        self._evict_overflow()
+    
+    def pop(self):
+        """
+        Remove and return the top element from the stack.
+        
+        Returns:
+            The top element from the stack
+            
+        Raises:
+            IndexError: If the stack is empty (underflow condition)
+        """
+        popped_item = super().pop()
+        self._current_bytes -= self._sizes.pop()
+        return popped_item
+    
+    def push_many(self, iterable):
+        """
+        Add every element of an iterable to the top of the stack.
+        
+        The budget is enforced after every element, so a long or unbounded
+        iterable never holds more than the budget allows.
+        
+        Args:
+            iterable: The elements to be added, bottom to top
+        
+        Returns:
+            int: Number of elements pushed (including any evicted again)
+        """
+        pushed_count = 0
+        for item in iterable:
+            item_size = self._sizeof(item)
+            self._items.append(item)
+            self._sizes.append(item_size)
+            self._current_bytes += item_size
+            pushed_count += 1
+            self._evict_overflow()
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "push_many",
+                            f"Pushed {pushed_count} items onto the stack", pushed_count))
+        return pushed_count
+    
+    def pop_many(self, n):
+        """
+        Remove and return up to n elements from the top of the stack.
+        
+        Args:
+            n (int): Maximum number of elements to remove
+        
+        Returns:
+            list: The removed elements in pop order (top first)
+            
+        Raises:
+            ValueError: If n is negative
+        """
+        popped_items = super().pop_many(n)
+        for _ in range(len(popped_items)):
+            self._current_bytes -= self._sizes.pop()
+        return popped_items
+    
+    def clear(self):
+        """
+        Remove all elements from the stack (cleared elements are not evictions).
+        
+        Returns:
+            None
+        """
+        self._sizes.clear()
+        self._current_bytes = 0
+        super().clear()
 
 
 # Example usage and testing (only runs when script is executed directly)
@@ -154,7 +666,7 @@ if __name__ == "__main__":
     print("=== Stack Data Structure Demo ===")
     
     # Create a new stack instance
-    stack = Stack()
+    stack = Stack(sink=PrintSink())
     
     # Test empty stack
     print("\n1. Testing empty stack:")
@@ -182,4 +694,12 @@ if __name__ == "__main__":
     print("\n5. Testing size operation:")
     stack.size()
     
+    # Test bounded stack eviction
+    print("\n6. Testing bounded stack eviction:")
+    bounded_stack = BoundedStack(max_items=2, sink=PrintSink())
+    bounded_stack.push_many(["Edit 1", "Edit 2"])
+    bounded_stack.push("Edit 3")
+    bounded_stack.display()
+    print(f"Evictions: {bounded_stack.eviction_count}, bytes held: {bounded_stack.current_bytes}")
+    
     print("\n=== Stack Demo Complete ===")
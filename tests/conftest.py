@@ -0,0 +1,13 @@
+"""
+Test configuration: the modules live at the project root, so make them importable.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,187 @@
+"""
+Tests for the asyncio adapters AsyncQueue and AsyncStack.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import asyncio
+
+import pytest
+
+from asyncstructures import AsyncQueue, AsyncStack, QueueClosed
+from queue import Empty, Full
+
+
+def run(coroutine):
+    """
+    Run a coroutine on a fresh event loop, failing if it hangs.
+    """
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+async def settle():
+    """
+    Let every ready task run until it blocks.
+    """
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+ADAPTERS = [
+    pytest.param(AsyncQueue, "put", "get", "put_nowait", "get_nowait", id="queue"),
+    pytest.param(AsyncStack, "push", "pop", "push_nowait", "pop_nowait", id="stack"),
+]
+
+
+def test_queue_is_fifo_and_stack_is_lifo():
+    async def main():
+        queue = AsyncQueue()
+        stack = AsyncStack()
+        for item in range(3):
+            await queue.put(item)
+            await stack.push(item)
+        return ([await queue.get() for _ in range(3)], [await stack.pop() for _ in range(3)])
+
+    assert run(main()) == ([0, 1, 2], [2, 1, 0])
+
+
+@pytest.mark.parametrize("cls, put, get, put_nowait, get_nowait", ADAPTERS)
+def test_cancelled_get_does_not_lose_an_element(cls, put, get, put_nowait, get_nowait):
+    async def main():
+        adapter = cls()
+        cancelled = asyncio.create_task(getattr(adapter, get)())
+        waiting = asyncio.create_task(getattr(adapter, get)())
+        await settle()
+        cancelled.cancel()
+        await settle()
+        getattr(adapter, put_nowait)("a")
+        assert await waiting == "a"
+        assert cancelled.cancelled()
+        assert len(adapter) == 0
+        assert not adapter._getters
+
+    run(main())
+
+
+@pytest.mark.parametrize("cls, put, get, put_nowait, get_nowait", ADAPTERS)
+def test_getter_cancelled_after_its_wakeup_passes_it_on(cls, put, get, put_nowait, get_nowait):
+    async def main():
+        adapter = cls()
+        first = asyncio.create_task(getattr(adapter, get)())
+        second = asyncio.create_task(getattr(adapter, get)())
+        await settle()
+        # Wakes the first getter, which is cancelled before it can run
+        getattr(adapter, put_nowait)("a")
+        first.cancel()
+        assert await second == "a"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    run(main())
+
+
+@pytest.mark.parametrize("cls, put, get, put_nowait, get_nowait", ADAPTERS)
+def test_cancelled_put_stores_nothing(cls, put, get, put_nowait, get_nowait):
+    async def main():
+        adapter = cls(maxsize=1)
+        getattr(adapter, put_nowait)("a")
+        cancelled = asyncio.create_task(getattr(adapter, put)("cancelled"))
+        waiting = asyncio.create_task(getattr(adapter, put)("b"))
+        await settle()
+        cancelled.cancel()
+        await settle()
+        assert getattr(adapter, get_nowait)() == "a"
+        await waiting
+        assert getattr(adapter, get_nowait)() == "b"
+        assert len(adapter) == 0
+        assert not adapter._putters
+
+    run(main())
+
+
+@pytest.mark.parametrize("cls, put, get, put_nowait, get_nowait", ADAPTERS)
+def test_maxsize_applies_backpressure(cls, put, get, put_nowait, get_nowait):
+    async def main():
+        adapter = cls(maxsize=2)
+        progress = []
+
+        async def producer():
+            for item in range(6):
+                await getattr(adapter, put)(item)
+                progress.append(item)
+
+        task = asyncio.create_task(producer())
+        await settle()
+        assert progress == [0, 1]
+        assert adapter.full()
+        with pytest.raises(Full):
+            getattr(adapter, put_nowait)("over")
+
+        taken = []
+        while len(taken) < 6:
+            taken.append(await getattr(adapter, get)())
+            await settle()
+            assert len(adapter) <= 2
+        await task
+        assert sorted(taken) == list(range(6))
+        with pytest.raises(Empty):
+            getattr(adapter, get_nowait)()
+
+    run(main())
+
+
+@pytest.mark.parametrize("cls, put, get, put_nowait, get_nowait", ADAPTERS)
+def test_join_waits_for_task_done(cls, put, get, put_nowait, get_nowait):
+    async def main():
+        adapter = cls()
+        await adapter.join()
+        for item in range(3):
+            await getattr(adapter, put)(item)
+        joined = asyncio.create_task(adapter.join())
+        for _ in range(3):
+            await getattr(adapter, get)()
+            await settle()
+            assert not joined.done()
+            adapter.task_done()
+        await joined
+        with pytest.raises(ValueError):
+            adapter.task_done()
+
+    run(main())
+
+
+@pytest.mark.parametrize("cls, put, get, put_nowait, get_nowait", ADAPTERS)
+def test_close_wakes_waiters_and_ends_iteration(cls, put, get, put_nowait, get_nowait):
+    async def main():
+        adapter = cls(maxsize=1)
+        getter = asyncio.create_task(getattr(adapter, get)())
+        await settle()
+        adapter.close()
+        with pytest.raises(QueueClosed):
+            await getter
+
+        adapter = cls(maxsize=1)
+        getattr(adapter, put_nowait)("a")
+        putter = asyncio.create_task(getattr(adapter, put)("b"))
+        await settle()
+        adapter.close()
+        with pytest.raises(QueueClosed):
+            await putter
+        # Stored elements can still be taken, then iteration stops
+        assert [item async for item in adapter] == ["a"]
+        with pytest.raises(QueueClosed):
+            await getattr(adapter, get)()
+
+    run(main())
+
+
+def test_async_iteration_drains_before_stopping():
+    async def main():
+        queue = AsyncQueue()
+        for item in range(3):
+            await queue.put(item)
+        queue.close()
+        return [item async for item in queue]
+
+    assert run(main()) == [0, 1, 2]
@@ -0,0 +1,79 @@
+"""
+Handle tests for DoublyLinkedList.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import pytest
+
+from doublylinkedlist import DoublyLinkedList
+
+
+def check_links(linked_list, expected):
+    """
+    Assert that the forward and backward links agree and hold expected.
+    """
+    forward = []
+    current = linked_list.head
+    while current is not None:
+        assert current.owner is linked_list
+        forward.append(current.data)
+        current = current.next
+    assert forward == list(expected)
+    assert list(reversed(linked_list)) == list(reversed(expected))
+    assert len(linked_list) == len(expected)
+
+
+def test_handle_from_another_list_is_rejected():
+    first = DoublyLinkedList()
+    second = DoublyLinkedList()
+    first.extend([1, 2, 3])
+    handle = second.insert_at_end("x")
+    second.insert_at_end("y")
+
+    for operation in (lambda: first.remove(handle),
+                      lambda: first.insert_after(handle, 9),
+                      lambda: first.insert_before(handle, 9),
+                      lambda: first.move_to_front(handle),
+                      lambda: first.move_to_end(handle)):
+        with pytest.raises(ValueError):
+            operation()
+    check_links(first, [1, 2, 3])
+    check_links(second, ["x", "y"])
+
+    # The head of another list has no previous node either
+    with pytest.raises(ValueError):
+        first.remove(second.head)
+    check_links(second, ["x", "y"])
+
+
+def test_removed_and_cleared_handles_are_rejected():
+    linked_list = DoublyLinkedList()
+    head = linked_list.insert_at_end("a")
+    middle = linked_list.insert_at_end("b")
+    linked_list.insert_at_end("c")
+    assert linked_list.remove(middle) == "b"
+    with pytest.raises(ValueError):
+        linked_list.remove(middle)
+    linked_list.clear()
+    with pytest.raises(ValueError):
+        linked_list.insert_after(head, "d")
+    check_links(linked_list, [])
+
+
+def test_moved_handle_stays_valid():
+    linked_list = DoublyLinkedList()
+    handles = [linked_list.insert_at_end(value) for value in "abcd"]
+    linked_list.move_to_front(handles[2])
+    linked_list.move_to_end(handles[0])
+    linked_list.insert_after(handles[2], "x")
+    check_links(linked_list, ["c", "x", "b", "d", "a"])
+    assert linked_list.remove(handles[0]) == "a"
+    check_links(linked_list, ["c", "x", "b", "d"])
+
+
+def test_indexed_option_is_not_offered():
+    assert DoublyLinkedList().indexed is False
+    with pytest.raises(TypeError):
+        DoublyLinkedList(indexed=True)
@@ -0,0 +1,88 @@
+"""
+Recovery tests for JournaledStructure.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import pytest
+
+from journal import JournaledStructure
+from queue import Queue
+from stack import BoundedStack, TypedStack
+
+
+def test_recovery_replays_calls_and_skips_underflows(tmp_path):
+    with JournaledStructure(Queue, tmp_path, fsync="always") as queue:
+        queue.enqueue_many(["a", "b", "c"])
+        queue.dequeue()
+        queue.requeue_front("z")
+    with JournaledStructure(Queue, tmp_path) as queue:
+        assert list(queue) == ["z", "b", "c"]
+        queue.clear()
+        with pytest.raises(IndexError):
+            queue.dequeue()
+    with JournaledStructure(Queue, tmp_path) as queue:
+        assert list(queue) == []
+
+
+def test_call_that_raised_does_not_break_recovery(tmp_path):
+    with JournaledStructure(TypedStack, tmp_path, fsync="always") as stack:
+        stack.push(1)
+        with pytest.raises(OverflowError):
+            stack.push(2 ** 70)
+        stack.push(3)
+    with JournaledStructure(TypedStack, tmp_path) as stack:
+        assert list(stack) == [1, 3]
+        stack.push(4)
+    with JournaledStructure(TypedStack, tmp_path) as stack:
+        assert list(stack) == [1, 3, 4]
+
+
+def test_recovery_does_not_refire_evictions(tmp_path):
+    evicted = []
+    with JournaledStructure(BoundedStack, tmp_path, max_items=2, on_evict=evicted.append) as stack:
+        stack.push_many([1, 2, 3])
+    assert evicted == [1]
+
+    with JournaledStructure(BoundedStack, tmp_path, max_items=2, on_evict=evicted.append) as stack:
+        assert list(stack) == [2, 3]
+        assert evicted == [1]
+        stack.push(4)
+        assert evicted == [1, 2]
+
+    with JournaledStructure(BoundedStack, tmp_path, max_items=2, on_evict=evicted.append) as stack:
+        stack.compact()
+    with JournaledStructure(BoundedStack, tmp_path, max_items=2, on_evict=evicted.append) as stack:
+        assert list(stack) == [3, 4]
+        assert evicted == [1, 2]
+
+
+def test_partial_effect_of_a_failed_call_is_recovered(tmp_path):
+    def sizeof(item):
+        if item == "bad":
+            raise ValueError("no size")
+        return 1
+
+    with JournaledStructure(BoundedStack, tmp_path, max_bytes=10, sizeof=sizeof) as stack:
+        with pytest.raises(ValueError):
+            stack.push_many(["a", "b", "bad", "c"])
+        assert list(stack) == ["a", "b"]
+    with JournaledStructure(BoundedStack, tmp_path, max_bytes=10, sizeof=sizeof) as stack:
+        assert list(stack) == ["a", "b"]
+
+
+def test_unpicklable_argument_is_rejected_before_it_is_applied(tmp_path):
+    with JournaledStructure(Queue, tmp_path) as queue:
+        with pytest.raises(Exception):
+            queue.enqueue(lambda: None)
+        assert list(queue) == []
+
+
+def test_unexpected_replay_error_stops_recovery(tmp_path):
+    with JournaledStructure(Queue, tmp_path, fsync="always") as queue:
+        queue.enqueue("a")
+        # A record the structure cannot apply, as a changed method signature would leave
+        queue._journal.append("enqueue", ("b", "c"))
+    with pytest.raises(TypeError):
+        JournaledStructure(Queue, tmp_path)
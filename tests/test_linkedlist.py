@@ -0,0 +1,201 @@
+"""
+Invariant tests for LinkedList.
+
+The tail pointer must reference the last node after every insert, delete,
+clear and positional operation, the size counter must match the nodes,
+and an indexed list's value index must match its contents.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import random
+
+import pytest
+
+from linkedlist import LinkedList
+
+
+def check_invariants(linked_list, expected):
+    """
+    Assert that a linked list is internally consistent and holds expected.
+    """
+    nodes = []
+    current = linked_list.head
+    while current is not None:
+        nodes.append(current)
+        current = current.next
+    assert [node.data for node in nodes] == list(expected)
+    assert linked_list._size == len(nodes) == len(linked_list)
+    assert linked_list.tail is (nodes[-1] if nodes else None)
+
+    if linked_list.indexed:
+        index = {}
+        previous = None
+        for node in nodes:
+            index.setdefault(node.data, set()).add(previous)
+            previous = node
+        assert linked_list._index == index
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize("seed", range(4))
+def test_random_operations_keep_tail_and_size(indexed, seed):
+    rng = random.Random(seed)
+    linked_list = LinkedList(indexed=indexed)
+    expected = []
+    for step in range(1500):
+        # Few distinct values, so duplicates are common
+        value = rng.randrange(12)
+        choice = rng.random()
+        if choice < 0.2:
+            linked_list.insert_at_end(value)
+            expected.append(value)
+        elif choice < 0.35:
+            linked_list.insert_at_beginning(value)
+            expected.insert(0, value)
+        elif choice < 0.5:
+            position = rng.randrange(len(expected) + 1)
+            linked_list.insert_at_position(value, position)
+            expected.insert(position, value)
+        elif choice < 0.55:
+            items = [rng.randrange(12) for _ in range(rng.randrange(5))]
+            linked_list.extend(items)
+            expected.extend(items)
+        elif choice < 0.6:
+            items = [rng.randrange(12) for _ in range(rng.randrange(5))]
+            linked_list.extend_left(items)
+            expected[:0] = items[::-1]
+        elif choice < 0.75:
+            assert linked_list.delete_by_value(value) == (value in expected)
+            if value in expected:
+                expected.remove(value)
+        elif choice < 0.9 and expected:
+            position = rng.randrange(len(expected))
+            assert linked_list.delete_at_position(position) == expected.pop(position)
+        elif choice < 0.98:
+            position = expected.index(value) if value in expected else -1
+            assert linked_list.search(value) == position
+        else:
+            linked_list.clear()
+            expected.clear()
+        check_invariants(linked_list, expected)
+
+
+def test_append_after_deleting_the_tail():
+    linked_list = LinkedList()
+    linked_list.extend([1, 2, 3])
+    linked_list.delete_at_position(2)
+    linked_list.insert_at_end(4)
+    check_invariants(linked_list, [1, 2, 4])
+    linked_list.delete_by_value(4)
+    linked_list.insert_at_end(5)
+    check_invariants(linked_list, [1, 2, 5])
+
+
+def test_unhashable_value_leaves_indexed_list_unchanged():
+    linked_list = LinkedList(indexed=True)
+    linked_list.extend(["a", "b"])
+    for insert in (lambda: linked_list.insert_at_end(["x"]),
+                   lambda: linked_list.insert_at_beginning(["x"]),
+                   lambda: linked_list.insert_at_position(["x"], 1),
+                   lambda: linked_list.extend(["c", ["x"]]),
+                   lambda: linked_list.extend_left(["c", ["x"]])):
+        with pytest.raises(TypeError):
+            insert()
+        check_invariants(linked_list, ["a", "b"])
+    assert linked_list.delete_at_position(0) == "a"
+    check_invariants(linked_list, ["b"])
+
+
+def test_unhashable_values_work_without_index():
+    linked_list = LinkedList()
+    linked_list.insert_at_end(["x"])
+    linked_list.extend_left([{"y": 1}])
+    check_invariants(linked_list, [{"y": 1}, ["x"]])
+
+
+def test_extend_left_with_failing_iterable_leaves_list_unchanged():
+    def values():
+        yield "c"
+        raise RuntimeError("source failed")
+
+    for indexed in (False, True):
+        linked_list = LinkedList(indexed=indexed)
+        linked_list.extend(["a", "b"])
+        with pytest.raises(RuntimeError):
+            linked_list.extend_left(values())
+        check_invariants(linked_list, ["a", "b"])
+
+
+# Each case starts from [1, 2, 3] and touches the first or last node,
+# where the tail pointer has to move
+TAIL_CASES = [
+    ("insert at end", lambda linked_list: linked_list.insert_at_end(4), [1, 2, 3, 4]),
+    ("insert at position == size", lambda linked_list: linked_list.insert_at_position(4, 3), [1, 2, 3, 4]),
+    ("insert before the tail", lambda linked_list: linked_list.insert_at_position(4, 2), [1, 2, 4, 3]),
+    ("insert at beginning", lambda linked_list: linked_list.insert_at_beginning(0), [0, 1, 2, 3]),
+    ("extend", lambda linked_list: linked_list.extend([4, 5]), [1, 2, 3, 4, 5]),
+    ("extend with nothing", lambda linked_list: linked_list.extend([]), [1, 2, 3]),
+    ("extend_left", lambda linked_list: linked_list.extend_left([0, -1]), [-1, 0, 1, 2, 3]),
+    ("delete tail by position", lambda linked_list: linked_list.delete_at_position(2), [1, 2]),
+    ("delete head by position", lambda linked_list: linked_list.delete_at_position(0), [2, 3]),
+    ("delete tail by value", lambda linked_list: linked_list.delete_by_value(3), [1, 2]),
+    ("delete head by value", lambda linked_list: linked_list.delete_by_value(1), [2, 3]),
+    ("delete missing value", lambda linked_list: linked_list.delete_by_value(9), [1, 2, 3]),
+    ("clear", lambda linked_list: linked_list.clear(), []),
+]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize("operation, expected", [case[1:] for case in TAIL_CASES],
+                         ids=[case[0] for case in TAIL_CASES])
+def test_tail_follows_each_operation(indexed, operation, expected):
+    linked_list = LinkedList(indexed=indexed)
+    linked_list.extend([1, 2, 3])
+    operation(linked_list)
+    check_invariants(linked_list, expected)
+    # Appending afterwards must link after the real last node
+    linked_list.insert_at_end("end")
+    check_invariants(linked_list, expected + ["end"])
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_tail_of_a_single_node_list(indexed):
+    for remove in (lambda linked_list: linked_list.delete_at_position(0),
+                   lambda linked_list: linked_list.delete_by_value("only"),
+                   lambda linked_list: linked_list.clear()):
+        linked_list = LinkedList(indexed=indexed)
+        linked_list.insert_at_end("only")
+        check_invariants(linked_list, ["only"])
+        assert linked_list.head is linked_list.tail
+        remove(linked_list)
+        check_invariants(linked_list, [])
+        linked_list.insert_at_beginning("first")
+        check_invariants(linked_list, ["first"])
+        assert linked_list.head is linked_list.tail
+
+
+def test_failed_positional_operations_keep_tail():
+    linked_list = LinkedList()
+    linked_list.extend([1, 2, 3])
+    tail = linked_list.tail
+    for operation in (lambda: linked_list.insert_at_position(4, 4),
+                      lambda: linked_list.insert_at_position(4, -1),
+                      lambda: linked_list.delete_at_position(3),
+                      lambda: linked_list.delete_at_position(-1)):
+        with pytest.raises(IndexError):
+            operation()
+        assert linked_list.tail is tail
+        check_invariants(linked_list, [1, 2, 3])
+
+
+def test_loaded_list_has_its_tail(tmp_path):
+    path = str(tmp_path / "list.snapshot")
+    linked_list = LinkedList()
+    linked_list.extend(range(5))
+    linked_list.save(path)
+    loaded = LinkedList.load(path)
+    check_invariants(loaded, list(range(5)))
+    loaded.insert_at_end(5)
+    check_invariants(loaded, list(range(6)))
@@ -0,0 +1,108 @@
+"""
+Tests for InstrumentedStructure and the Prometheus export.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import pytest
+
+from metrics import InstrumentedStructure, to_prometheus
+from queue import Queue
+from stack import BoundedStack, Stack
+
+
+def test_counts_calls_errors_underflows_and_high_water():
+    stack = InstrumentedStructure(Stack(), sample_every=1)
+    stack.push_many([1, 2, 3])
+    stack.pop()
+    stack.pop()
+    stack.pop()
+    with pytest.raises(IndexError):
+        stack.pop()
+    snapshot = stack.snapshot()
+    assert snapshot["name"] == "Stack"
+    assert snapshot["size"] == 0
+    assert snapshot["high_water"] == 3
+    assert snapshot["underflows"] == 1
+    assert snapshot["operations"]["push_many"]["count"] == 1
+    assert snapshot["operations"]["pop"]["count"] == 4
+    assert snapshot["operations"]["pop"]["errors"] == 1
+
+    stack.reset()
+    pop = stack.snapshot()["operations"]["pop"]
+    assert (pop["count"], pop["errors"], pop["latency"]["samples"]) == (0, 0, 0)
+    assert set(pop["latency"]["buckets"].values()) == {0}
+    assert stack.snapshot()["underflows"] == 0
+
+
+def test_latency_histogram_is_cumulative_and_sampled():
+    queue = InstrumentedStructure(Queue(), sample_every=4)
+    for item in range(10):
+        queue.enqueue(item)
+    latency = queue.snapshot()["operations"]["enqueue"]["latency"]
+    assert latency["samples"] == 2
+    assert latency["sum_ns"] > 0
+    counts = list(latency["buckets"].values())
+    assert counts == sorted(counts)
+    assert list(latency["buckets"])[-1] == "+Inf"
+    assert counts[-1] == 2
+
+    # New wrappers pick up a changed sample rate and keep the counters
+    queue.sample_every = 1
+    queue.enqueue(10)
+    latency = queue.snapshot()["operations"]["enqueue"]["latency"]
+    assert queue.snapshot()["operations"]["enqueue"]["count"] == 11
+    assert latency["samples"] == 3
+
+
+def test_callable_attributes_are_not_wrapped_and_setting_forwards():
+    evicted = []
+    stack = InstrumentedStructure(BoundedStack(max_items=1))
+    assert stack.on_evict is None
+    stack.on_evict = evicted.append
+    assert stack.structure.on_evict == evicted.append
+    stack.push(1)
+    stack.push(2)
+    assert evicted == [1]
+
+    events = []
+    stack.sink = events.append
+    assert stack.sink == events.append
+    stack.sink = None
+    assert stack.sink is None
+    assert "sink" not in stack.snapshot()["operations"]
+    assert "on_evict" not in stack.snapshot()["operations"]
+
+
+def test_prometheus_export():
+    queue = InstrumentedStructure(Queue(), name="tasks", sample_every=1)
+    queue.enqueue("a")
+    queue.dequeue()
+    with pytest.raises(IndexError):
+        queue.dequeue()
+    text = to_prometheus([queue.snapshot()])
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# TYPE datastructure_operations_total counter" in lines
+    assert "# TYPE datastructure_operation_latency_seconds histogram" in lines
+    assert 'datastructure_size{structure="tasks"} 0' in lines
+    assert 'datastructure_size_high_water{structure="tasks"} 1' in lines
+    assert 'datastructure_underflows_total{structure="tasks"} 1' in lines
+    assert 'datastructure_operations_total{structure="tasks",operation="dequeue"} 2' in lines
+    assert 'datastructure_operation_errors_total{structure="tasks",operation="dequeue"} 1' in lines
+    assert 'datastructure_operation_latency_seconds_bucket{structure="tasks",operation="enqueue",le="+Inf"} 1' in lines
+    assert 'datastructure_operation_latency_seconds_count{structure="tasks",operation="dequeue"} 2' in lines
+    buckets = [line for line in lines
+               if line.startswith('datastructure_operation_latency_seconds_bucket{structure="tasks",operation="enqueue"')]
+    assert buckets[0].startswith('datastructure_operation_latency_seconds_bucket{structure="tasks",'
+                                 'operation="enqueue",le="1.28e-07"}')
+
+
+def test_prometheus_label_values_are_escaped():
+    stack = InstrumentedStructure(Stack(), name='say "hi"\\n\nnow')
+    stack.push(1)
+    text = to_prometheus([stack.snapshot()])
+    assert 'datastructure_size{structure="say \\"hi\\"\\\\n\\nnow"} 1' in text.splitlines()
+    # The snapshot itself keeps the raw name
+    assert stack.snapshot()["name"] == 'say "hi"\\n\nnow'
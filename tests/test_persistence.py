@@ -0,0 +1,77 @@
+"""
+Tests for snapshot files: save/load round trips and the lazy Snapshot view.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import os
+from fractions import Fraction
+
+import pytest
+
+from linkedlist import LinkedList
+from persistence import Snapshot, write_snapshot
+from queue import Queue
+from stack import Stack, TypedStack
+
+
+ENCODINGS = [
+    (b"q", [0, -1, 2**63 - 1, -2**63, 42]),
+    (b"d", [0.0, -1.5, 1e300, float("inf")]),
+    (b"s", ["", "task", "déjà vu", "☃" * 100]),
+    (b"p", [1, "two", 3.0, None, (4, 5), Fraction(1, 3), 2**70]),
+]
+
+
+@pytest.mark.parametrize("encoding, values", ENCODINGS, ids=[code.decode() for code, _ in ENCODINGS])
+@pytest.mark.parametrize("cls, add", [(Stack, "push_many"), (Queue, "enqueue_many"), (LinkedList, "extend")])
+def test_round_trip_for_each_encoding(tmp_path, cls, add, encoding, values):
+    path = str(tmp_path / "structure.snapshot")
+    structure = cls()
+    getattr(structure, add)(values)
+    assert structure.save(path) == len(values)
+    loaded = cls.load(path)
+    assert type(loaded) is cls
+    assert list(loaded) == values
+    with Snapshot(path) as snapshot:
+        assert snapshot.encoding == encoding
+        assert list(snapshot) == values
+        assert [snapshot[index] for index in range(-len(values), len(values))] == values * 2
+        assert list(snapshot.restore(cls)) == values
+
+
+def test_load_rejects_another_structure(tmp_path):
+    path = str(tmp_path / "queue.snapshot")
+    Queue().save(path)
+    with pytest.raises(ValueError):
+        Stack.load(path)
+
+
+@pytest.mark.parametrize("typecode, values", [("d", [0.5, -2.25]), ("i", [1, -2, 3]), ("q", [])])
+def test_typed_stack_round_trip(tmp_path, typecode, values):
+    path = str(tmp_path / "typed.snapshot")
+    stack = TypedStack(typecode)
+    stack.push_many(values)
+    stack.save(path)
+    loaded = TypedStack.load(path)
+    assert loaded.typecode == typecode
+    assert list(loaded) == values
+    with Snapshot(path) as snapshot:
+        assert snapshot.typecode == typecode
+        restored = snapshot.restore(TypedStack)
+        assert restored.typecode == typecode
+        assert list(restored) == values
+        # An explicit typecode still wins, and a plain Stack takes the elements as they are
+        assert snapshot.restore(TypedStack, typecode="f").typecode == "f"
+        assert list(snapshot.restore(Stack)) == values
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path):
+    path = str(tmp_path / "stack.snapshot")
+    write_snapshot(path, "stack", [1, 2])
+    with pytest.raises(Exception):
+        write_snapshot(path, "stack", [1, lambda: None])
+    assert os.listdir(tmp_path) == ["stack.snapshot"]
+    # The previous snapshot is untouched
+    assert list(Stack.load(path)) == [1, 2]
@@ -0,0 +1,98 @@
+"""
+Tests for TaskPipeline.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from main import DataStructureManager
+from pipeline import TaskPipeline, TaskRecord
+
+
+def split_words(task):
+    """A worker returning an unhashable result (a list)."""
+    if task == "fail":
+        raise ValueError(task)
+    return task.split()
+
+
+def crash_on_poison(task):
+    """A worker whose process dies on one task."""
+    if task == "poison":
+        os._exit(1)
+    return task
+
+
+def test_unrecorded_tasks_return_to_the_queue_when_run_fails():
+    tasks = [f"task {number}" for number in range(20)] + ["poison"] + [f"late {number}" for number in range(5)]
+    with TaskPipeline(crash_on_poison, workers=1, chunk_size=3, max_pending=100) as pipeline:
+        pipeline.submit_many(tasks)
+        with pytest.raises(BrokenProcessPool):
+            pipeline.run()
+        recorded = [task for task, _ in pipeline.history]
+        assert recorded + list(pipeline.queue) == tasks
+
+
+def test_run_after_a_worker_died_uses_a_fresh_pool():
+    tasks = [f"task {number}" for number in range(10)] + ["poison"] + [f"late {number}" for number in range(5)]
+    with TaskPipeline(crash_on_poison, workers=1, chunk_size=2) as pipeline:
+        pipeline.submit_many(tasks)
+        with pytest.raises(BrokenProcessPool):
+            pipeline.run()
+        # Take the poison task out and finish the rest in the same pipeline
+        remaining = [task for task in pipeline.queue if task != "poison"]
+        pipeline.queue.clear()
+        pipeline.submit_many(remaining)
+        pipeline.run()
+        assert [task for task, _ in pipeline.history] == [task for task in tasks if task != "poison"]
+        assert pipeline.queue.is_empty()
+
+
+def test_chunk_refused_by_a_broken_pool_returns_to_the_queue(monkeypatch):
+    tasks = [f"task {number}" for number in range(10)]
+    with TaskPipeline(crash_on_poison, workers=1, chunk_size=2) as pipeline:
+        pipeline.submit_many(tasks)
+        executor = pipeline._executor = ProcessPoolExecutor(max_workers=1)
+        submit = executor.submit
+        submitted = []
+
+        def submit_until_broken(function, *args):
+            # The pool breaks while run() is still handing out chunks
+            if len(submitted) == 2:
+                raise BrokenProcessPool("A worker died")
+            submitted.append(args)
+            return submit(function, *args)
+
+        monkeypatch.setattr(executor, "submit", submit_until_broken)
+        with pytest.raises(BrokenProcessPool):
+            pipeline.run()
+        assert [task for task, _ in pipeline.history] + list(pipeline.queue) == tasks
+        assert pipeline._executor is None
+
+
+def test_list_results_go_into_the_managers_indexed_history():
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = DataStructureManager()
+    assert manager.linked_list.indexed
+    tasks = [f"task {number}" for number in range(50)] + ["fail", "last task"]
+    with TaskPipeline.for_manager(manager, split_words, workers=2, chunk_size=4) as pipeline:
+        pipeline.submit_many(tasks)
+        assert pipeline.run() == 51
+
+    assert [task for task, _ in manager.linked_list] == tasks[:50] + ["last task"]
+    assert [result for _, result in manager.linked_list] == [task.split() for task in tasks if task != "fail"]
+    assert list(manager.stack)[-1] == "last task"
+    assert [(task, type(error)) for task, error in pipeline.failures] == [("fail", ValueError)]
+    assert manager.queue.is_empty()
+
+    # Records are found by value, not only by the object that was stored
+    assert manager.linked_list.search(TaskRecord("task 3", ["task", "3"])) == 3
+    assert manager.linked_list.search(TaskRecord("task 3", ["other"])) == -1
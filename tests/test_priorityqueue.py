@@ -0,0 +1,100 @@
+"""
+Tests for PriorityQueue.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import random
+
+import pytest
+
+from priorityqueue import PriorityQueue
+
+
+def test_duplicates_are_kept():
+    priority_queue = PriorityQueue()
+    priority_queue.enqueue("retry", priority=2)
+    priority_queue.enqueue("other", priority=1)
+    priority_queue.enqueue("retry", priority=0)
+    assert len(priority_queue) == 3
+    assert list(priority_queue) == ["retry", "other", "retry"]
+    assert [priority_queue.dequeue() for _ in range(3)] == ["retry", "other", "retry"]
+    assert priority_queue.is_empty()
+
+
+def test_handles_address_one_occurrence():
+    priority_queue = PriorityQueue()
+    first = priority_queue.enqueue("job", priority=5)
+    second = priority_queue.enqueue("job", priority=5)
+    priority_queue.enqueue("other", priority=3)
+
+    priority_queue.reprioritize(second, 1)
+    assert priority_queue.priority(first) == 5
+    assert priority_queue.priority(second) == 1
+    # Given an element, the earliest-enqueued occurrence is meant
+    assert priority_queue.priority("job") == 5
+
+    assert priority_queue.remove(first) is True
+    assert priority_queue.remove(first) is False
+    assert first not in priority_queue
+    assert "job" in priority_queue
+    assert [priority_queue.dequeue() for _ in range(2)] == ["job", "other"]
+    assert "job" not in priority_queue
+    with pytest.raises(ValueError):
+        priority_queue.reprioritize(second, 0)
+
+
+def test_handle_from_another_queue_is_rejected():
+    first = PriorityQueue()
+    second = PriorityQueue()
+    first.enqueue("a")
+    handle = second.enqueue("a")
+    assert handle not in first
+    assert first.remove(handle) is False
+    assert len(first) == 1 and len(second) == 1
+
+
+def test_cleared_handles_are_rejected():
+    priority_queue = PriorityQueue()
+    handle = priority_queue.enqueue("a")
+    priority_queue.clear()
+    with pytest.raises(ValueError):
+        priority_queue.priority(handle)
+    priority_queue.enqueue("a")
+    assert priority_queue.remove(handle) is False
+    assert len(priority_queue) == 1
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_operations_match_sorted_list(seed):
+    rng = random.Random(seed)
+    priority_queue = PriorityQueue()
+    # Live occurrences as [priority, sequence, item, handle]
+    expected = []
+    sequence = 0
+    for _ in range(3000):
+        choice = rng.random()
+        if choice < 0.4:
+            item, priority = rng.randrange(8), rng.randrange(5)
+            expected.append([priority, sequence, item, priority_queue.enqueue(item, priority)])
+            sequence += 1
+        elif choice < 0.6 and expected:
+            expected.sort()
+            assert priority_queue.dequeue() == expected.pop(0)[2]
+        elif choice < 0.75 and expected:
+            occurrence = rng.choice(expected)
+            occurrence[0] = rng.randrange(5)
+            occurrence[1] = sequence
+            sequence += 1
+            priority_queue.reprioritize(occurrence[3], occurrence[0])
+        elif choice < 0.9 and expected:
+            occurrence = rng.choice(expected)
+            expected.remove(occurrence)
+            assert priority_queue.remove(occurrence[3]) is True
+        else:
+            item = rng.randrange(8)
+            assert (item in priority_queue) == any(entry[2] == item for entry in expected)
+        expected.sort()
+        assert list(priority_queue) == [entry[2] for entry in expected]
+        assert len(priority_queue) == len(expected)
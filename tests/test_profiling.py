@@ -0,0 +1,63 @@
+"""
+Smoke tests for the scenario profiling harness.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import contextlib
+import io
+import os
+import pstats
+import subprocess
+import sys
+
+from main import DataStructureManager
+from profiling import StackSampler, profile_scenarios
+
+
+SCENARIOS = ["demonstrate_integration_scenario", "demonstrate_data_flow"]
+# Back-to-back runs per scenario: enough CPU time for a few samples even
+# where the profiling timer only fires every few milliseconds
+SCALE = 1000
+
+
+def test_each_scenario_gets_its_own_report(tmp_path):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        profile_scenarios(DataStructureManager, SCENARIOS, scales=(SCALE,), top=5,
+                          output_dir=str(tmp_path), interval=0.0005)
+    report = output.getvalue()
+
+    for name in SCENARIOS:
+        section = report.split(f"=== {name} x{SCALE} ===")[1].split("===")[0]
+        assert f"-> {tmp_path / f'{name}-x{SCALE}.prof'}" in section
+
+        # The cProfile statistics attribute the scenario's time to the scenario method
+        stats = pstats.Stats(str(tmp_path / f"{name}-x{SCALE}.prof")).stats
+        (calls, total_time), = [(entry[1], entry[3]) for (filename, _, function), entry in stats.items()
+                                if function == name and filename.endswith("main.py")]
+        assert calls == SCALE
+        assert total_time > 0
+        other = [function for function in SCENARIOS if function != name]
+        assert not [key for key in stats if key[2] in other]
+
+        if StackSampler.available():
+            # Every sampled stack is rooted at this scenario (or is the harness loop
+            # itself, "<root>") and never runs through another scenario
+            with open(tmp_path / f"{name}-x{SCALE}.folded") as folded_file:
+                stacks = [line.rsplit(" ", 1)[0] for line in folded_file]
+            assert [stack for stack in stacks if stack != "<root>"]
+            assert all(stack.startswith(f"{name} (main.py:") for stack in stacks if stack != "<root>")
+            assert not [stack for stack in stacks if any(function in stack for function in other)]
+
+
+def test_profile_command_line(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "main.py", "--profile", "--scenario", "display_summary", "--scale", "1",
+         "--top", "3", "--profile-dir", str(tmp_path)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert "=== display_summary x1 ===" in result.stdout
+    assert os.path.exists(tmp_path / "display_summary-x1.prof")
@@ -0,0 +1,160 @@
+"""
+Tests for Queue and the standard library compatibility of the queue module.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import asyncio
+import logging
+import logging.handlers
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import queue
+from events import set_default_sink
+from queue import Empty, Full, Queue, SimpleQueue
+
+
+def test_stdlib_thread_pool_runs_with_the_local_queue_module():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(abs, [-1, -2, -3])) == [1, 2, 3]
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit(abs, -1)
+    # Cancelling drains the work queue with get_nowait() until queue.Empty
+    executor.shutdown(cancel_futures=True)
+
+
+def test_asyncio_default_executor_works():
+    async def main():
+        return await asyncio.get_running_loop().run_in_executor(None, pow, 2, 10)
+
+    assert asyncio.run(main()) == 1024
+
+
+def test_simple_queue_raises_this_modules_empty():
+    simple_queue = SimpleQueue()
+    simple_queue.put("a")
+    assert simple_queue.get_nowait() == "a"
+    with pytest.raises(queue.Empty):
+        simple_queue.get_nowait()
+    with pytest.raises(Empty):
+        Queue().get_nowait()
+
+
+def test_queue_handler_accepts_a_local_queue():
+    records = Queue()
+    logger = logging.getLogger("tests.queue")
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    try:
+        logger.warning("spilled")
+    finally:
+        logger.handlers.clear()
+    assert records.get_nowait().getMessage() == "spilled"
+
+
+def test_positional_argument_is_maxsize():
+    bounded = Queue(2)
+    assert bounded.maxsize == 2
+    bounded.put("a")
+    bounded.put("b")
+    assert bounded.full()
+    with pytest.raises(TypeError):
+        Queue(0, None)
+
+
+def test_concurrent_methods_do_not_report_to_the_default_sink():
+    events = []
+    set_default_sink(events.append)
+    try:
+        shared = Queue(1)
+    finally:
+        set_default_sink(None)
+    shared.put("a")
+    assert shared.get() == "a"
+    assert events == []
+    shared.enqueue("b")
+    assert [event.operation for event in events] == ["enqueue"]
+
+
+def test_put_and_get_are_fifo_across_threads():
+    shared = Queue()
+    produced = list(range(1000))
+
+    def producer(items):
+        for item in items:
+            shared.put(item)
+
+    threads = [threading.Thread(target=producer, args=(produced[start::4],)) for start in range(4)]
+    for thread in threads:
+        thread.start()
+    received = [shared.get(timeout=5) for _ in produced]
+    for thread in threads:
+        thread.join()
+    assert sorted(received) == produced
+    # Each producer's elements come out in the order it put them
+    for start in range(4):
+        assert [item for item in received if item % 4 == start] == produced[start::4]
+    assert shared.empty()
+
+
+def test_put_blocks_while_the_queue_is_full():
+    bounded = Queue(maxsize=1)
+    bounded.put("a")
+    with pytest.raises(Full):
+        bounded.put_nowait("b")
+    with pytest.raises(Full):
+        bounded.put("b", timeout=0.01)
+
+    def consume_later():
+        time.sleep(0.05)
+        assert bounded.get() == "a"
+
+    consumer = threading.Thread(target=consume_later)
+    consumer.start()
+    started = time.monotonic()
+    bounded.put("b", timeout=5)
+    assert time.monotonic() - started >= 0.04
+    consumer.join()
+    assert bounded.qsize() == 1
+
+
+def test_get_times_out_and_rejects_negative_timeouts():
+    shared = Queue()
+    started = time.monotonic()
+    with pytest.raises(Empty):
+        shared.get(timeout=0.05)
+    assert time.monotonic() - started >= 0.04
+    with pytest.raises(ValueError):
+        shared.get(timeout=-1)
+    with pytest.raises(ValueError):
+        Queue(1).put("a", timeout=-1)
+
+    threading.Timer(0.02, shared.put, args=("late",)).start()
+    assert shared.get(timeout=5) == "late"
+
+
+def test_join_waits_for_task_done():
+    shared = Queue()
+    for item in range(3):
+        shared.put(item)
+    finished = []
+
+    def worker():
+        while True:
+            item = shared.get()
+            finished.append(item)
+            shared.task_done()
+            if item == 2:
+                return
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    shared.join()
+    assert finished == [0, 1, 2]
+    thread.join()
+    with pytest.raises(ValueError):
+        shared.task_done()
@@ -0,0 +1,143 @@
+"""
+Invariant tests for the RingBuffer storage engine.
+
+Every operation is mirrored on a collections.deque, and after each step
+the buffer's internal state is checked: the capacity is a power of two,
+the tail follows the head by the element count (wrapping around), unused
+slots hold None, and a buffer that was drained is not left sparse.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import random
+from collections import deque
+
+import pytest
+
+from ringbuffer import RingBuffer
+
+
+def check_invariants(ring, expected):
+    """
+    Assert that a ring buffer is internally consistent and holds expected.
+    """
+    capacity = ring._mask + 1
+    assert capacity & (capacity - 1) == 0
+    assert capacity >= RingBuffer.MIN_CAPACITY
+    assert len(ring._buffer) == capacity
+    assert 0 <= ring._count <= capacity
+    assert ring._tail == (ring._head + ring._count) & ring._mask
+    used = {(ring._head + offset) & ring._mask for offset in range(ring._count)}
+    assert all(ring._buffer[slot] is None for slot in range(capacity) if slot not in used)
+    assert list(ring) == list(expected)
+    assert list(reversed(ring)) == list(reversed(expected))
+    assert len(ring) == len(expected)
+
+
+def check_not_sparse(ring):
+    """
+    Assert that a buffer that just shrank is not left at most a quarter full.
+    """
+    capacity = ring._mask + 1
+    assert capacity == RingBuffer.MIN_CAPACITY or ring._count > capacity // 4
+
+
+def test_wraparound_keeps_fifo_order():
+    ring = RingBuffer()
+    expected = deque()
+    # Keep the count below the capacity so head and tail wrap many times without resizing
+    for number in range(100):
+        ring.append(number)
+        expected.append(number)
+        if len(ring) > 5:
+            assert ring.popleft() == expected.popleft()
+        check_invariants(ring, expected)
+    assert ring._mask + 1 == RingBuffer.MIN_CAPACITY
+
+
+def test_growth_unwraps_a_wrapped_buffer():
+    ring = RingBuffer()
+    for number in range(6):
+        ring.append(number)
+    for _ in range(4):
+        ring.popleft()
+    # The next appends wrap around the end of the backing list, then force a resize
+    for number in range(6, 20):
+        ring.append(number)
+        check_invariants(ring, range(4, number + 1))
+    assert ring._mask + 1 == 16
+    assert ring._head == 0
+
+
+def test_shrinks_when_drained():
+    ring = RingBuffer(range(1000))
+    for remaining in range(999, -1, -1):
+        ring.popleft()
+        check_not_sparse(ring)
+        check_invariants(ring, range(1000 - remaining, 1000))
+    assert ring._mask + 1 == RingBuffer.MIN_CAPACITY
+
+
+def test_popleft_many_shrinks_in_one_step():
+    ring = RingBuffer(range(1000))
+    assert ring.popleft_many(990) == list(range(990))
+    check_not_sparse(ring)
+    check_invariants(ring, range(990, 1000))
+
+
+def test_extend_wraps_around_the_end():
+    ring = RingBuffer(range(6))
+    ring.popleft_many(5)
+    ring.extend(range(6, 12))
+    check_invariants(ring, range(5, 12))
+
+
+def test_empty_buffer_raises():
+    ring = RingBuffer()
+    with pytest.raises(IndexError):
+        ring.popleft()
+    with pytest.raises(IndexError):
+        ring.pop()
+    with pytest.raises(IndexError):
+        ring[0]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_operations_match_deque(seed):
+    rng = random.Random(seed)
+    ring = RingBuffer()
+    expected = deque()
+    for step in range(3000):
+        choice = rng.random()
+        if choice < 0.3:
+            ring.append(step)
+            expected.append(step)
+        elif choice < 0.45:
+            ring.appendleft(step)
+            expected.appendleft(step)
+        elif choice < 0.55:
+            items = list(range(step, step + rng.randrange(20)))
+            assert ring.extend(items) == len(items)
+            expected.extend(items)
+        elif choice < 0.7 and expected:
+            assert ring.popleft() == expected.popleft()
+            check_not_sparse(ring)
+        elif choice < 0.8 and expected:
+            assert ring.pop() == expected.pop()
+            check_not_sparse(ring)
+        elif choice < 0.87:
+            n = rng.randrange(30)
+            assert ring.popleft_many(n) == [expected.popleft() for _ in range(min(n, len(expected)))]
+            check_not_sparse(ring)
+        elif choice < 0.95:
+            n = rng.randrange(-10, 10)
+            ring.rotate(n)
+            expected.rotate(n)
+        elif choice < 0.99 and expected:
+            index = rng.randrange(-len(expected), len(expected))
+            assert ring[index] == expected[index]
+        elif choice >= 0.99:
+            ring.clear()
+            expected.clear()
+        check_invariants(ring, expected)
@@ -0,0 +1,164 @@
+"""
+Tests for SharedMemoryQueue.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+
+import pytest
+
+from queue import Empty, Full
+from sharedqueue import SharedMemoryQueue
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def produce(queue, producer, count):
+    """Put count numbered payloads of varying length into the queue."""
+    rng = random.Random(producer)
+    for number in range(count):
+        queue.put(f"{producer}:{number}:".encode() + bytes(rng.randrange(300)))
+    queue.close()
+
+
+def test_random_operations_match_deque():
+    rng = random.Random(1)
+    expected = deque()
+    with SharedMemoryQueue(capacity=1024) as queue:
+        for _ in range(20000):
+            if rng.random() < 0.5:
+                payload = os.urandom(rng.randrange(500))
+                try:
+                    queue.enqueue(payload)
+                    expected.append(payload)
+                except Full:
+                    assert expected
+            elif not expected:
+                with pytest.raises(IndexError):
+                    queue.dequeue()
+                with pytest.raises(Empty):
+                    queue.get_nowait()
+            elif rng.random() < 0.5:
+                assert queue.dequeue() == expected.popleft()
+            else:
+                with queue.consume() as view:
+                    assert isinstance(view, memoryview)
+                    assert view == expected.popleft()
+            assert len(queue) == len(expected)
+
+
+def test_oversized_payload_is_rejected():
+    with SharedMemoryQueue(capacity=1024) as queue:
+        with pytest.raises(ValueError):
+            queue.enqueue(bytes(600))
+
+
+def test_block_survives_an_attached_process_exiting():
+    queue = SharedMemoryQueue(capacity=4096)
+    queue.enqueue(b"first")
+    queue.enqueue(b"second")
+    script = ("from sharedqueue import SharedMemoryQueue\n"
+              f"queue = SharedMemoryQueue.attach({queue.name!r})\n"
+              "assert queue.dequeue() == b'first'\n"
+              "queue.close()\n")
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+    # The exited process's resource tracker cleans up asynchronously; give it time
+    time.sleep(1.0)
+
+    assert queue.dequeue() == b"second"
+    attached = SharedMemoryQueue.attach(queue.name)
+    attached.close()
+    queue.close()
+
+
+@pytest.mark.parametrize("method, mode, producers", [
+    ("fork", "spsc", 1),
+    ("fork", "mpsc", 3),
+    ("spawn", "mpsc", 2),
+])
+def test_producer_processes_keep_per_producer_order(method, mode, producers):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} start method unavailable")
+    context = multiprocessing.get_context(method)
+    count = 2000
+    with SharedMemoryQueue(capacity=4096, mode=mode, context=context) as queue:
+        processes = [context.Process(target=produce, args=(queue, producer, count))
+                     for producer in range(producers)]
+        for process in processes:
+            process.start()
+        last = {}
+        for _ in range(count * producers):
+            producer, number, _ = queue.get(timeout=30).split(b":", 2)
+            assert int(number) == last.get(producer, -1) + 1
+            last[producer] = int(number)
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+        assert queue.is_empty()
+
+
+def test_failed_consume_keeps_the_payload():
+    with SharedMemoryQueue(capacity=1024) as queue:
+        queue.enqueue(b"first")
+        queue.enqueue(b"second")
+        with pytest.raises(RuntimeError):
+            with queue.consume() as view:
+                assert view == b"first"
+                raise RuntimeError("handler failed")
+        assert len(queue) == 2
+        with queue.consume() as view:
+            assert view == b"first"
+        assert queue.dequeue() == b"second"
+
+
+def test_attach_leaves_the_resource_tracker_alone(monkeypatch):
+    # No process-wide patching: other threads keep registering normally
+    import sharedqueue
+    register = sharedqueue.resource_tracker.register
+    registered = []
+
+    def recording_register(name, rtype):
+        registered.append(name)
+        register(name, rtype)
+
+    monkeypatch.setattr(sharedqueue.resource_tracker, "register", recording_register)
+    with SharedMemoryQueue(capacity=1024) as queue:
+        attached = SharedMemoryQueue.attach(queue.name)
+        assert sharedqueue.resource_tracker.register is recording_register
+        attached.close()
+    # The creator's registration and (before track=False existed) the attach's went through
+    assert len(registered) == (1 if sys.version_info >= (3, 13) else 2)
+
+
+@pytest.mark.parametrize("mode", ["spsc", "mpsc"])
+def test_locked_fallback_for_weak_memory_models(monkeypatch, mode):
+    import sharedqueue
+    monkeypatch.setattr(sharedqueue, "LOCK_FREE", False)
+    context = multiprocessing.get_context("fork")
+    with SharedMemoryQueue(capacity=1024, mode=mode, context=context) as queue:
+        assert queue.lock is not None
+        queue.enqueue(b"a")
+        queue.enqueue(b"b")
+        with queue.consume() as view:
+            assert view == b"a"
+        assert queue.dequeue() == b"b"
+        # A handle without the lock cannot use the queue
+        attached = SharedMemoryQueue.attach(queue.name)
+        with pytest.raises(RuntimeError):
+            attached.enqueue(b"c")
+        with pytest.raises(RuntimeError):
+            attached.dequeue()
+        attached.close()
+        process = context.Process(target=produce, args=(queue, 0, 50))
+        process.start()
+        for number in range(50):
+            assert queue.get(timeout=30).split(b":")[1] == str(number).encode()
+        process.join()
@@ -0,0 +1,142 @@
+"""
+Tests for IndexableSkipList, checked against a plain list.
+
+After every operation the contents must match the reference list and
+every link's width must equal the distance to the node it points to.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import random
+
+import pytest
+
+from skiplist import IndexableSkipList
+
+
+class TallSkipList(IndexableSkipList):
+    """A skip list promoting most nodes, so many levels are in use."""
+
+    __slots__ = ()
+
+    P = 0.75
+
+
+def check_invariants(skip_list, expected):
+    """
+    Assert that a skip list's links and widths are consistent and it holds expected.
+    """
+    nodes = []
+    current = skip_list._head.next[0]
+    while current is not None:
+        nodes.append(current)
+        current = current.next[0]
+    assert [node.data for node in nodes] == list(expected)
+    assert skip_list._size == len(expected) == len(skip_list)
+    assert list(skip_list) == list(expected)
+    assert list(reversed(skip_list)) == list(reversed(expected))
+
+    positions = {id(node): position for position, node in enumerate(nodes)}
+    positions[id(skip_list._head)] = -1
+    for level in range(skip_list._level):
+        node = skip_list._head
+        while node is not None:
+            following = node.next[level]
+            if following is None:
+                assert node.width[level] == 0
+            else:
+                assert positions[id(following)] - positions[id(node)] == node.width[level]
+            node = following
+    # Levels above the ones in use are empty, and the top level in use is not
+    assert all(link is None for link in skip_list._head.next[skip_list._level:])
+    if skip_list._level > 1:
+        assert skip_list._head.next[skip_list._level - 1] is not None
+
+
+@pytest.mark.parametrize("cls", [IndexableSkipList, TallSkipList])
+@pytest.mark.parametrize("seed", range(4))
+def test_random_positional_operations_match_a_list(cls, seed):
+    rng = random.Random(seed)
+    random.seed(seed)
+    skip_list = cls()
+    expected = []
+    for step in range(1000):
+        choice = rng.random()
+        value = rng.randrange(20)
+        if choice < 0.35:
+            position = rng.randrange(len(expected) + 1)
+            skip_list.insert_at_position(value, position)
+            expected.insert(position, value)
+        elif choice < 0.45:
+            skip_list.insert_at_beginning(value)
+            expected.insert(0, value)
+        elif choice < 0.55:
+            skip_list.insert_at_end(value)
+            expected.append(value)
+        elif choice < 0.8 and expected:
+            position = rng.randrange(len(expected))
+            assert skip_list.delete_at_position(position) == expected.pop(position)
+        elif choice < 0.9:
+            assert skip_list.delete_by_value(value) == (value in expected)
+            if value in expected:
+                expected.remove(value)
+        elif expected:
+            position = rng.randrange(len(expected))
+            assert skip_list.get_at_position(position) == expected[position]
+            assert skip_list.search(value) == (expected.index(value) if value in expected else -1)
+        check_invariants(skip_list, expected)
+
+
+@pytest.mark.parametrize("cls", [IndexableSkipList, TallSkipList])
+def test_both_ends(cls):
+    random.seed(7)
+    skip_list = cls()
+    expected = []
+    for value in range(50):
+        # Alternate between the front and the back
+        position = 0 if value % 2 else len(expected)
+        skip_list.insert_at_position(value, position)
+        expected.insert(position, value)
+        check_invariants(skip_list, expected)
+        assert skip_list.get_at_position(0) == expected[0]
+        assert skip_list.get_at_position(len(expected) - 1) == expected[-1]
+    while expected:
+        position = 0 if len(expected) % 2 else len(expected) - 1
+        assert skip_list.delete_at_position(position) == expected.pop(position)
+        check_invariants(skip_list, expected)
+    assert skip_list._level == 1
+    assert skip_list.is_empty()
+
+
+def test_positions_out_of_range():
+    skip_list = IndexableSkipList()
+    with pytest.raises(IndexError):
+        skip_list.delete_at_position(0)
+    with pytest.raises(IndexError):
+        skip_list.get_at_position(0)
+    with pytest.raises(IndexError):
+        skip_list.insert_at_position("x", 1)
+
+    skip_list.extend([1, 2, 3])
+    for position in (-1, 3, 100):
+        with pytest.raises(IndexError):
+            skip_list.get_at_position(position)
+        with pytest.raises(IndexError):
+            skip_list.delete_at_position(position)
+    for position in (-1, 4):
+        with pytest.raises(IndexError):
+            skip_list.insert_at_position("x", position)
+    check_invariants(skip_list, [1, 2, 3])
+
+
+def test_bulk_operations_and_clear():
+    skip_list = IndexableSkipList()
+    skip_list.extend(range(5))
+    skip_list.extend_left(["b", "a"])
+    check_invariants(skip_list, ["a", "b", 0, 1, 2, 3, 4])
+    assert 3 in skip_list and "z" not in skip_list
+    skip_list.clear()
+    check_invariants(skip_list, [])
+    skip_list.insert_at_end("again")
+    check_invariants(skip_list, ["again"])
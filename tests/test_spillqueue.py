@@ -0,0 +1,60 @@
+"""
+Tests for SpillingQueue and its SpillBuffer storage engine.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import gc
+import os
+
+from spillqueue import SpillBuffer, SpillingQueue
+
+
+def test_fifo_order_across_segments(tmp_path):
+    with SpillingQueue(memory_items=8, segment_items=2, directory=str(tmp_path)) as queue:
+        queue.enqueue_many(range(50))
+        assert queue.spilled_count > 0
+        assert list(queue) == list(range(50))
+        assert list(reversed(queue)) == list(range(49, -1, -1))
+        assert queue.dequeue_many(30) == list(range(30))
+        queue.requeue_front("back")
+        assert [queue.dequeue() for _ in range(21)] == ["back"] + list(range(30, 50))
+    assert os.listdir(tmp_path) == []
+
+
+def test_front_reads_a_segment_file_once(monkeypatch):
+    reads = []
+    read_segment = SpillBuffer._read_segment
+    monkeypatch.setattr(SpillBuffer, "_read_segment",
+                        staticmethod(lambda segment: reads.append(segment) or read_segment(segment)))
+    with SpillingQueue(memory_items=4, segment_items=2) as queue:
+        queue.enqueue_many(range(20))
+        queue.dequeue_many(4)
+        assert not len(queue._items._head)
+        for _ in range(100):
+            assert queue.front() == 4
+        assert len(reads) == 1
+        # Dequeuing moves the cached segment into the head without reading it again
+        assert queue.dequeue() == 4
+        assert len(reads) == 1
+
+
+def test_unclosed_queue_removes_its_directory():
+    queue = SpillingQueue(memory_items=4, segment_items=2)
+    queue.enqueue_many(range(20))
+    directory = queue._items.directory
+    assert os.listdir(directory)
+    del queue
+    gc.collect()
+    assert not os.path.exists(directory)
+
+
+def test_unclosed_queue_removes_segments_from_a_given_directory(tmp_path):
+    queue = SpillingQueue(memory_items=4, segment_items=2, directory=str(tmp_path))
+    queue.enqueue_many(range(20))
+    assert os.listdir(tmp_path)
+    del queue
+    gc.collect()
+    assert os.listdir(tmp_path) == []
+    assert tmp_path.exists()
@@ -0,0 +1,72 @@
+"""
+Tests for Stack, TypedStack and BoundedStack.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+from deque import Deque
+from stack import BoundedStack, Stack, TypedStack
+
+
+def test_push_many_counts_elements_a_full_deque_drops():
+    stack = Stack(storage=Deque(maxlen=3))
+    assert stack.push_many([1, 2, 3]) == 3
+    assert stack.push_many([4, 5, 6, 7]) == 4
+    assert list(stack) == [5, 6, 7]
+
+
+def test_push_many_counts_list_and_array_storage():
+    assert Stack().push_many(iter([1, 2, 3])) == 3
+    typed_stack = TypedStack("d")
+    assert typed_stack.push_many(x / 2 for x in range(5)) == 5
+    assert list(typed_stack) == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+
+def test_bounded_push_many_stays_within_budget_while_iterating():
+    evicted = []
+    stack = BoundedStack(max_items=3, on_evict=evicted.append)
+    # Most elements taken from the iterable but not yet evicted
+    backlog = 0
+
+    def numbers():
+        nonlocal backlog
+        for number in range(10000):
+            backlog = max(backlog, number - len(evicted))
+            yield number
+
+    assert stack.push_many(numbers()) == 10000
+    assert backlog <= 3
+    assert list(stack) == [9997, 9998, 9999]
+    assert evicted == list(range(9997))
+    assert stack.eviction_count == 9997
+
+
+def test_bounded_push_many_keeps_byte_budget():
+    stack = BoundedStack(max_bytes=30, sizeof=lambda item: 10)
+    stack.push_many(range(8))
+    assert list(stack) == [5, 6, 7]
+    assert stack.current_bytes == 30
+
+
+def test_typed_stack_round_trip_keeps_typecode(tmp_path):
+    path = str(tmp_path / "typed.snapshot")
+    for typecode, values in (("d", [0.5, 1.25, -3.0]), ("i", [1, -2, 3]), ("d", [])):
+        stack = TypedStack(typecode)
+        stack.push_many(values)
+        stack.save(path)
+        loaded = TypedStack.load(path)
+        assert loaded.typecode == typecode
+        assert list(loaded) == values
+    # An explicit typecode still wins
+    assert TypedStack.load(path, typecode="f").typecode == "f"
+
+
+def test_list_snapshot_has_no_typecode(tmp_path):
+    path = str(tmp_path / "plain.snapshot")
+    stack = Stack()
+    stack.push_many([1, 2, 3])
+    stack.save(path)
+    loaded = TypedStack.load(path)
+    assert loaded.typecode == "q"
+    assert list(loaded) == [1, 2, 3]
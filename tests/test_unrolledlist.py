@@ -0,0 +1,162 @@
+"""
+Tests for UnrolledLinkedList: block splits and merges, checked against a plain list.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import random
+
+import pytest
+
+from unrolledlist import UnrolledLinkedList
+
+
+def blocks_of(unrolled_list):
+    """
+    Return the items of every block, head first.
+    """
+    blocks = []
+    block = unrolled_list.head
+    while block is not None:
+        blocks.append(list(block.items))
+        last = block
+        block = block.next
+    assert unrolled_list.tail is (last if blocks else None)
+    return blocks
+
+
+def check_invariants(unrolled_list, expected):
+    """
+    Assert that no block is empty or overfull and the list holds expected.
+    """
+    blocks = blocks_of(unrolled_list)
+    assert all(0 < len(items) <= unrolled_list.block_size for items in blocks)
+    assert [item for items in blocks for item in items] == list(expected)
+    assert list(unrolled_list) == list(expected)
+    assert list(reversed(unrolled_list)) == list(reversed(expected))
+    assert unrolled_list._size == len(expected) == len(unrolled_list)
+
+
+@pytest.mark.parametrize("block_size", [0, 1, -4])
+def test_block_size_below_two_is_rejected(block_size):
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(block_size=block_size)
+
+
+@pytest.mark.parametrize("block_size", [2, 3, 4, 8, 64])
+def test_random_operations_match_a_list(block_size):
+    rng = random.Random(block_size)
+    unrolled_list = UnrolledLinkedList(block_size=block_size)
+    expected = []
+    for step in range(2000):
+        choice = rng.random()
+        value = rng.randrange(30)
+        if choice < 0.3:
+            position = rng.randrange(len(expected) + 1)
+            unrolled_list.insert_at_position(value, position)
+            expected.insert(position, value)
+        elif choice < 0.38:
+            unrolled_list.insert_at_beginning(value)
+            expected.insert(0, value)
+        elif choice < 0.46:
+            unrolled_list.insert_at_end(value)
+            expected.append(value)
+        elif choice < 0.5:
+            values = [rng.randrange(30) for _ in range(rng.randrange(2 * block_size))]
+            unrolled_list.extend(values)
+            expected.extend(values)
+        elif choice < 0.53:
+            values = [rng.randrange(30) for _ in range(rng.randrange(2 * block_size))]
+            unrolled_list.extend_left(values)
+            expected[:0] = values[::-1]
+        elif choice < 0.78 and expected:
+            position = rng.randrange(len(expected))
+            assert unrolled_list.delete_at_position(position) == expected.pop(position)
+        elif choice < 0.92:
+            assert unrolled_list.delete_by_value(value) == (value in expected)
+            if value in expected:
+                expected.remove(value)
+        elif choice < 0.995:
+            assert unrolled_list.search(value) == (expected.index(value) if value in expected else -1)
+            if expected:
+                position = rng.randrange(len(expected))
+                assert unrolled_list.get_at_position(position) == expected[position]
+        else:
+            unrolled_list.clear()
+            expected.clear()
+        check_invariants(unrolled_list, expected)
+
+
+def test_overfull_block_splits_in_half():
+    unrolled_list = UnrolledLinkedList(block_size=4)
+    unrolled_list.extend([0, 1, 2, 3])
+    assert blocks_of(unrolled_list) == [[0, 1, 2, 3]]
+    unrolled_list.insert_at_position("x", 1)
+    assert blocks_of(unrolled_list) == [[0, "x"], [1, 2, 3]]
+    # Appending to a full tail opens a new block instead of splitting
+    unrolled_list.extend([4])
+    unrolled_list.insert_at_end(5)
+    assert blocks_of(unrolled_list) == [[0, "x"], [1, 2, 3, 4], [5]]
+    unrolled_list.insert_at_beginning("y")
+    assert blocks_of(unrolled_list) == [["y", 0, "x"], [1, 2, 3, 4], [5]]
+
+
+def test_sparse_block_merges_with_its_successor():
+    unrolled_list = UnrolledLinkedList(block_size=4)
+    unrolled_list.extend(range(8))
+    assert blocks_of(unrolled_list) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    unrolled_list.delete_at_position(0)
+    unrolled_list.delete_at_position(0)
+    # Down to half full: not merged yet
+    assert blocks_of(unrolled_list) == [[2, 3], [4, 5, 6, 7]]
+    unrolled_list.delete_by_value(6)
+    unrolled_list.delete_by_value(7)
+    unrolled_list.delete_by_value(2)
+    # Under half full and the pair fits in one block: merged
+    assert blocks_of(unrolled_list) == [[3, 4, 5]]
+    check_invariants(unrolled_list, [3, 4, 5])
+
+
+def test_emptied_blocks_are_unlinked():
+    unrolled_list = UnrolledLinkedList(block_size=2)
+    unrolled_list.extend(range(6))
+    assert blocks_of(unrolled_list) == [[0, 1], [2, 3], [4, 5]]
+    for value in (2, 3):
+        unrolled_list.delete_by_value(value)
+    assert blocks_of(unrolled_list) == [[0, 1], [4, 5]]
+    for value in (4, 5):
+        unrolled_list.delete_by_value(value)
+    check_invariants(unrolled_list, [0, 1])
+    unrolled_list.insert_at_end(6)
+    check_invariants(unrolled_list, [0, 1, 6])
+    for position in (0, 0, 0):
+        unrolled_list.delete_at_position(position)
+    check_invariants(unrolled_list, [])
+    assert unrolled_list.head is None
+
+
+def test_iteration_order_after_deletes():
+    unrolled_list = UnrolledLinkedList(block_size=3)
+    unrolled_list.extend(range(20))
+    expected = list(range(20))
+    for value in (0, 19, 10, 11, 12, 5, 3):
+        unrolled_list.delete_by_value(value)
+        expected.remove(value)
+        check_invariants(unrolled_list, expected)
+    assert list(unrolled_list) == [1, 2, 4, 6, 7, 8, 9, 13, 14, 15, 16, 17, 18]
+
+
+def test_positions_out_of_range():
+    unrolled_list = UnrolledLinkedList(block_size=2)
+    with pytest.raises(IndexError):
+        unrolled_list.delete_at_position(0)
+    unrolled_list.extend([1, 2, 3])
+    for position in (-1, 3):
+        with pytest.raises(IndexError):
+            unrolled_list.get_at_position(position)
+        with pytest.raises(IndexError):
+            unrolled_list.delete_at_position(position)
+    with pytest.raises(IndexError):
+        unrolled_list.insert_at_position("x", 4)
+    check_invariants(unrolled_list, [1, 2, 3])
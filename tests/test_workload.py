@@ -0,0 +1,108 @@
+"""
+Tests for the synthetic workload engine.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import contextlib
+import io
+
+import pytest
+
+import workload
+from main import DataStructureManager
+from workload import generate_tasks, load_test, percentile, run_task_stream
+
+
+def silent_manager():
+    """
+    Create a DataStructureManager without its demonstration output.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return DataStructureManager()
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile(values, 1.0) == 100
+    assert percentile(values, 0.0) == 1
+    assert percentile([7], 0.99) == 7
+    assert percentile([1, 2, 3], 0.5) == 2
+    assert percentile([], 0.5) == 0
+
+
+@pytest.mark.parametrize("option", [
+    {"tasks": -1},
+    {"arrival_rate": 0},
+    {"arrival_rate": -5.0},
+    {"undo_probability": 1.0},
+    {"undo_probability": -0.1},
+    {"lookup_probability": 1.5},
+    {"history_limit": 0},
+    {"max_undos": -1},
+])
+def test_invalid_arguments_are_rejected(option):
+    with pytest.raises(ValueError):
+        run_task_stream(silent_manager(), **{"tasks": 10, **option})
+
+
+def test_seeded_closed_loop_run_is_deterministic():
+    options = {"tasks": 2000, "undo_probability": 0.3, "lookup_probability": 0.2,
+               "history_limit": 50, "seed": 42}
+    first = run_task_stream(silent_manager(), **options)
+    second = run_task_stream(silent_manager(), **options)
+    assert first["completed"] == first["tasks"] == 2000
+    assert first["undos"] > 0 and first["lookups"] > 0
+    assert (first["undos"], first["lookups"], first["max_undos_per_task"]) == \
+        (second["undos"], second["lookups"], second["max_undos_per_task"])
+    assert first["max_backlog"] == 1
+
+    manager = silent_manager()
+    run_task_stream(manager, **options)
+    assert len(manager.linked_list) == 50
+    assert manager.queue.is_empty()
+
+
+def test_max_undos_bounds_the_retries_of_each_task():
+    report = run_task_stream(silent_manager(), tasks=200, undo_probability=0.95, seed=1, max_undos=2)
+    assert report["completed"] == 200
+    assert report["max_undos_per_task"] == 2
+    assert report["undos"] <= 400
+    unbounded = run_task_stream(silent_manager(), tasks=200, undo_probability=0.95, seed=1)
+    assert unbounded["max_undos_per_task"] > 2
+    assert run_task_stream(silent_manager(), tasks=50, undo_probability=0.5, max_undos=0)["undos"] == 0
+
+
+def test_undo_decisions_do_not_shift_arrivals(monkeypatch):
+    streams = []
+
+    def recording_generate_tasks(*args):
+        streams.append([])
+        for arrival in generate_tasks(*args):
+            streams[-1].append(arrival)
+            yield arrival
+
+    monkeypatch.setattr(workload, "generate_tasks", recording_generate_tasks)
+    for probability in (0.0, 0.5):
+        report = run_task_stream(silent_manager(), tasks=300, arrival_rate=1e6, seed=3,
+                                 undo_probability=probability, lookup_probability=probability)
+        assert report["completed"] == 300
+    assert report["undos"] > 0
+    assert streams[0] == streams[1]
+
+
+def test_generated_tasks_are_padded_and_ordered():
+    tasks = list(generate_tasks(5, arrival_rate=1000, payload_size=20))
+    assert [task for _, task in tasks] == [f"task-{number:09d}".ljust(20, ".") for number in range(5)]
+    arrivals = [arrival for arrival, _ in tasks]
+    assert arrivals == sorted(arrivals)
+    assert [arrival for arrival, _ in generate_tasks(3)] == [0, 0, 0]
+
+
+def test_load_test_runs_each_rate():
+    reports = load_test(silent_manager, rates=[None, 1e5], tasks=100, seed=0)
+    assert [report["arrival_rate"] for report in reports] == [None, 1e5]
+    assert all(report["completed"] == 100 for report in reports)
@@ -0,0 +1,559 @@
+"""
+Unrolled Linked List Data Structure Implementation
+
+This module implements an unrolled linked list: a linked list whose nodes
+(blocks) each hold a small Python list of up to K elements instead of a
+single element. Compared with LinkedList this means one node object per K
+elements instead of one per element, so memory use drops sharply, and
+scans such as search run over contiguous lists with C-level loops instead
+of chasing a pointer per element.
+
+The UnrolledLinkedList offers the full LinkedList API; K is configurable
+through the block_size argument.
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+from events import Event, PrintSink, get_default_sink
+
+
+class Block:
+    """
+    A node of the unrolled list holding up to block_size elements.
+
+    Attributes:
+        items (list): The elements stored in this block, in list order
+        next: Reference to the next block (None if last block)
+    """
+
+    __slots__ = ("items", "next")
+
+    def __init__(self, items=None):
+        """
+        Initialize an unlinked block.
+
+        Args:
+            items (list): Initial elements of the block (default: empty)
+        """
+        self.items = items if items is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    A linked list of fixed-capacity blocks with the LinkedList API.
+
+    Blocks are split in half when an insertion overflows them and merged
+    with their successor when deletions leave them less than half full, so
+    every block except possibly the last stays reasonably dense.
+
+    The UnrolledLinkedList class provides the LinkedList operations:
+    - insert_at_beginning / insert_at_end / insert_at_position
+    - extend / extend_left
+    - delete_by_value / delete_at_position
+    - get_at_position / search
+    - display / size / is_empty / clear
+
+    Positional operations cost O(n / K + K); search and membership scan
+    each block with a single C-level list lookup.
+
+    Attributes:
+        head (Block): Reference to the first block
+        tail (Block): Reference to the last block
+        block_size (int): Maximum number of elements per block (K)
+        _size (int): Internal counter for the number of elements
+        sink: Callable receiving an Event per operation (None = silent)
+    """
+
+    __slots__ = ("head", "tail", "block_size", "_size", "sink")
+
+    def __init__(self, block_size=64, sink=None):
+        """
+        Initialize an empty unrolled list.
+
+        Args:
+            block_size (int): Maximum number of elements per block (default: 64)
+            sink: Event sink for operation reports (default: the module default from events.py)
+
+        Raises:
+            ValueError: If block_size is smaller than 2
+        """
+        if block_size < 2:
+            raise ValueError(f"Block size must be at least 2, got {block_size}")
+        self.head = None
+        self.tail = None
+        self.block_size = block_size
+        self._size = 0
+        # Operation reporting is opt-in; None keeps every operation silent
+        self.sink = sink if sink is not None else get_default_sink()
+
+    def _locate(self, position):
+        """
+        Find the block holding a valid position.
+
+        Args:
+            position (int): The position to find (0 to size - 1)
+
+        Returns:
+            tuple: (previous, block, offset) where previous is the block before
+                   (None for the head) and offset is the index within block.items
+        """
+        previous = None
+        block = self.head
+        while position >= len(block.items):
+            position -= len(block.items)
+            previous = block
+            block = block.next
+        return previous, block, position
+
+    def _split(self, block):
+        """
+        Split an overfull block in half, linking the upper half in after it.
+
+        Args:
+            block (Block): The block to split
+        """
+        half = len(block.items) // 2
+        new_block = Block(block.items[half:])
+        del block.items[half:]
+        new_block.next = block.next
+        block.next = new_block
+        if block is self.tail:
+            self.tail = new_block
+
+    def _rebalance(self, previous, block):
+        """
+        Restore block density after an element was removed from block.
+
+        An empty block is unlinked; a block under half full absorbs its
+        successor if the two fit in one block.
+
+        Args:
+            previous (Block): The block before block (None if block is the head)
+            block (Block): The block that just lost an element
+        """
+        if not block.items:
+            if previous is None:
+                self.head = block.next
+            else:
+                previous.next = block.next
+            if block is self.tail:
+                self.tail = previous
+            return
+
+        following = block.next
+        if (following is not None and len(block.items) < self.block_size // 2
+                and len(block.items) + len(following.items) <= self.block_size):
+            block.items.extend(following.items)
+            block.next = following.next
+            if following is self.tail:
+                self.tail = block
+
+    def _append(self, data):
+        """
+        Add an element after the last one, opening a new block when the tail is full.
+
+        Args:
+            data: The value to be added
+        """
+        if self.tail is None:
+            self.head = self.tail = Block([data])
+        elif len(self.tail.items) >= self.block_size:
+            new_block = Block([data])
+            self.tail.next = new_block
+            self.tail = new_block
+        else:
+            self.tail.items.append(data)
+        self._size += 1
+
+    def _prepend(self, data):
+        """
+        Add an element before the first one, opening a new block when the head is full.
+
+        Args:
+            data: The value to be added
+        """
+        if self.head is None:
+            self.head = self.tail = Block([data])
+        elif len(self.head.items) >= self.block_size:
+            new_block = Block([data])
+            new_block.next = self.head
+            self.head = new_block
+        else:
+            self.head.items.insert(0, data)
+        self._size += 1
+
+    def insert_at_beginning(self, data):
+        """
+        Insert a new element at the beginning of the list.
+
+        Args:
+            data: The value to be inserted
+
+        Returns:
+            None
+        """
+        self._prepend(data)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_beginning", f"Inserted '{data}' at the beginning of the list", data))
+
+    def insert_at_end(self, data):
+        """
+        Insert a new element at the end of the list in O(1).
+
+        Args:
+            data: The value to be inserted
+
+        Returns:
+            None
+        """
+        self._append(data)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_end", f"Inserted '{data}' at the end of the list", data))
+
+    def insert_at_position(self, data, position):
+        """
+        Insert a new element at a specific position in the list.
+
+        Args:
+            data: The value to be inserted
+            position (int): The position where to insert (0-indexed)
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: If position is negative or greater than list size
+        """
+        # Validate position
+        if position < 0 or position > self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        if position == self._size:
+            self._append(data)
+        else:
+            _, block, offset = self._locate(position)
+            block.items.insert(offset, data)
+            if len(block.items) > self.block_size:
+                self._split(block)
+            self._size += 1
+
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "insert_at_position", f"Inserted '{data}' at position {position}", data))
+
+    def extend(self, iterable):
+        """
+        Insert every element of an iterable at the end of the list.
+
+        The tail block is topped up and the rest is cut into full blocks
+        with list slices, one event is reported for the whole batch.
+
+        Args:
+            iterable: The values to be inserted, in order
+
+        Returns:
+            int: Number of values inserted
+        """
+        values = iterable if isinstance(iterable, list) else list(iterable)
+        added_count = len(values)
+        start = 0
+        if self.tail is not None:
+            start = min(self.block_size - len(self.tail.items), added_count)
+            self.tail.items.extend(values[:start])
+        for chunk_start in range(start, added_count, self.block_size):
+            new_block = Block(values[chunk_start:chunk_start + self.block_size])
+            if self.tail is None:
+                self.head = new_block
+            else:
+                self.tail.next = new_block
+            self.tail = new_block
+        self._size += added_count
+
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend",
+                            f"Inserted {added_count} items at the end of the list", added_count))
+        return added_count
+
+    def extend_left(self, iterable):
+        """
+        Insert every element of an iterable at the beginning of the list.
+
+        Like collections.deque.extendleft(), the values end up in reverse
+        order. They are cut into full blocks linked in front of the head.
+
+        Args:
+            iterable: The values to be inserted
+
+        Returns:
+            int: Number of values inserted
+        """
+        values = list(iterable)
+        values.reverse()
+        added_count = len(values)
+        # Link blocks in from the last chunk backwards so each becomes the new head
+        for chunk_start in range((added_count - 1) // self.block_size * self.block_size,
+                                 -1, -self.block_size):
+            new_block = Block(values[chunk_start:chunk_start + self.block_size])
+            new_block.next = self.head
+            self.head = new_block
+            if self.tail is None:
+                self.tail = new_block
+        self._size += added_count
+
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "extend_left",
+                            f"Inserted {added_count} items at the beginning of the list",
+                            added_count))
+        return added_count
+
+    def _find(self, data):
+        """
+        Locate the first element equal to data, scanning block by block.
+
+        Args:
+            data: The value to look for
+
+        Returns:
+            tuple: (previous, block, offset, position), or None if not found
+        """
+        previous = None
+        block = self.head
+        position = 0
+        while block is not None:
+            # `in` and index() scan the block's list in C
+            if data in block.items:
+                offset = block.items.index(data)
+                return previous, block, offset, position + offset
+            position += len(block.items)
+            previous = block
+            block = block.next
+        return None
+
+    def delete_by_value(self, data):
+        """
+        Delete the first occurrence of an element with the given value.
+
+        Args:
+            data: The value to be deleted
+
+        Returns:
+            bool: True if deletion was successful, False if value not found
+        """
+        # Check if list is empty
+        if self._size == 0:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Cannot delete '{data}': List is empty", data))
+            return False
+
+        found = self._find(data)
+        if found is None:
+            if self.sink is not None:
+                self.sink(Event(type(self).__name__, "delete_by_value", f"Value '{data}' not found in the list", data))
+            return False
+
+        previous, block, offset, _ = found
+        del block.items[offset]
+        self._size -= 1
+        self._rebalance(previous, block)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_by_value", f"Deleted '{data}' from the list", data))
+        return True
+
+    def delete_at_position(self, position):
+        """
+        Delete the element at a specific position in the list.
+
+        Args:
+            position (int): The position of the element to delete (0-indexed)
+
+        Returns:
+            The data of the deleted element
+
+        Raises:
+            IndexError: If position is invalid or list is empty
+        """
+        # Check if list is empty
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+
+        # Validate position
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        previous, block, offset = self._locate(position)
+        deleted_data = block.items.pop(offset)
+        self._size -= 1
+        self._rebalance(previous, block)
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "delete_at_position", f"Deleted '{deleted_data}' from position {position}", deleted_data))
+        return deleted_data
+
+    def search(self, data):
+        """
+        Search for a value in the list.
+
+        Args:
+            data: The value to search for
+
+        Returns:
+            int: The position of the first occurrence (0-indexed), or -1 if not found
+        """
+        found = self._find(data)
+        position = -1 if found is None else found[3]
+        if self.sink is not None:
+            if position == -1:
+                self.sink(Event(type(self).__name__, "search", f"Value '{data}' not found in the list", -1))
+            else:
+                self.sink(Event(type(self).__name__, "search", f"Found '{data}' at position {position}", position))
+        return position
+
+    def get_at_position(self, position):
+        """
+        Get the data at a specific position without removing it.
+
+        Whole blocks are skipped using their lengths.
+
+        Args:
+            position (int): The position to access (0-indexed)
+
+        Returns:
+            The data at the specified position
+
+        Raises:
+            IndexError: If position is invalid
+        """
+        # Validate position
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position {position} is out of bounds for list of size {self._size}")
+
+        _, block, offset = self._locate(position)
+        data = block.items[offset]
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "get_at_position", f"Element at position {position}: {data}", data))
+        return data
+
+    def display(self):
+        """
+        Display the current contents of the list, block by block.
+
+        Returns:
+            None
+        """
+        if self.head is None:
+            print("Unrolled Linked List is empty: []")
+            return
+
+        blocks = []
+        block = self.head
+        while block is not None:
+            blocks.append(f"[{', '.join(str(data) for data in block.items)}]")
+            block = block.next
+        print(f"Unrolled Linked List: {' -> '.join(blocks)} -> None")
+        print(f"Head: {self.head.items[0]}, Block size: {self.block_size}")
+
+    def size(self):
+        """
+        Get the number of elements in the list.
+
+        Returns:
+            int: Number of elements in the list
+        """
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "size", f"Unrolled Linked List size: {self._size}", self._size))
+        return self._size
+
+    def is_empty(self):
+        """
+        Check if the list is empty.
+
+        Returns:
+            bool: True if list is empty, False otherwise
+        """
+        return self._size == 0
+
+    def clear(self):
+        """
+        Remove all elements from the list.
+
+        Returns:
+            None
+        """
+        self.head = None
+        self.tail = None
+        self._size = 0
+        if self.sink is not None:
+            self.sink(Event(type(self).__name__, "clear", "Unrolled Linked List has been cleared", None))
+
+    def __len__(self):
+        """
+        Return the number of elements, enabling len(unrolled_list).
+
+        Returns:
+            int: Number of elements in the list
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Iterate over the values in order, one block at a time.
+
+        Yields:
+            Each stored value in list order
+        """
+        block = self.head
+        while block is not None:
+            yield from block.items
+            block = block.next
+
+    def __reversed__(self):
+        """
+        Iterate over the values from last to first (over an O(n) snapshot).
+
+        Returns:
+            iterator: Reverse iterator over the list values
+        """
+        return reversed(list(self))
+
+    def __contains__(self, data):
+        """
+        Check whether a value is in the list, enabling `data in unrolled_list`.
+
+        Args:
+            data: The value to look for
+
+        Returns:
+            bool: True if an element holds an equal value
+        """
+        block = self.head
+        while block is not None:
+            if data in block.items:
+                return True
+            block = block.next
+        return False
+
+
+# Example usage and testing (only runs when script is executed directly)
+if __name__ == "__main__":
+    print("=== Unrolled Linked List Demo ===")
+
+    # A tiny block size makes the blocks visible in the display
+    unrolled_list = UnrolledLinkedList(block_size=4, sink=PrintSink())
+
+    print("\n1. Testing insertion operations:")
+    unrolled_list.extend(["A", "B", "C", "D", "E", "F"])
+    unrolled_list.insert_at_position("X", 2)
+    unrolled_list.insert_at_beginning("Start")
+    unrolled_list.display()
+
+    print("\n2. Testing search and access operations:")
+    unrolled_list.search("E")
+    unrolled_list.get_at_position(4)
+
+    print("\n3. Testing deletion operations:")
+    unrolled_list.delete_by_value("X")
+    unrolled_list.delete_at_position(0)
+    unrolled_list.display()
+    unrolled_list.size()
+
+    print("\n=== Unrolled Linked List Demo Complete ===")
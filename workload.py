@@ -0,0 +1,276 @@
+"""
+Synthetic Workload Engine for the Task Processing System
+
+The manager scenarios push a handful of hardcoded tasks through the
+structures. This module generates task streams of any size and runs them
+through the same pipeline as the integration scenario:
+
+    arrive -> task queue -> processed -> undo stack + history list
+                  ^                          |
+                  +---- undo (requeue) ------+
+
+A workload is configured with the number of tasks, an arrival rate
+(Poisson arrivals, or closed loop when the rate is None), the payload
+size of each task, the probability that a processed task is undone and
+requeued (optionally with a cap on the undos per task), and the
+probability that processing also looks up an earlier task in the
+history. Arrivals and the undo/lookup decisions come from two random
+streams derived from one seed, so changing a probability does not change
+the arrival times.
+
+Latencies are measured on a virtual clock so the run does not have to
+sleep between arrivals. Arrivals are stamped with virtual times. Each
+enqueue and each processing step is timed for real with perf_counter_ns
+and moves the clock forward by that amount. When the queue is empty, the
+clock jumps to the next arrival. A task's latency runs from its arrival
+to the end of the processing step that finally completes it. This
+includes the time it waited in the queue and any undo-and-reprocess
+rounds.
+
+    manager = DataStructureManager()
+    report = manager.run_workload(tasks=100_000, arrival_rate=50_000, undo_probability=0.05)
+    print(format_reports([report]))
+
+Author: Educational Python Project
+Date: October 16, 2026
+"""
+
+import math
+import random
+import time
+
+
+def generate_tasks(count, arrival_rate=None, payload_size=64, rng=None):
+    """
+    Generate a synthetic task stream.
+
+    Each task is a string naming the task, padded to payload_size
+    characters, so tasks stay distinct and hashable for history lookups.
+    Inter-arrival gaps are exponential (a Poisson process) with mean
+    1 / arrival_rate.
+
+    Args:
+        count (int): Number of tasks
+        arrival_rate (float): Tasks per second, or None for all at time 0
+        payload_size (int): Characters per task; names are never truncated (default: 64)
+        rng (random.Random): Source of randomness (default: a new unseeded one)
+
+    Yields:
+        tuple: (arrival time in nanoseconds, task)
+    """
+    rng = rng if rng is not None else random.Random()
+    arrival = 0
+    for number in range(count):
+        if arrival_rate is not None:
+            arrival += int(rng.expovariate(arrival_rate) * 1e9)
+        yield arrival, f"task-{number:09d}".ljust(payload_size, ".")
+
+
+def percentile(sorted_values, fraction):
+    """
+    Return the nearest-rank percentile of sorted values.
+
+    Args:
+        sorted_values (list): Values in ascending order
+        fraction (float): Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        The percentile value (0 if there are no values)
+    """
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_task_stream(manager, tasks=100_000, arrival_rate=None, payload_size=64,
+                    undo_probability=0.0, lookup_probability=0.0, history_limit=1000, seed=0,
+                    max_undos=None):
+    """
+    Run a synthetic task stream through a manager's queue, undo stack and history.
+
+    The manager's three structures are cleared first. Processing a task
+    dequeues it, pushes it on the undo stack and appends it to the
+    history. With lookup_probability, the step also searches the history
+    for a recently completed task. With undo_probability, the task is
+    popped from the undo stack again and requeued at the front, so it is
+    processed again next. Without max_undos the number of undos of one
+    task is unbounded: it is geometric with mean p / (1 - p), so an
+    undo_probability near 1 keeps the same task cycling for a long time.
+    The history is capped at history_limit entries by dropping the oldest.
+
+    Args:
+        manager: A DataStructureManager (preferably silent, i.e. without a sink)
+        tasks (int): Number of tasks to generate (default: 100000)
+        arrival_rate (float): Tasks per second; None runs closed loop, with the
+                              next task arriving when the queue runs empty (default: None)
+        payload_size (int): Characters per task (default: 64)
+        undo_probability (float): Chance that a processed task is undone, 0 <= p < 1 (default: 0)
+        lookup_probability (float): Chance that processing searches the history (default: 0)
+        history_limit (int): Most entries kept in the history list (default: 1000)
+        seed: Seed for the arrivals and the undo and lookup decisions (default: 0)
+        max_undos (int): Most times one task is undone before it completes (default: None, unbounded)
+
+    Returns:
+        dict: Counts, the most undos of a single task, virtual and wall time,
+              throughput (completed tasks per virtual second), utilization,
+              the largest queue backlog and latency mean/p50/p99/max in microseconds
+
+    Raises:
+        ValueError: If a count, rate or probability is out of range
+    """
+    if tasks < 0:
+        raise ValueError(f"tasks must be non-negative, got {tasks}")
+    if arrival_rate is not None and arrival_rate <= 0:
+        raise ValueError(f"arrival_rate must be positive or None, got {arrival_rate}")
+    if not 0 <= undo_probability < 1:
+        raise ValueError(f"undo_probability must be in [0, 1), got {undo_probability}")
+    if not 0 <= lookup_probability <= 1:
+        raise ValueError(f"lookup_probability must be in [0, 1], got {lookup_probability}")
+    if history_limit < 1:
+        raise ValueError(f"history_limit must be at least 1, got {history_limit}")
+    if max_undos is not None and max_undos < 0:
+        raise ValueError(f"max_undos must be non-negative or None, got {max_undos}")
+
+    stack, queue, history = manager.stack, manager.queue, manager.linked_list
+    stack.clear()
+    queue.clear()
+    history.clear()
+
+    arrival_rng = random.Random(seed)
+    # A separate stream, so the decisions never shift the arrival times
+    rng = random.Random(arrival_rng.getrandbits(64))
+    perf_counter_ns = time.perf_counter_ns
+    closed_loop = arrival_rate is None
+    arrivals = generate_tasks(tasks, arrival_rate, payload_size, arrival_rng)
+    pending = next(arrivals, None)
+
+    arrival_times = {}
+    # Undos so far of each task still in flight
+    undo_counts = {}
+    completed = []
+    latencies = []
+    undos = lookups = backlog = most_undos = 0
+    clock = busy = 0
+    wall_start = perf_counter_ns()
+
+    while True:
+        # Admit the arrivals that have happened by now
+        if not len(queue):
+            if pending is None:
+                break
+            if closed_loop:
+                pending = (clock, pending[1])
+            clock = max(clock, pending[0])
+        while pending is not None and pending[0] <= clock and not (closed_loop and len(queue)):
+            arrival, task = pending
+            start = perf_counter_ns()
+            queue.enqueue(task)
+            elapsed = perf_counter_ns() - start
+            clock += elapsed
+            busy += elapsed
+            arrival_times[task] = arrival
+            pending = next(arrivals, None)
+        backlog = max(backlog, len(queue))
+
+        # Decide outside the timed region so the random draws are not measured
+        undo = undo_probability > 0 and rng.random() < undo_probability
+        if undo and max_undos is not None and undo_counts.get(queue.front(), 0) >= max_undos:
+            undo = False
+        lookup = None
+        if completed and lookup_probability and rng.random() < lookup_probability:
+            lookup = completed[rng.randrange(max(0, len(completed) - history_limit), len(completed))]
+
+        start = perf_counter_ns()
+        task = queue.dequeue()
+        stack.push(task)
+        history.insert_at_end(task)
+        if len(history) > history_limit:
+            history.delete_at_position(0)
+        if lookup is not None:
+            history.search(lookup)
+        if undo:
+            queue.requeue_front(stack.pop())
+        elapsed = perf_counter_ns() - start
+        clock += elapsed
+        busy += elapsed
+
+        if lookup is not None:
+            lookups += 1
+        if undo:
+            undos += 1
+            undo_counts[task] = task_undos = undo_counts.get(task, 0) + 1
+            most_undos = max(most_undos, task_undos)
+        else:
+            undo_counts.pop(task, None)
+            latencies.append(clock - arrival_times.pop(task))
+            completed.append(task)
+
+    wall_seconds = (perf_counter_ns() - wall_start) / 1e9
+    latencies.sort()
+    return {
+        "tasks": tasks,
+        "arrival_rate": arrival_rate,
+        "completed": len(latencies),
+        "undos": undos,
+        "max_undos_per_task": most_undos,
+        "lookups": lookups,
+        "virtual_seconds": clock / 1e9,
+        "wall_seconds": wall_seconds,
+        "throughput": len(latencies) / (clock / 1e9) if clock else 0.0,
+        "utilization": busy / clock if clock else 0.0,
+        "max_backlog": backlog,
+        "latency_us": {
+            "mean": sum(latencies) / len(latencies) / 1e3 if latencies else 0.0,
+            "p50": percentile(latencies, 0.50) / 1e3,
+            "p99": percentile(latencies, 0.99) / 1e3,
+            "max": latencies[-1] / 1e3 if latencies else 0.0,
+        },
+    }
+
+
+def format_reports(reports):
+    """
+    Format workload reports as a table, one row per run.
+
+    Args:
+        reports: Iterable of dicts returned by run_task_stream()
+
+    Returns:
+        str: The table
+    """
+    lines = [f"{'rate/s':>12} {'completed':>10} {'tasks/s':>12} {'util':>6} {'backlog':>8} "
+             f"{'p50 us':>9} {'p99 us':>9} {'max us':>10}"]
+    for report in reports:
+        rate = "closed" if report["arrival_rate"] is None else f"{report['arrival_rate']:,.0f}"
+        latency = report["latency_us"]
+        lines.append(f"{rate:>12} {report['completed']:>10} {report['throughput']:>12,.0f} "
+                     f"{report['utilization']:>6.0%} {report['max_backlog']:>8} "
+                     f"{latency['p50']:>9.1f} {latency['p99']:>9.1f} {latency['max']:>10.1f}")
+    return "\n".join(lines)
+
+
+def load_test(manager_factory, rates=None, **options):
+    """
+    Run a workload at several arrival rates, each on a fresh manager.
+
+    Without explicit rates, a closed-loop run first measures the pipeline's
+    capacity, and the workload is then offered at 50%, 80% and 95% of it.
+
+    Args:
+        manager_factory: Callable returning a silent DataStructureManager
+        rates: Arrival rates in tasks per second (None entries run closed loop)
+        **options: Further run_task_stream() arguments (tasks, payload_size, ...)
+
+    Returns:
+        list: One report per run
+    """
+    if rates is None:
+        reports = [run_task_stream(manager_factory(), arrival_rate=None, **options)]
+        capacity = reports[0]["throughput"]
+        rates = [capacity * load for load in (0.5, 0.8, 0.95)]
+    else:
+        reports = []
+    for rate in rates:
+        reports.append(run_task_stream(manager_factory(), arrival_rate=rate, **options))
+    return reports